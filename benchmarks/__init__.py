@@ -0,0 +1,16 @@
+# encoding: utf-8
+"""
+Benchmarks of the madmom package.
+
+The benchmarks follow the conventions of airspeed velocity (asv): each
+`bench_*` module contains classes with a `setup()` method and `time_*` (timed)
+and `peakmem_*` (peak memory) methods, parametrised by the duration of the
+synthetic audio given by the `params` attribute.
+
+They can be run with asv (see `asv.conf.json`) or locally without any
+additional dependency::
+
+    python -m benchmarks.run --save results.json
+    python -m benchmarks.run --compare results.json
+
+"""
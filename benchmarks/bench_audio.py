@@ -0,0 +1,101 @@
+# encoding: utf-8
+"""
+Benchmarks of the audio processing (STFT, spectrograms, comb filters).
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+from madmom.audio.comb_filters import (CombFilterbankProcessor,
+                                       feed_backward_comb_filter)
+from madmom.audio.signal import FramedSignal
+from madmom.audio.spectrogram import (FilteredSpectrogram, Spectrogram,
+                                      SpectrogramDifference)
+from madmom.audio.stft import ShortTimeFourierTransform, stft
+
+from .fixtures import DURATIONS, FPS, mixture
+
+
+class STFT(object):
+    """Short-time Fourier transform of the framed signal."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.frames = FramedSignal(mixture(duration), frame_size=2048,
+                                   fps=FPS)
+        self.window = np.hanning(2048).astype(np.float32)
+
+    def time_stft(self, duration):
+        stft(self.frames, self.window)
+
+    def peakmem_stft(self, duration):
+        stft(self.frames, self.window)
+
+    def time_stft_circular_shift(self, duration):
+        stft(self.frames, self.window, circular_shift=True)
+
+    def time_stft_class(self, duration):
+        ShortTimeFourierTransform(self.frames)
+
+
+class FilteredSpec(object):
+    """Filtered (logarithmically spaced) magnitude spectrogram."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.stft = ShortTimeFourierTransform(
+            FramedSignal(mixture(duration), frame_size=2048, fps=FPS))
+        self.spec = Spectrogram(self.stft)
+
+    def time_spectrogram(self, duration):
+        Spectrogram(self.stft)
+
+    def time_filtered_spectrogram(self, duration):
+        FilteredSpectrogram(self.spec, num_bands=12)
+
+    def peakmem_filtered_spectrogram(self, duration):
+        FilteredSpectrogram(self.spec, num_bands=12)
+
+
+class SpecDifference(object):
+    """Spectrogram difference (e.g. used by SuperFlux)."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.spec = FilteredSpectrogram(
+            mixture(duration), frame_size=2048, fps=FPS, num_bands=24)
+
+    def time_difference(self, duration):
+        SpectrogramDifference(self.spec, positive_diffs=True)
+
+    def time_difference_max_bins(self, duration):
+        SpectrogramDifference(self.spec, diff_max_bins=3,
+                              positive_diffs=True)
+
+    def peakmem_difference_max_bins(self, duration):
+        SpectrogramDifference(self.spec, diff_max_bins=3,
+                              positive_diffs=True)
+
+
+class CombFilterbank(object):
+    """Comb filterbank as used by the tempo estimation."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        rng = np.random.RandomState(1234)
+        self.activations = rng.rand(int(duration * FPS)).astype(np.float)
+        self.processor = CombFilterbankProcessor(feed_backward_comb_filter,
+                                                 tau=np.arange(20, 100),
+                                                 alpha=0.79)
+
+    def time_comb_filterbank(self, duration):
+        self.processor.process(self.activations)
+
+    def peakmem_comb_filterbank(self, duration):
+        self.processor.process(self.activations)
@@ -0,0 +1,114 @@
+# encoding: utf-8
+"""
+Benchmarks of the evaluation metrics.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+from madmom.evaluation.alignment import AlignmentEvaluation
+from madmom.evaluation.beats import (BeatEvaluation, cemgil, cml, continuity,
+                                     goto, information_gain, pscore)
+from madmom.evaluation.notes import NoteEvaluation
+from madmom.evaluation.onsets import OnsetEvaluation
+from madmom.evaluation.tempo import tempo_evaluation
+
+from .fixtures import DURATIONS, beat_times, detections, notes
+
+
+class OnsetMetrics(object):
+    """Onset evaluation."""
+    # use longer durations to get a reasonable number of events
+    params = [10 * d for d in DURATIONS]
+    param_names = ['duration']
+
+    def setup(self, duration):
+        # onsets every 8th note
+        self.annotations = np.arange(0.25, duration, 0.25)
+        self.detections = detections(self.annotations)
+
+    def time_onset_evaluation(self, duration):
+        OnsetEvaluation(self.detections, self.annotations)
+
+    def peakmem_onset_evaluation(self, duration):
+        OnsetEvaluation(self.detections, self.annotations)
+
+
+class NoteMetrics(object):
+    """Note evaluation."""
+    params = [10 * d for d in DURATIONS]
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.annotations = notes(duration)
+        self.detections = detections(self.annotations)
+
+    def time_note_evaluation(self, duration):
+        NoteEvaluation(self.detections, self.annotations)
+
+
+class BeatMetrics(object):
+    """Beat evaluation metrics."""
+    params = [10 * d for d in DURATIONS]
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.annotations = beat_times(duration)
+        self.detections = detections(self.annotations)
+
+    def time_beat_evaluation(self, duration):
+        BeatEvaluation(self.detections, self.annotations)
+
+    def peakmem_beat_evaluation(self, duration):
+        BeatEvaluation(self.detections, self.annotations)
+
+    def time_pscore(self, duration):
+        pscore(self.detections, self.annotations)
+
+    def time_cemgil(self, duration):
+        cemgil(self.detections, self.annotations)
+
+    def time_goto(self, duration):
+        goto(self.detections, self.annotations)
+
+    def time_cml(self, duration):
+        cml(self.detections, self.annotations)
+
+    def time_continuity(self, duration):
+        continuity(self.detections, self.annotations)
+
+    def time_information_gain(self, duration):
+        information_gain(self.detections, self.annotations)
+
+
+class AlignmentMetrics(object):
+    """Alignment evaluation."""
+    params = [10 * d for d in DURATIONS]
+    param_names = ['duration']
+
+    def setup(self, duration):
+        # ground truth: score (beat) position of every beat
+        beats = beat_times(duration)
+        self.ground_truth = np.column_stack((beats, np.arange(len(beats))))
+        # alignment: score position reported at a constant rate
+        rng = np.random.RandomState(1234)
+        times = np.arange(0, duration, 0.01)
+        positions = np.interp(times, beats, np.arange(len(beats)))
+        positions += rng.randn(len(times)) * 0.05
+        self.alignment = np.column_stack((times, positions))
+
+    def time_alignment_evaluation(self, duration):
+        AlignmentEvaluation(self.alignment, self.ground_truth)
+
+
+class TempoMetrics(object):
+    """Tempo evaluation."""
+
+    def setup(self):
+        self.annotations = np.asarray([[120, 0.7], [60, 0.3]])
+        self.detections = np.asarray([[118, 0.6], [59, 0.4]])
+
+    def time_tempo_evaluation(self):
+        tempo_evaluation(self.detections, self.annotations)
@@ -0,0 +1,37 @@
+# encoding: utf-8
+"""
+Benchmarks of the feature extraction (peak picking).
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from madmom.features.onsets import OnsetPeakPickingProcessor, peak_picking
+
+from .fixtures import DURATIONS, FPS, activations
+
+
+class PeakPicking(object):
+    """Peak picking of onset/beat activation functions."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.activations = activations(duration)
+        self.processor = OnsetPeakPickingProcessor(
+            threshold=0.5, pre_max=0.03, post_max=0.03, pre_avg=0.1,
+            combine=0.03, fps=FPS)
+
+    def time_peak_picking(self, duration):
+        peak_picking(self.activations, 0.5, pre_max=3, post_max=3)
+
+    def time_peak_picking_smooth_avg(self, duration):
+        peak_picking(self.activations, 0.5, smooth=5, pre_avg=10,
+                     post_avg=10, pre_max=3, post_max=3)
+
+    def peakmem_peak_picking_smooth_avg(self, duration):
+        peak_picking(self.activations, 0.5, smooth=5, pre_avg=10,
+                     post_avg=10, pre_max=3, post_max=3)
+
+    def time_onset_peak_picking_processor(self, duration):
+        self.processor.process(self.activations)
@@ -0,0 +1,171 @@
+# encoding: utf-8
+"""
+Benchmarks of the machine learning modules (neural network layers, HMMs and
+CRFs).
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+from madmom.features.beats_crf import best_sequence
+from madmom.features.beats_hmm import (BeatStateSpace, BeatTransitionModel,
+                                       RNNBeatTrackingObservationModel)
+from madmom.ml.crf import ConditionalRandomField
+from madmom.ml.hmm import HiddenMarkovModel
+from madmom.ml.nn.activations import sigmoid, tanh
+from madmom.ml.nn.layers import (BatchNormLayer, BidirectionalLayer, Cell,
+                                 ConvolutionalLayer, FeedForwardLayer, Gate,
+                                 GRUCell, GRULayer, LSTMLayer, MaxPoolLayer,
+                                 RecurrentLayer, StrideLayer, NN_DTYPE)
+
+from .fixtures import DURATIONS, FPS, activations
+
+NUM_INPUTS = 120
+NUM_HIDDENS = 25
+
+
+def _weights(rng, *shape):
+    """Random weights."""
+    return (rng.randn(*shape) * 0.1).astype(NN_DTYPE)
+
+
+def _gate(rng, peephole=True, cls=Gate):
+    """Random gate (or cell)."""
+    args = (_weights(rng, NUM_INPUTS, NUM_HIDDENS), _weights(rng, NUM_HIDDENS),
+            _weights(rng, NUM_HIDDENS, NUM_HIDDENS))
+    if cls is Gate and peephole:
+        return cls(*args, peephole_weights=_weights(rng, NUM_HIDDENS))
+    return cls(*args)
+
+
+def _lstm(rng):
+    """Random LSTM layer."""
+    return LSTMLayer(_gate(rng), _gate(rng), _gate(rng, cls=Cell),
+                     _gate(rng))
+
+
+def _gru(rng):
+    """Random GRU layer."""
+    return GRULayer(_gate(rng, False), _gate(rng, False),
+                    _gate(rng, cls=GRUCell))
+
+
+class NeuralNetworkLayers(object):
+    """Activation of the neural network layer types."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        rng = np.random.RandomState(1234)
+        num_frames = int(duration * FPS)
+        self.data = rng.rand(num_frames, NUM_INPUTS).astype(NN_DTYPE)
+        self.feed_forward = FeedForwardLayer(
+            _weights(rng, NUM_INPUTS, NUM_HIDDENS), _weights(rng, NUM_HIDDENS),
+            sigmoid)
+        self.recurrent = RecurrentLayer(
+            _weights(rng, NUM_INPUTS, NUM_HIDDENS), _weights(rng, NUM_HIDDENS),
+            _weights(rng, NUM_HIDDENS, NUM_HIDDENS), tanh)
+        self.lstm = _lstm(rng)
+        self.gru = _gru(rng)
+        self.bidirectional = BidirectionalLayer(_lstm(rng), _lstm(rng))
+        # convolutional layers work on spectrogram like data
+        self.spec = rng.rand(num_frames, 80, 1).astype(NN_DTYPE)
+        self.conv = ConvolutionalLayer(_weights(rng, 1, 10, 3, 3),
+                                       _weights(rng, 10))
+        self.feature_maps = rng.rand(num_frames, 78, 10).astype(NN_DTYPE)
+        self.max_pool = MaxPoolLayer((1, 3))
+        self.stride = StrideLayer(15)
+        self.batch_norm = BatchNormLayer(
+            _weights(rng, 10), 1 + _weights(rng, 10), _weights(rng, 10),
+            1 + _weights(rng, 10), tanh)
+
+    def time_feed_forward(self, duration):
+        self.feed_forward.activate(self.data)
+
+    def time_recurrent(self, duration):
+        self.recurrent.activate(self.data)
+
+    def time_lstm(self, duration):
+        self.lstm.activate(self.data)
+
+    def peakmem_lstm(self, duration):
+        self.lstm.activate(self.data)
+
+    def time_gru(self, duration):
+        self.gru.activate(self.data)
+
+    def time_bidirectional(self, duration):
+        self.bidirectional.activate(self.data)
+
+    def time_convolutional(self, duration):
+        self.conv.activate(self.spec)
+
+    def peakmem_convolutional(self, duration):
+        self.conv.activate(self.spec)
+
+    def time_max_pool(self, duration):
+        self.max_pool.activate(self.feature_maps)
+
+    def time_stride(self, duration):
+        self.stride.activate(self.data)
+
+    def time_batch_norm(self, duration):
+        self.batch_norm.activate(self.feature_maps)
+
+
+class HMM(object):
+    """Viterbi decoding and forward algorithm of a beat tracking HMM."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        # beat intervals between 55 and 215 bpm
+        state_space = BeatStateSpace(int(60. * FPS / 215),
+                                     int(60. * FPS / 55))
+        transition_model = BeatTransitionModel(state_space, 100)
+        observation_model = RNNBeatTrackingObservationModel(state_space, 16)
+        self.hmm = HiddenMarkovModel(transition_model, observation_model)
+        self.activations = activations(duration)
+
+    def time_viterbi(self, duration):
+        self.hmm.viterbi(self.activations)
+
+    def peakmem_viterbi(self, duration):
+        self.hmm.viterbi(self.activations)
+
+    def time_forward(self, duration):
+        self.hmm.forward(self.activations)
+
+    def peakmem_forward(self, duration):
+        self.hmm.forward(self.activations)
+
+
+class CRF(object):
+    """Viterbi decoding of conditional random fields."""
+    params = DURATIONS
+    param_names = ['duration']
+
+    def setup(self, duration):
+        rng = np.random.RandomState(1234)
+        num_states, num_features = 24, 100
+        self.crf = ConditionalRandomField(
+            rng.randn(num_states), rng.randn(num_states),
+            rng.randn(num_states), rng.randn(num_states, num_states),
+            rng.randn(num_features, num_states))
+        self.observations = rng.rand(int(duration * FPS), num_features)
+        self.activations = activations(duration)
+
+    def time_crf(self, duration):
+        self.crf.process(self.observations)
+
+    def peakmem_crf(self, duration):
+        self.crf.process(self.observations)
+
+    def time_beat_crf(self, duration):
+        # beat interval of 120 bpm
+        best_sequence(self.activations, 50, 0.18)
+
+    def peakmem_beat_crf(self, duration):
+        best_sequence(self.activations, 50, 0.18)
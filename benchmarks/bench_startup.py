@@ -0,0 +1,51 @@
+# encoding: utf-8
+"""
+Benchmarks of the startup time (imports and programs).
+
+Every benchmark starts a new Python interpreter, since modules imported
+already would not be imported again.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import subprocess
+import sys
+
+BIN_PATH = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'bin')
+
+
+def _run(*args):
+    """Run the arguments with a new Python interpreter."""
+    with open(os.devnull, 'w') as devnull:
+        subprocess.check_call((sys.executable, ) + args, stdout=devnull)
+
+
+class Startup(object):
+    """Startup time of the interpreter, imports and programs."""
+
+    def time_interpreter(self):
+        _run('-c', 'pass')
+
+    def time_import_madmom(self):
+        _run('-c', 'import madmom')
+
+    def time_version(self):
+        _run('-c', 'import madmom; madmom.__version__')
+
+    def time_import_processors(self):
+        _run('-c', 'import madmom.processors')
+
+    def time_import_features(self):
+        _run('-c', 'import madmom.features')
+
+    def time_import_evaluation(self):
+        _run('-c', 'import madmom.evaluation')
+
+    def time_onset_detector(self):
+        _run(os.path.join(BIN_PATH, 'OnsetDetector'), '-h')
+
+    def time_evaluate(self):
+        _run(os.path.join(BIN_PATH, 'evaluate'), '-h')
@@ -0,0 +1,37 @@
+# encoding: utf-8
+"""
+Benchmarks of the utilities (MIDI file handling).
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from madmom.utils.midi import MIDIFile
+
+from .fixtures import DURATIONS, midi_file, notes
+
+
+class MIDI(object):
+    """Parsing and writing of MIDI files."""
+    # MIDI files are small, thus use longer durations
+    params = [10 * d for d in DURATIONS]
+    param_names = ['duration']
+
+    def setup(self, duration):
+        self.midi_file = midi_file(duration)
+        self.notes = notes(duration)
+
+    def time_parse(self, duration):
+        MIDIFile.from_file(self.midi_file)
+
+    def time_notes(self, duration):
+        MIDIFile.from_file(self.midi_file).notes()
+
+    def peakmem_notes(self, duration):
+        MIDIFile.from_file(self.midi_file).notes()
+
+    def time_events(self, duration):
+        MIDIFile.from_file(self.midi_file).tracks[0].events
+
+    def time_from_notes(self, duration):
+        MIDIFile.from_notes(self.notes).data_stream
@@ -0,0 +1,277 @@
+# encoding: utf-8
+"""
+This module contains synthetic fixtures (audio signals, activation functions,
+events and MIDI files) for the benchmarks.
+
+All fixtures are generated deterministically and cached, so they can be used
+in the `setup()` methods of the benchmarks without being measured.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import atexit
+import os
+import tempfile
+
+import numpy as np
+
+from madmom.audio.signal import Signal
+
+SAMPLE_RATE = 44100
+FPS = 100
+TEMPO = 120.
+
+# durations [seconds] of the synthetic audio, can be overwritten with the
+# MADMOM_BENCHMARK_DURATIONS environment variable (comma separated)
+DURATIONS = [float(d) for d in
+             os.environ.get('MADMOM_BENCHMARK_DURATIONS', '10,60').split(',')]
+
+_cache = {}
+
+
+def _cached(func):
+    """Cache the results of a fixture function."""
+    def cached_func(*args):
+        """Return the cached result."""
+        key = (func.__name__, ) + args
+        if key not in _cache:
+            _cache[key] = func(*args)
+        return _cache[key]
+    cached_func.__name__ = func.__name__
+    cached_func.__doc__ = func.__doc__
+    return cached_func
+
+
+def beat_times(duration, tempo=TEMPO):
+    """
+    Beat times of a piece with constant tempo.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the piece [seconds].
+    tempo : float, optional
+        Tempo [bpm].
+
+    Returns
+    -------
+    numpy array
+        Beat times [seconds].
+
+    """
+    return np.arange(0.5, duration, 60. / tempo)
+
+
+@_cached
+def clicks(duration, sample_rate=SAMPLE_RATE):
+    """
+    Click track with a click at every beat.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the signal [seconds].
+    sample_rate : int, optional
+        Sample rate of the signal.
+
+    Returns
+    -------
+    :class:`Signal` instance
+        Click track.
+
+    """
+    signal = np.zeros(int(duration * sample_rate), dtype=np.float32)
+    # decaying 1 kHz clicks with a length of 20 ms
+    t = np.arange(int(0.02 * sample_rate)) / sample_rate
+    click = np.sin(2 * np.pi * 1000 * t) * np.exp(-t * 200)
+    for beat in beat_times(duration):
+        start = int(beat * sample_rate)
+        length = min(len(click), len(signal) - start)
+        signal[start:start + length] += click[:length]
+    return Signal(signal, sample_rate=sample_rate)
+
+
+@_cached
+def tones(duration, sample_rate=SAMPLE_RATE):
+    """
+    Sequence of harmonic tones with changing pitch at every beat.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the signal [seconds].
+    sample_rate : int, optional
+        Sample rate of the signal.
+
+    Returns
+    -------
+    :class:`Signal` instance
+        Tone sequence.
+
+    """
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    # MIDI pitches cycling through a C major scale
+    beats = (t // (60. / TEMPO)).astype(np.int)
+    pitches = np.asarray([60, 62, 64, 65, 67, 69, 71, 72])[beats % 8]
+    frequencies = 440. * 2 ** ((pitches - 69) / 12.)
+    phase = 2 * np.pi * np.cumsum(frequencies) / sample_rate
+    signal = sum(np.sin(h * phase) / h for h in range(1, 5))
+    return Signal((0.25 * signal).astype(np.float32),
+                  sample_rate=sample_rate)
+
+
+@_cached
+def noise(duration, sample_rate=SAMPLE_RATE):
+    """
+    White noise.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the signal [seconds].
+    sample_rate : int, optional
+        Sample rate of the signal.
+
+    Returns
+    -------
+    :class:`Signal` instance
+        Noise signal.
+
+    """
+    rng = np.random.RandomState(1234)
+    signal = 0.1 * rng.randn(int(duration * sample_rate))
+    return Signal(signal.astype(np.float32), sample_rate=sample_rate)
+
+
+@_cached
+def mixture(duration, sample_rate=SAMPLE_RATE):
+    """
+    Mixture of clicks, tones and noise.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the signal [seconds].
+    sample_rate : int, optional
+        Sample rate of the signal.
+
+    Returns
+    -------
+    :class:`Signal` instance
+        Mixed signal.
+
+    """
+    signal = clicks(duration, sample_rate) + tones(duration, sample_rate) + \
+        noise(duration, sample_rate)
+    return Signal(np.asarray(signal), sample_rate=sample_rate)
+
+
+@_cached
+def activations(duration, fps=FPS):
+    """
+    Beat/onset activation function with peaks at the beats.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the activation function [seconds].
+    fps : float, optional
+        Frames per second.
+
+    Returns
+    -------
+    numpy array
+        Activation function (float32 values between 0 and 1).
+
+    """
+    rng = np.random.RandomState(1234)
+    act = 0.1 * rng.rand(int(duration * fps))
+    act[np.round(beat_times(duration) * fps).astype(np.int)] = 0.9
+    return act.astype(np.float32)
+
+
+@_cached
+def notes(duration):
+    """
+    Notes (one per beat and a chord tone every second beat).
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the piece [seconds].
+
+    Returns
+    -------
+    numpy array
+        Notes (onset time, MIDI pitch, duration, velocity).
+
+    """
+    beats = beat_times(duration)
+    pitches = np.asarray([60, 62, 64, 65, 67, 69, 71, 72])
+    melody = np.column_stack((beats, pitches[np.arange(len(beats)) % 8],
+                              np.ones_like(beats) * 0.4,
+                              np.ones_like(beats) * 80))
+    chords = melody[::2].copy()
+    chords[:, 1] -= 12
+    chords[:, 2] = 0.9
+    result = np.vstack((melody, chords))
+    return result[np.lexsort((result[:, 1], result[:, 0]))]
+
+
+def detections(annotations, deviation=0.02, miss=0.1, extra=0.1):
+    """
+    Detections derived from the annotations.
+
+    Parameters
+    ----------
+    annotations : numpy array
+        Annotated events (the first column contains the times).
+    deviation : float, optional
+        Standard deviation of the timing deviations [seconds].
+    miss : float, optional
+        Fraction of missed annotations.
+    extra : float, optional
+        Fraction of additional (false positive) detections.
+
+    Returns
+    -------
+    numpy array
+        Detected events (sorted by time).
+
+    """
+    rng = np.random.RandomState(1234)
+    annotations = np.asarray(annotations, dtype=np.float)
+    det = annotations[rng.rand(len(annotations)) >= miss].copy()
+    det_times = det if det.ndim == 1 else det[:, 0]
+    det_times += rng.randn(len(det)) * deviation
+    extra = det[rng.rand(len(det)) < extra].copy()
+    extra_times = extra if extra.ndim == 1 else extra[:, 0]
+    extra_times += 0.25
+    det = np.concatenate((det, extra))
+    times = det if det.ndim == 1 else det[:, 0]
+    return det[np.argsort(times, kind='mergesort')]
+
+
+@_cached
+def midi_file(duration):
+    """
+    MIDI file with the notes of the given duration.
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the piece [seconds].
+
+    Returns
+    -------
+    str
+        File name of the (temporary) MIDI file.
+
+    """
+    from madmom.utils.midi import MIDIFile
+    fd, filename = tempfile.mkstemp(suffix='.mid')
+    os.close(fd)
+    atexit.register(os.unlink, filename)
+    MIDIFile.from_notes(notes(duration)).write(filename)
+    return filename
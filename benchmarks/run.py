@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+Run the benchmarks locally and compare the results against a baseline.
+
+The benchmarks are discovered in the `bench_*` modules of this package and run
+with all their parameters. `time_*` benchmarks report the minimum (and
+median) run time, `peakmem_*` benchmarks the peak memory allocated during
+the call (measured with `tracemalloc`, thus Python 3 is needed).
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import sys
+import timeit
+import warnings
+
+BENCHMARK_TYPES = {'time_': ('time', 's'), 'peakmem_': ('peakmem', 'bytes')}
+
+
+def discover(pattern=None):
+    """
+    Discover all benchmarks.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        Only return benchmarks whose name matches this regular expression.
+
+    Returns
+    -------
+    list
+        Benchmarks (name, class, method name, parameters).
+
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    benchmarks = []
+    for _, module_name, _ in sorted(pkgutil.iter_modules([package_dir])):
+        if not module_name.startswith('bench_'):
+            continue
+        module = importlib.import_module('benchmarks.%s' % module_name)
+        for class_name in sorted(dir(module)):
+            cls = getattr(module, class_name)
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            # asv parameters: a list (single parameter) or a list of lists
+            params = getattr(cls, 'params', [])
+            param_names = getattr(cls, 'param_names', [])
+            if len(param_names) == 1:
+                params = [params]
+            combinations = list(itertools.product(*params))
+            for method in sorted(dir(cls)):
+                if not method.startswith(tuple(BENCHMARK_TYPES)):
+                    continue
+                for args in combinations:
+                    name = '%s.%s.%s' % (module_name, class_name, method)
+                    if args:
+                        name += '(%s)' % ', '.join(str(a) for a in args)
+                    if pattern and not re.search(pattern, name):
+                        continue
+                    benchmarks.append((name, cls, method, args))
+    return benchmarks
+
+
+def _measure_time(func, repeat):
+    """Measure the run time of a function."""
+    # call the function once to warm up caches
+    func()
+    timer = timeit.Timer(func)
+    # run fast functions multiple times per measurement
+    number = 1
+    while min(timer.repeat(1, number)) < 0.05 and number < 1e6:
+        number *= 10
+    times = sorted(t / number for t in timer.repeat(repeat, number))
+    return times[0], {'median': times[len(times) // 2], 'number': number,
+                      'repeat': repeat}
+
+
+def _measure_peakmem(func):
+    """Measure the peak memory allocated by a function."""
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, {}
+
+
+def run(benchmarks, repeat=5, verbose=True):
+    """
+    Run the benchmarks.
+
+    Parameters
+    ----------
+    benchmarks : list
+        Benchmarks as returned by :func:`discover`.
+    repeat : int, optional
+        Number of times each timing is repeated.
+    verbose : bool, optional
+        Print the results while running.
+
+    Returns
+    -------
+    dict
+        Results (type, value, unit and statistics) indexed by the benchmark
+        names. Failed benchmarks have a value of 'None' and the error message
+        as statistics.
+
+    """
+    results = {}
+    # warnings of the benchmarked functions would clutter the output
+    warnings.simplefilter('ignore')
+    for name, cls, method, args in benchmarks:
+        prefix = [p for p in BENCHMARK_TYPES if method.startswith(p)][0]
+        bench_type, unit = BENCHMARK_TYPES[prefix]
+        # a failing benchmark must not abort the whole run
+        try:
+            value, stats = _run_benchmark(cls, method, args, bench_type,
+                                          repeat)
+        except Exception as e:
+            value, stats = None, {'error': '%s: %s' % (type(e).__name__, e)}
+        results[name] = {'type': bench_type, 'value': value, 'unit': unit,
+                         'stats': stats}
+        if verbose:
+            if value is None:
+                print('%-70s failed (%s)' % (name, stats['error']))
+            else:
+                print('%-70s %s' % (name, _format(value, unit)))
+    return results
+
+
+def _run_benchmark(cls, method, args, bench_type, repeat):
+    """Set up, measure and tear down a single benchmark."""
+    instance = cls()
+    if hasattr(instance, 'setup'):
+        instance.setup(*args)
+    func = getattr(instance, method)
+    try:
+        if bench_type == 'time':
+            return _measure_time(lambda: func(*args), repeat)
+        return _measure_peakmem(lambda: func(*args))
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*args)
+
+
+def _format(value, unit):
+    """Format a value with its unit."""
+    if unit == 's':
+        for factor, prefix in ((1, ''), (1e-3, 'm'), (1e-6, 'u')):
+            if value >= factor:
+                break
+        return '%8.3f %ss' % (value / factor, prefix)
+    return '%8.2f MB' % (value / 1024. / 1024.)
+
+
+def compare(results, baseline, factor=1.1):
+    """
+    Compare results against a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Results of :func:`run`.
+    baseline : dict
+        Baseline results.
+    factor : float, optional
+        Ratio (result / baseline) above which a result is considered a
+        regression (below 1 / `factor` an improvement).
+
+    Returns
+    -------
+    list
+        Comparisons (name, baseline value, value, ratio, unit, state) with
+        state being one of 'regression', 'improvement' or 'unchanged'.
+
+    """
+    comparisons = []
+    for name in sorted(results):
+        # skip failed benchmarks
+        if name not in baseline or results[name]['value'] is None or \
+                baseline[name]['value'] is None:
+            continue
+        value = results[name]['value']
+        base = baseline[name]['value']
+        ratio = value / base if base else float('inf') if value else 1.
+        if ratio > factor:
+            state = 'regression'
+        elif ratio < 1. / factor:
+            state = 'improvement'
+        else:
+            state = 'unchanged'
+        comparisons.append((name, base, value, ratio,
+                            results[name]['unit'], state))
+    return comparisons
+
+
+def environment():
+    """Information about the environment the benchmarks run in."""
+    import numpy as np
+    import madmom
+    return {'madmom': getattr(madmom, '__version__', None),
+            'numpy': np.__version__, 'python': platform.python_version(),
+            'machine': platform.machine(), 'platform': platform.platform(),
+            'processor': platform.processor()}
+
+
+def main():
+    """Run the benchmarks."""
+    p = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter, description='''
+    Run the madmom benchmarks on synthetic audio and compare the results
+    against a stored baseline (e.g. the results of the currently deployed
+    version).''')
+    p.add_argument('-b', '--bench', dest='pattern', default=None,
+                   help='run only benchmarks matching this regular '
+                        'expression')
+    p.add_argument('-d', '--durations', default=None,
+                   help='comma separated durations of the synthetic audio '
+                        '[seconds, default=10,60]')
+    p.add_argument('-r', '--repeat', type=int, default=5,
+                   help='repeat each timing N times [default=%(default)i]')
+    p.add_argument('--save', default=None,
+                   help='save the results as JSON to this file')
+    p.add_argument('--compare', default=None,
+                   help='compare the results against this baseline JSON file')
+    p.add_argument('--factor', type=float, default=1.1,
+                   help='ratio to the baseline considered a regression '
+                        '[default=%(default).2f]')
+    p.add_argument('-q', '--quiet', action='store_true',
+                   help='do not print the individual results')
+    args = p.parse_args()
+
+    # the durations must be set before the benchmarks are imported
+    if args.durations:
+        os.environ['MADMOM_BENCHMARK_DURATIONS'] = args.durations
+    results = run(discover(args.pattern), repeat=args.repeat,
+                  verbose=not args.quiet)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f,
+                      indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        comparisons = compare(results, baseline, args.factor)
+        print('\n%-70s %11s %11s %7s' % ('benchmark', 'baseline', 'result',
+                                         'ratio'))
+        for name, base, value, ratio, unit, state in comparisons:
+            print('%-70s %s %s %7.2f %s' % (
+                name, _format(base, unit), _format(value, unit), ratio,
+                '' if state == 'unchanged' else state))
+        # exit with an error if any benchmark regressed
+        if any(c[-1] == 'regression' for c in comparisons):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
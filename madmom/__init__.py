@@ -15,99 +15,188 @@ Please see the README for further details of this package.
 
 from __future__ import absolute_import, division, print_function
 
-import doctest
-import numpy as np
-import pkg_resources
+import sys
+
+# subpackages and modules, imported lazily when accessed as attributes
+SUBPACKAGES = ('audio', 'evaluation', 'features', 'ml', 'models',
+               'processors', 'utils')
+
+
+def _version():
+    """Version of the package."""
+    try:
+        # module generated by setup.py
+        from .version import version
+        return version
+    except ImportError:
+        pass
+    try:
+        # Python 3.8+, much faster than pkg_resources
+        from importlib.metadata import version
+        return version('madmom')
+    except ImportError:
+        import pkg_resources
+        return pkg_resources.get_distribution('madmom').version
+
+
+def __getattr__(name):
+    """
+    Import the subpackages and determine the version on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+
+    Returns
+    -------
+    module or str
+        Subpackage or version.
+
+    """
+    import importlib
+    if name in SUBPACKAGES:
+        module = importlib.import_module('.' + name, __name__)
+    elif name == '__version__':
+        module = _version()
+    else:
+        raise AttributeError("module '%s' has no attribute '%s'" %
+                             (__name__, name))
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    """Attributes of the package including the not yet imported ones."""
+    return sorted(set(globals()) | set(SUBPACKAGES) | {'__version__'})
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported (PEP 562), thus use a module
+    # subclass (Python 3.5+) or import everything (older versions)
+    import types
 
-# import all packages
-from . import audio, evaluation, features, ml, models, processors, utils
+    class _LazyModule(types.ModuleType):
+        """Module importing its subpackages lazily."""
 
-# define a version variable
-__version__ = pkg_resources.get_distribution("madmom").version
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+        def __dir__(self):
+            return __dir__()
+
+    try:
+        sys.modules[__name__].__class__ = _LazyModule
+    except TypeError:
+        from . import audio, evaluation, features, ml, models, processors, \
+            utils
+        __version__ = _version()
+    del types
 
 # set and restore numpy's print options for doctests
-_NP_PRINT_OPTIONS = np.get_printoptions()
+_NP_PRINT_OPTIONS = None
 
 
 def setup():
     # pylint: disable=missing-docstring
     # sets up the environment for doctests (when run through nose)
+    global _NP_PRINT_OPTIONS
+    import numpy as np
+    _setup_doctest()
+    _NP_PRINT_OPTIONS = np.get_printoptions()
     np.set_printoptions(precision=5, edgeitems=2, suppress=True)
 
 
 def teardown():
     # pylint: disable=missing-docstring
     # restore the environment after doctests (when run through nose)
-    np.set_printoptions(**_NP_PRINT_OPTIONS)
+    import numpy as np
+    if _NP_PRINT_OPTIONS is not None:
+        np.set_printoptions(**_NP_PRINT_OPTIONS)
 
 
-# Create a doctest output checker that optionally ignores the unicode string
-# literal.
-
-# declare the new doctest directives
-IGNORE_UNICODE = doctest.register_optionflag("IGNORE_UNICODE")
-doctest.IGNORE_UNICODE = IGNORE_UNICODE
-doctest.__all__.append("IGNORE_UNICODE")
-doctest.COMPARISON_FLAGS = doctest.COMPARISON_FLAGS | IGNORE_UNICODE
+def _setup_doctest():
+    """
+    Declare the madmom specific doctest directives and install an output
+    checker which compares the output with these additional flags.
 
-NORMALIZE_ARRAYS = doctest.register_optionflag("NORMALIZE_ARRAYS")
-doctest.NORMALIZE_ARRAYS = NORMALIZE_ARRAYS
-doctest.__all__.append("NORMALIZE_ARRAYS")
-doctest.COMPARISON_FLAGS = doctest.COMPARISON_FLAGS | NORMALIZE_ARRAYS
+    Notes
+    -----
+    This is done automatically if the `doctest` module was imported before
+    madmom (e.g. by nose or pytest) or when the doctests are set up by nose.
 
-_doctest_OutputChecker = doctest.OutputChecker
+    """
+    import doctest
+    if hasattr(doctest, 'NORMALIZE_ARRAYS'):
+        # already set up
+        return
 
+    # declare the new doctest directives
+    doctest.IGNORE_UNICODE = doctest.register_optionflag("IGNORE_UNICODE")
+    doctest.__all__.append("IGNORE_UNICODE")
+    doctest.COMPARISON_FLAGS = doctest.COMPARISON_FLAGS | \
+        doctest.IGNORE_UNICODE
 
-class MadmomOutputChecker(_doctest_OutputChecker):
-    """
-    Output checker which enhances `doctest.OutputChecker` to compare doctests
-    and computed output with additional flags.
+    doctest.NORMALIZE_ARRAYS = doctest.register_optionflag("NORMALIZE_ARRAYS")
+    doctest.__all__.append("NORMALIZE_ARRAYS")
+    doctest.COMPARISON_FLAGS = doctest.COMPARISON_FLAGS | \
+        doctest.NORMALIZE_ARRAYS
 
-    """
+    _doctest_OutputChecker = doctest.OutputChecker
 
-    def check_output(self, want, got, optionflags):
+    class MadmomOutputChecker(_doctest_OutputChecker):
         """
-        Return 'True' if the actual output from an example matches the
-        expected.
-
-        Parameters
-        ----------
-        want : str
-            Expected output.
-        got : str
-            Actual output.
-        optionflags : int
-            Comparison flags.
-
-        Returns
-        -------
-        bool
-            'True' if the output maches the expectation.
+        Output checker which enhances `doctest.OutputChecker` to compare
+        doctests and computed output with additional flags.
 
         """
-        import re
-        import sys
-        if optionflags & IGNORE_UNICODE and sys.version_info[0] > 2:
-            # remove unicode indicators
-            want = re.sub("u'(.*?)'", "'\\1'", want)
-            want = re.sub('u"(.*?)"', '"\\1"', want)
-        if optionflags & NORMALIZE_ARRAYS:
-            # in different versions of numpy arrays sometimes are displayed as
-            # 'array([ 0. ,' or 'array([0.0,', thus correct both whitespace
-            # after parenthesis and before commas as well as .0 decimals
-            got = re.sub("\\( ", '(', got)
-            got = re.sub("\\[ ", '[', got)
-            got = re.sub("0\\.0", '0.', got)
-            got = re.sub("\s*,", ',', got)
-            want = re.sub("\\( ", '(', want)
-            want = re.sub("\\[ ", '[', want)
-            want = re.sub("0\\.0", '0.', want)
-            want = re.sub("\s*,", ',', want)
-        super_check_output = _doctest_OutputChecker.check_output
-        return super_check_output(self, want, got, optionflags)
-
-# monkey-patching
-doctest.OutputChecker = MadmomOutputChecker
-
-# keep namespace clean
-del pkg_resources, doctest
+
+        def check_output(self, want, got, optionflags):
+            """
+            Return 'True' if the actual output from an example matches the
+            expected.
+
+            Parameters
+            ----------
+            want : str
+                Expected output.
+            got : str
+                Actual output.
+            optionflags : int
+                Comparison flags.
+
+            Returns
+            -------
+            bool
+                'True' if the output maches the expectation.
+
+            """
+            import re
+            if optionflags & doctest.IGNORE_UNICODE and \
+                    sys.version_info[0] > 2:
+                # remove unicode indicators
+                want = re.sub("u'(.*?)'", "'\\1'", want)
+                want = re.sub('u"(.*?)"', '"\\1"', want)
+            if optionflags & doctest.NORMALIZE_ARRAYS:
+                # in different versions of numpy arrays sometimes are
+                # displayed as 'array([ 0. ,' or 'array([0.0,', thus correct
+                # both whitespace after parenthesis and before commas as well
+                # as .0 decimals
+                got = re.sub("\\( ", '(', got)
+                got = re.sub("\\[ ", '[', got)
+                got = re.sub("0\\.0", '0.', got)
+                got = re.sub("\s*,", ',', got)
+                want = re.sub("\\( ", '(', want)
+                want = re.sub("\\[ ", '[', want)
+                want = re.sub("0\\.0", '0.', want)
+                want = re.sub("\s*,", ',', want)
+            super_check_output = _doctest_OutputChecker.check_output
+            return super_check_output(self, want, got, optionflags)
+
+    # monkey-patching
+    doctest.OutputChecker = MadmomOutputChecker
+
+
+# set up doctests only if they are run, importing doctest is expensive
+if 'doctest' in sys.modules:
+    _setup_doctest()
@@ -12,8 +12,15 @@ import numpy as np
 cimport cython
 cimport numpy as np
 
+from libc.stdlib cimport calloc, free
+
 from madmom.processors import Processor
 
+# modes of the comb filter histogram kernel
+DEF HIST_SINGLE_PASS = 0
+DEF HIST_MAX = 1
+DEF HIST_ACCUMULATE = 2
+
 
 # feed forward comb filter
 def feed_forward_comb_filter(signal, tau, alpha):
@@ -141,7 +148,7 @@ def _feed_backward_comb_filter_2d(np.ndarray[np.float_t, ndim=2] signal,
     cdef np.ndarray[np.float_t, ndim=2] y = signal.copy()
     cdef unsigned int d, n
     # loop over the dimensions
-    for d in range(2):
+    for d in range(signal.shape[1]):
         # loop over the complete signal
         for n in range(tau, len(signal)):
             # add a delayed version of the output signal
@@ -161,7 +168,7 @@ def feed_backward_comb_filter_2d(signal, tau, alpha):
 
 
 # comb filter
-def comb_filter(signal, filter_function, tau, alpha):
+def comb_filter(signal, filter_function, tau, alpha, num_threads=1):
     """
     Filter the signal with a bank of either feed forward or backward comb
     filters.
@@ -176,6 +183,9 @@ def comb_filter(signal, filter_function, tau, alpha):
         Delay length(s) [frames].
     alpha : list or numpy array, shape (N,)
         Corresponding scaling factor(s).
+    num_threads : int, optional
+        Number of threads used to filter the signal with backward comb
+        filters; the delays are distributed among the threads.
 
     Returns
     -------
@@ -187,6 +197,9 @@ def comb_filter(signal, filter_function, tau, alpha):
     -----
     `tau` and `alpha` must be of same length.
 
+    Feed backward comb filters are computed for all delays in a single pass
+    over the signal.
+
     Examples
     --------
     Filter the given signal with a bank of resonating comb filters.
@@ -217,6 +230,96 @@ def comb_filter(signal, filter_function, tau, alpha):
            [ 1.125,  1.75 ]])
 
     """
+    tau, alpha = _comb_filter_parameters(tau, alpha)
+    # filter all delays in a single pass
+    if filter_function is feed_backward_comb_filter:
+        signal_2d = _comb_filter_signal(signal)
+        y = np.empty(signal_2d.shape + (len(tau), ), dtype=np.float)
+        if len(y):
+            _map_chunks(_comb_filter_backward, len(tau), num_threads,
+                        signal_2d, tau, alpha, y)
+        if signal.ndim == 1:
+            return y[:, 0]
+        return y
+    # init output array
+    y = []
+    for i, t in np.ndenumerate(tau):
+        y.append(filter_function(signal, t, alpha[i]))
+    if signal.ndim == 1:
+        return np.vstack(y).T
+    elif signal.ndim == 2:
+        return np.dstack(y)
+    else:
+        raise ValueError('only 1D and 2D signals supported')
+
+
+def comb_filter_histogram(signal, tau, alpha, num_threads=1):
+    """
+    Filter the signal with a bank of feed backward comb filters and sum the
+    maximum filter outputs of each frame.
+
+    Parameters
+    ----------
+    signal : numpy array
+        Signal.
+    tau : list or numpy array, shape (N,)
+        Delay length(s) [frames].
+    alpha : list or numpy array, shape (N,)
+        Corresponding scaling factor(s).
+    num_threads : int, optional
+        Number of threads; the delays are distributed among the threads.
+
+    Returns
+    -------
+    histogram : numpy array
+        For each delay, the sum of the filter outputs at those frames where
+        the filter with this delay has the highest output of all filters.
+        For 2D signals, a histogram is computed for each column.
+
+    Notes
+    -----
+    The result is the same as:
+
+    >>> y = comb_filter(signal, feed_backward_comb_filter, tau, alpha)
+    ... # doctest: +SKIP
+    >>> np.sum(y * (y == np.max(y, axis=-1)[..., np.newaxis]), axis=0)
+    ... # doctest: +SKIP
+
+    but the complete filter output is never materialised; only delay lines
+    holding the last `tau` values of each filter are needed.
+
+    Examples
+    --------
+    >>> x = np.array([0, 0, 1, 0, 0, 1, 0, 0, 1])
+    >>> comb_filter_histogram(x, [2, 3], [0.5, 0.5])
+    array([ 2.25,  4.25])
+
+    """
+    tau, alpha = _comb_filter_parameters(tau, alpha)
+    signal_2d = _comb_filter_signal(signal)
+    num_frames, num_dims = signal_2d.shape
+    bins = np.zeros((num_dims, len(tau)), dtype=np.float)
+    chunks = _chunks(len(tau), num_threads)
+    if len(chunks) == 1:
+        # compute the maxima and accumulate the histogram in a single pass
+        _map_chunks(_comb_filter_histogram, len(tau), 1, signal_2d, tau,
+                    alpha, None, bins, HIST_SINGLE_PASS)
+    elif len(chunks) > 1:
+        # first determine the maxima of all chunks, then accumulate the
+        # histogram with the overall maxima
+        chunk_max = np.empty((len(chunks), num_frames, num_dims))
+        _map_chunks(_comb_filter_histogram, len(tau), num_threads,
+                    signal_2d, tau, alpha, chunk_max, bins, HIST_MAX)
+        frame_max = np.ascontiguousarray(np.max(chunk_max, axis=0))
+        _map_chunks(_comb_filter_histogram, len(tau), num_threads,
+                    signal_2d, tau, alpha, frame_max, bins, HIST_ACCUMULATE)
+    if signal.ndim == 1:
+        return bins[0]
+    return bins
+
+
+def _comb_filter_parameters(tau, alpha):
+    """Check and convert the comb filter parameters."""
     # convert tau to a integer numpy array
     tau = np.array(tau, dtype=np.int, ndmin=1)
     if tau.ndim != 1:
@@ -231,16 +334,155 @@ def comb_filter(signal, filter_function, tau, alpha):
     # tau and alpha must have the same length
     if len(tau) != len(alpha):
         raise ValueError('`tau` and `alpha` must have the same length')
-    # init output array
-    y = []
-    for i, t in np.ndenumerate(tau):
-        y.append(filter_function(signal, t, alpha[i]))
+    return tau, alpha
+
+
+def _comb_filter_signal(signal):
+    """Convert the signal to a 2D float array with frames as rows."""
+    signal = np.asarray(signal)
     if signal.ndim == 1:
-        return np.vstack(y).T
-    elif signal.ndim == 2:
-        return np.dstack(y)
+        signal = signal[:, np.newaxis]
+    elif signal.ndim != 2:
+        raise ValueError('signal must be 1d or 2d')
+    return np.ascontiguousarray(signal, dtype=np.float)
+
+
+def _chunks(num, num_threads):
+    """Split `num` items into (at most) `num_threads` (start, stop) chunks."""
+    num_chunks = max(1, min(num, num_threads or 1))
+    bounds = np.linspace(0, num, num_chunks + 1).astype(np.int)
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start]
+
+
+def _map_chunks(kernel, num, num_threads, signal, tau, alpha, *args):
+    """Apply the kernel to chunks of delays, possibly in parallel threads."""
+    chunks = _chunks(num, num_threads)
+    if np.any(tau <= 0):
+        raise ValueError('`tau` must be greater than 0')
+    # the kernels use C types
+    tau = tau.astype(np.intp)
+    alpha = alpha.astype(np.float32)
+
+    def _process(c):
+        start, stop = chunks[c]
+        kernel(signal, tau, alpha, start, stop, c, *args)
+
+    if len(chunks) > 1:
+        # the kernels release the GIL, thus threads run in parallel
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(len(chunks))
+        try:
+            pool.map(_process, range(len(chunks)))
+        finally:
+            pool.close()
     else:
-        raise ValueError('only 1D and 2D signals supported')
+        for c in range(len(chunks)):
+            _process(c)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _comb_filter_backward(double [:, ::1] signal, Py_ssize_t [::1] tau,
+                          float [::1] alpha, Py_ssize_t start,
+                          Py_ssize_t stop, Py_ssize_t chunk,
+                          double [:, :, ::1] y):
+    """
+    Filter the signal with the feed backward comb filters with delays
+    `tau[start:stop]` and write the output to `y[:, :, start:stop]`.
+
+    """
+    # y[n] = x[n] + α * y[n - τ]
+    cdef Py_ssize_t num_frames = signal.shape[0]
+    cdef Py_ssize_t num_dims = signal.shape[1]
+    cdef Py_ssize_t n, d, k, t
+    cdef double x
+    with nogil:
+        for n in range(num_frames):
+            for d in range(num_dims):
+                x = signal[n, d]
+                for k in range(start, stop):
+                    t = tau[k]
+                    if n >= t:
+                        y[n, d, k] = x + alpha[k] * y[n - t, d, k]
+                    else:
+                        y[n, d, k] = x
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _comb_filter_histogram(double [:, ::1] signal, Py_ssize_t [::1] tau,
+                           float [::1] alpha, Py_ssize_t start,
+                           Py_ssize_t stop, Py_ssize_t chunk, frame_max,
+                           double [:, ::1] bins, int mode):
+    """
+    Filter the signal with the feed backward comb filters with delays
+    `tau[start:stop]` and accumulate the histogram bins.
+
+    Depending on `mode`, the maxima of each frame are determined and used to
+    accumulate the histogram in a single pass (HIST_SINGLE_PASS), only the
+    maxima of this chunk of delays are written to `frame_max[chunk]`
+    (HIST_MAX), or the given `frame_max` are used to accumulate the histogram
+    (HIST_ACCUMULATE).
+
+    """
+    cdef Py_ssize_t num_frames = signal.shape[0]
+    cdef Py_ssize_t num_dims = signal.shape[1]
+    cdef Py_ssize_t num_taus = stop - start
+    cdef Py_ssize_t n, d, k, t, total = 0
+    cdef double x, y, max_y
+    cdef double [:, ::1] max_
+    if mode == HIST_MAX:
+        max_ = frame_max[chunk]
+    elif mode == HIST_ACCUMULATE:
+        max_ = frame_max
+    # delay lines holding the last tau filter outputs
+    cdef Py_ssize_t *offsets = <Py_ssize_t *> calloc(num_taus,
+                                                     sizeof(Py_ssize_t))
+    cdef double *row = <double *> calloc(num_taus, sizeof(double))
+    for k in range(num_taus):
+        offsets[k] = total
+        total += tau[start + k]
+    cdef double *delay = <double *> calloc(total * num_dims, sizeof(double))
+    if offsets == NULL or row == NULL or delay == NULL:
+        free(offsets)
+        free(row)
+        free(delay)
+        raise MemoryError()
+    with nogil:
+        for n in range(num_frames):
+            for d in range(num_dims):
+                x = signal[n, d]
+                # y[n] = x[n] + α * y[n - τ]
+                for k in range(num_taus):
+                    t = tau[start + k]
+                    if n >= t:
+                        y = x + alpha[start + k] * \
+                            delay[d * total + offsets[k] + n % t]
+                    else:
+                        y = x
+                    delay[d * total + offsets[k] + n % t] = y
+                    row[k] = y
+                if mode == HIST_ACCUMULATE:
+                    max_y = max_[n, d]
+                else:
+                    # determine the maximum of all filters
+                    max_y = row[0]
+                    for k in range(1, num_taus):
+                        if row[k] > max_y:
+                            max_y = row[k]
+                    if mode == HIST_MAX:
+                        max_[n, d] = max_y
+                        continue
+                # add the filter outputs with the maximum value to the bins
+                for k in range(num_taus):
+                    if row[k] == max_y:
+                        bins[d, start + k] += row[k]
+    free(offsets)
+    free(row)
+    free(delay)
 
 
 class CombFilterbankProcessor(Processor):
@@ -256,6 +498,8 @@ class CombFilterbankProcessor(Processor):
         Delay length(s) [frames].
     alpha : list or numpy array, shape (N,)
         Corresponding scaling factor(s).
+    num_threads : int, optional
+        Number of threads used for filtering with backward comb filters.
 
     Notes
     -----
@@ -292,8 +536,9 @@ class CombFilterbankProcessor(Processor):
            [ 1.125,  1.75 ]])
 
     """
+    online_capable = False
 
-    def __init__(self, filter_function, tau, alpha):
+    def __init__(self, filter_function, tau, alpha, num_threads=1):
         # convert tau and alpha to a numpy arrays
         self.tau = np.array(tau, dtype=np.int, ndmin=1)
         self.alpha = np.array(alpha, dtype=np.float, ndmin=1)
@@ -304,6 +549,7 @@ class CombFilterbankProcessor(Processor):
             self.filter_function = feed_backward_comb_filter
         else:
             raise ValueError('unknown `filter_function`: %s' % filter_function)
+        self.num_threads = num_threads
 
     def process(self, data):
         """
@@ -321,4 +567,5 @@ class CombFilterbankProcessor(Processor):
             last dimension.
 
         """
-        return comb_filter(data, self.filter_function, self.tau, self.alpha)
+        return comb_filter(data, self.filter_function, self.tau, self.alpha,
+                           getattr(self, 'num_threads', 1))
@@ -15,7 +15,7 @@ import os
 import sys
 import numpy as np
 
-from .signal import Signal
+from .signal import Signal, FileDescriptorSource
 
 
 def _ffmpeg_fmt(dtype):
@@ -49,7 +49,7 @@ def _ffmpeg_fmt(dtype):
 
 
 def _ffmpeg_call(infile, output, fmt='f32le', sample_rate=None, num_channels=1,
-                 skip=None, max_len=None, cmd='ffmpeg'):
+                 skip=None, max_len=None, cmd='ffmpeg', container=None):
     """
     Create a sequence of strings indicating ffmpeg how to be called as well as
     the parameters necessary to decode the given input (file) to the given
@@ -75,6 +75,8 @@ def _ffmpeg_call(infile, output, fmt='f32le', sample_rate=None, num_channels=1,
         Maximum length in seconds to decode.
     cmd : {'ffmpeg','avconv'}, optional
         Decoding command (defaults to ffmpeg, alternatively supports avconv).
+    container : {None, 'wav'}, optional
+        Container format to wrap the samples in; 'None' outputs raw samples.
 
     Returns
     -------
@@ -113,7 +115,10 @@ def _ffmpeg_call(infile, output, fmt='f32le', sample_rate=None, num_channels=1,
         call.extend(["-f", in_fmt, "-ac", in_ac, "-ar", in_ar])
     call.extend(["-i", infile])
     # output options
-    call.extend(["-f", str(fmt)])
+    if container:
+        call.extend(["-f", str(container), "-acodec", str("pcm_" + fmt)])
+    else:
+        call.extend(["-f", str(fmt)])
     if max_len:
         # use "%f" to avoid scientific float notation
         call.extend(["-t", "%f" % float(max_len)])
@@ -197,7 +202,8 @@ def decode_to_disk(infile, fmt='f32le', sample_rate=None, num_channels=1,
 
 
 def decode_to_pipe(infile, fmt='f32le', sample_rate=None, num_channels=1,
-                   skip=None, max_len=None, buf_size=-1, cmd='ffmpeg'):
+                   skip=None, max_len=None, buf_size=-1, cmd='ffmpeg',
+                   container=None):
     """
     Decode the given audio and return a file-like object for reading the
     samples, as well as a process object.
@@ -225,6 +231,8 @@ def decode_to_pipe(infile, fmt='f32le', sample_rate=None, num_channels=1,
         - '1' means line-buffered, any other value is the buffer size in bytes.
     cmd : {'ffmpeg','avconv'}, optional
         Decoding command (defaults to ffmpeg, alternatively supports avconv).
+    container : {None, 'wav'}, optional
+        Container format to wrap the samples in; 'None' outputs raw samples.
 
     Returns
     -------
@@ -248,7 +256,7 @@ def decode_to_pipe(infile, fmt='f32le', sample_rate=None, num_channels=1,
     #       explicitly, but this is only available in Python 2.6+. proc.wait
     #       needs to be called in any case.
     call = _ffmpeg_call(infile, "pipe:1", fmt, sample_rate, num_channels, skip,
-                        max_len, cmd)
+                        max_len, cmd, container)
     # redirect stdout to a pipe and buffer as requested
     if isinstance(infile, Signal):
         proc = subprocess.Popen(call, stdin=subprocess.PIPE,
@@ -259,7 +267,7 @@ def decode_to_pipe(infile, fmt='f32le', sample_rate=None, num_channels=1,
 
 
 def decode_to_memory(infile, fmt='f32le', sample_rate=None, num_channels=1,
-                     skip=None, max_len=None, cmd='ffmpeg'):
+                     skip=None, max_len=None, cmd='ffmpeg', container=None):
     """
     Decode the given audio and return it as a binary string representation.
 
@@ -281,6 +289,8 @@ def decode_to_memory(infile, fmt='f32le', sample_rate=None, num_channels=1,
         Maximum length in seconds to decode.
     cmd : {'ffmpeg', 'avconv'}, optional
         Decoding command (defaults to ffmpeg, alternatively supports avconv).
+    container : {None, 'wav'}, optional
+        Container format to wrap the samples in; 'None' outputs raw samples.
 
     Returns
     -------
@@ -295,7 +305,7 @@ def decode_to_memory(infile, fmt='f32le', sample_rate=None, num_channels=1,
     # prepare decoding to pipe
     _, proc = decode_to_pipe(infile, fmt=fmt, sample_rate=sample_rate,
                              num_channels=num_channels, skip=skip,
-                             max_len=max_len, cmd=cmd)
+                             max_len=max_len, cmd=cmd, container=container)
     # decode the input to memory
     if isinstance(infile, Signal):
         # Note: np.getbuffer was removed in Python 3, but Python 2 memoryviews
@@ -351,9 +361,271 @@ def get_file_info(infile, cmd='ffprobe'):
     return info
 
 
+def get_files_info(infiles, cmd='ffprobe', num_threads=None):
+    """
+    Extract and return information about multiple audio files.
+
+    Wave files are inspected directly, all other files are probed with
+    concurrently running `cmd` processes.
+
+    Parameters
+    ----------
+    infiles : list
+        Names of the audio files.
+    cmd : {'ffprobe', 'avprobe'}, optional
+        Probing command (defaults to ffprobe, alternatively supports avprobe).
+    num_threads : int, optional
+        Number of files to probe in parallel; 'None' uses the number of CPUs.
+
+    Returns
+    -------
+    list
+        Audio file information (dictionaries, same order as `infiles`).
+
+    """
+    def _get_info(infile):
+        # inspect wave files without spawning a process
+        if not isinstance(infile, Signal):
+            try:
+                with open(infile, 'rb') as f:
+                    sample_rate, num_channels = _read_wave_header(f)[:2]
+                return {'num_channels': num_channels,
+                        'sample_rate': sample_rate}
+            except ValueError:
+                pass
+        return get_file_info(infile, cmd=cmd)
+
+    infiles = list(infiles)
+    if num_threads is None:
+        import multiprocessing as mp
+        num_threads = mp.cpu_count()
+    num_threads = max(1, min(len(infiles), num_threads))
+    if num_threads == 1:
+        return [_get_info(infile) for infile in infiles]
+    # the probing processes run in parallel, threads just wait for them
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(num_threads)
+    try:
+        return pool.map(_get_info, infiles)
+    finally:
+        pool.close()
+
+
+def _read_wave_header(f):
+    """
+    Read the header of a wave file.
+
+    Parameters
+    ----------
+    f : file-like object
+        Binary file (or pipe) positioned at the start of the wave file.
+
+    Returns
+    -------
+    sample_rate : int
+        Sample rate of the audio samples [Hz].
+    num_channels : int
+        Number of channels.
+    sample_width : int
+        Sample width [bytes].
+
+    Raises
+    ------
+    ValueError
+        If `f` is not a wave file.
+
+    Notes
+    -----
+    After reading, `f` is positioned at the first sample. The size of the
+    data chunk is not checked, since it is not known in advance (and thus
+    not set correctly) when writing to a pipe.
+
+    """
+    import struct
+    header = f.read(12)
+    if len(header) < 12 or header[:4] not in (b'RIFF', b'RF64') or \
+            header[8:] != b'WAVE':
+        raise ValueError('not a wave file')
+    fmt = None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            raise ValueError('no data chunk found')
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk)
+        if chunk_id == b'data':
+            break
+        # chunks are padded to an even size
+        data = f.read(chunk_size + chunk_size % 2)
+        if chunk_id == b'fmt ':
+            fmt = data
+    if fmt is None or len(fmt) < 16:
+        raise ValueError('no format chunk found')
+    num_channels, sample_rate = struct.unpack('<HI', fmt[2:8])
+    sample_width = struct.unpack('<H', fmt[14:16])[0] // 8
+    return sample_rate, num_channels, sample_width
+
+
+# sample formats which can be wrapped in a wave container
+_WAVE_FMTS = ('u8', 's16le', 's32le', 'f32le', 'f64le')
+
+
+class AudioCache(object):
+    """
+    Cache for decoded audio files.
+
+    The decoded samples are stored as raw .npy files, keyed by the path,
+    modification time and size of the audio file, as well as the requested
+    sample rate, number of channels and dtype. Cached signals are returned
+    memory-mapped (copy-on-write).
+
+    Parameters
+    ----------
+    directory : str
+        Directory to store the decoded audio files in.
+    max_size : float, optional
+        Maximum size of the cache [MB]. If exceeded, the least recently used
+        files are removed from the cache. 'None' does not limit the size.
+
+    """
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _key(self, filename, sample_rate, num_channels, dtype):
+        """Key (i.e. file name prefix) of the decoded audio file."""
+        import hashlib
+        stat = os.stat(filename)
+        key = repr((os.path.abspath(filename), stat.st_mtime, stat.st_size,
+                    sample_rate, num_channels,
+                    None if dtype is None else np.dtype(dtype).str))
+        return os.path.join(self.directory,
+                            hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def get(self, filename, sample_rate=None, num_channels=None, dtype=None):
+        """
+        Get the decoded audio file from the cache.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the audio file.
+        sample_rate : int, optional
+            Requested sample rate [Hz].
+        num_channels : int, optional
+            Requested number of channels.
+        dtype : numpy dtype, optional
+            Requested dtype.
+
+        Returns
+        -------
+        signal : numpy memmap
+            Audio samples.
+        sample_rate : int
+            Sample rate of the audio samples.
+
+        Notes
+        -----
+        'None' is returned if the decoded audio file is not cached.
+
+        """
+        import glob
+        # the sample rate is encoded in the file name
+        cached = glob.glob(self._key(filename, sample_rate, num_channels,
+                                     dtype) + '.*.npy')
+        if not cached:
+            return None
+        try:
+            signal = np.load(cached[0], mmap_mode='c')
+        except (IOError, ValueError):
+            # another process removed or did not finish writing the file
+            return None
+        # mark the file as recently used
+        os.utime(cached[0], None)
+        return signal, int(cached[0].rsplit('.', 2)[-2])
+
+    def put(self, filename, signal, sample_rate, requested_sample_rate=None,
+            num_channels=None, dtype=None):
+        """
+        Put the decoded audio file into the cache.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the audio file.
+        signal : numpy array
+            Decoded audio samples.
+        sample_rate : int
+            Sample rate of the audio samples [Hz].
+        requested_sample_rate : int, optional
+            Requested sample rate [Hz].
+        num_channels : int, optional
+            Requested number of channels.
+        dtype : numpy dtype, optional
+            Requested dtype.
+
+        """
+        try:
+            os.makedirs(self.directory)
+        except OSError:
+            if not os.path.isdir(self.directory):
+                raise
+        key = self._key(filename, requested_sample_rate, num_channels, dtype)
+        # write to a temporary file and rename it, so that concurrent
+        # processes never see incomplete files
+        f = tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp',
+                                        delete=False)
+        try:
+            np.save(f, signal)
+            f.close()
+            os.rename(f.name, '%s.%d.npy' % (key, sample_rate))
+        except Exception:
+            f.close()
+            os.unlink(f.name)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used files exceeding the maximum size."""
+        import glob
+        if self.max_size is None:
+            return
+        files = []
+        for f in glob.glob(os.path.join(self.directory, '*.npy')):
+            try:
+                stat = os.stat(f)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, f))
+        size = sum(f[1] for f in files)
+        for _, file_size, f in sorted(files):
+            if size <= self.max_size * 1e6:
+                break
+            try:
+                os.unlink(f)
+            except OSError:
+                pass
+            size -= file_size
+
+    def clear(self):
+        """Remove all files from the cache."""
+        self.max_size, max_size = 0, self.max_size
+        self.evict()
+        self.max_size = max_size
+
+
+# decoded audio cache used by default, enabled by setting the environment
+# variable MADMOM_AUDIO_CACHE (and optionally MADMOM_AUDIO_CACHE_SIZE [MB])
+AUDIO_CACHE = None
+if os.environ.get('MADMOM_AUDIO_CACHE'):
+    AUDIO_CACHE = AudioCache(os.environ['MADMOM_AUDIO_CACHE'])
+    if os.environ.get('MADMOM_AUDIO_CACHE_SIZE'):
+        AUDIO_CACHE.max_size = float(os.environ['MADMOM_AUDIO_CACHE_SIZE'])
+
+
 def load_ffmpeg_file(filename, sample_rate=None, num_channels=None,
                      start=None, stop=None, dtype=None,
-                     cmd_decode='ffmpeg', cmd_probe='ffprobe'):
+                     cmd_decode='ffmpeg', cmd_probe='ffprobe', cache=None):
     """
     Load the audio data from the given file and return it as a numpy array.
 
@@ -383,6 +655,10 @@ def load_ffmpeg_file(filename, sample_rate=None, num_channels=None,
         Decoding command (defaults to ffmpeg, alternatively supports avconv).
     cmd_probe : {'ffprobe', 'avprobe'}, optional
         Probing command (defaults to ffprobe, alternatively supports avprobe).
+    cache : :class:`AudioCache`, str or bool, optional
+        Cache (directory) for the decoded audio files; 'None' uses the default
+        cache (if enabled), 'True' requires the default cache to be enabled,
+        'False' disables caching.
 
     Returns
     -------
@@ -391,7 +667,42 @@ def load_ffmpeg_file(filename, sample_rate=None, num_channels=None,
     sample_rate : int
         Sample rate of the audio samples.
 
+    Notes
+    -----
+    If a cache is used, the complete file is decoded (once) and the `start`
+    and `stop` positions are rounded to samples (as for wave files).
+
     """
+    # use the default cache
+    if cache is None:
+        cache = AUDIO_CACHE
+    elif cache is True:
+        if AUDIO_CACHE is None:
+            raise ValueError('no default audio cache configured, set the '
+                             'environment variable MADMOM_AUDIO_CACHE')
+        cache = AUDIO_CACHE
+    elif isinstance(cache, str):
+        cache = AudioCache(cache)
+    # load the decoded audio file from the cache
+    if cache and not isinstance(filename, Signal):
+        cached = cache.get(filename, sample_rate=sample_rate,
+                           num_channels=num_channels, dtype=dtype)
+        if cached is None:
+            signal, file_sample_rate = load_ffmpeg_file(
+                filename, sample_rate=sample_rate, num_channels=num_channels,
+                dtype=dtype, cmd_decode=cmd_decode, cmd_probe=cmd_probe,
+                cache=False)
+            cache.put(filename, signal, file_sample_rate,
+                      requested_sample_rate=sample_rate,
+                      num_channels=num_channels, dtype=dtype)
+        else:
+            signal, file_sample_rate = cached
+        # only return the desired part of the signal
+        if start is not None:
+            start = int(start * file_sample_rate)
+        if stop is not None:
+            stop = min(len(signal), int(stop * file_sample_rate))
+        return signal[start:stop], file_sample_rate
     # set default dtype
     if dtype is None:
         dtype = np.int16
@@ -403,13 +714,32 @@ def load_ffmpeg_file(filename, sample_rate=None, num_channels=None,
     max_len = None
     if stop is not None:
         max_len = stop - start
-    # convert the audio signal using ffmpeg
-    signal = np.frombuffer(decode_to_memory(filename, fmt=fmt,
-                                            sample_rate=sample_rate,
-                                            num_channels=num_channels,
-                                            skip=start, max_len=max_len,
-                                            cmd=cmd_decode),
-                           dtype=dtype)
+    # if the sample rate or number of channels is not given, decode to a wave
+    # container which carries this information, instead of probing the file
+    # with a separate process
+    if (sample_rate is None or num_channels is None) and \
+            fmt in _WAVE_FMTS and not isinstance(filename, Signal):
+        import io
+        raw = decode_to_memory(filename, fmt=fmt, sample_rate=sample_rate,
+                               num_channels=num_channels, skip=start,
+                               max_len=max_len, cmd=cmd_decode,
+                               container='wav')
+        # only parse the header from a file-like object, the samples are read
+        # directly from the (read-only) decoded bytes without copying them
+        header = io.BytesIO(raw)
+        sample_rate, num_channels = _read_wave_header(header)[:2]
+        signal = np.frombuffer(raw, dtype=dtype, offset=header.tell())
+        # ignore an incomplete last sample (e.g. padding)
+        num_samples = len(signal) // num_channels * num_channels
+        signal = signal[:num_samples]
+    else:
+        # convert the audio signal using ffmpeg
+        signal = np.frombuffer(decode_to_memory(filename, fmt=fmt,
+                                                sample_rate=sample_rate,
+                                                num_channels=num_channels,
+                                                skip=start, max_len=max_len,
+                                                cmd=cmd_decode),
+                               dtype=dtype)
     # get the needed information from the file
     if sample_rate is None or num_channels is None:
         info = get_file_info(filename, cmd=cmd_probe)
@@ -421,3 +751,155 @@ def load_ffmpeg_file(filename, sample_rate=None, num_channels=None,
     if num_channels > 1:
         signal = signal.reshape((-1, num_channels))
     return signal, sample_rate
+
+
+class FFmpegSource(FileDescriptorSource):
+    """
+    Source decoding an audio file block-wise via a persistent ffmpeg pipe.
+
+    The source can be used to feed a :class:`.signal.Stream` or can be read
+    directly with :func:`load_ffmpeg_blocks`.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the audio sound file to decode.
+    sample_rate : int, optional
+        Sample rate to re-sample the signal to [Hz]; 'None' uses the original
+        sample rate of the file.
+    num_channels : int, optional
+        Reduce or expand the signal to `num_channels` channels; 'None' uses
+        the original number of channels of the file.
+    start : float, optional
+        Start position [seconds].
+    stop : float, optional
+        Stop position [seconds].
+    dtype : numpy dtype, optional
+        Numpy dtype of the samples. If 'None', np.int16 is used.
+    cmd_decode : {'ffmpeg', 'avconv'}, optional
+        Decoding command (defaults to ffmpeg, alternatively supports avconv).
+    cmd_probe : {'ffprobe', 'avprobe'}, optional
+        Probing command (defaults to ffprobe, alternatively supports avprobe).
+
+    """
+
+    def __init__(self, filename, sample_rate=None, num_channels=None,
+                 start=None, stop=None, dtype=None, cmd_decode='ffmpeg',
+                 cmd_probe='ffprobe'):
+        # set default dtype
+        if dtype is None:
+            dtype = np.int16
+        fmt = _ffmpeg_fmt(dtype)
+        # decode to a wave container if the needed information is not given
+        container = None
+        if sample_rate is None or num_channels is None:
+            if fmt in _WAVE_FMTS:
+                container = 'wav'
+            else:
+                info = get_file_info(filename, cmd=cmd_probe)
+                if sample_rate is None:
+                    sample_rate = info['sample_rate']
+                if num_channels is None:
+                    num_channels = info['num_channels']
+        # start and stop position
+        if start is None:
+            start = 0
+        self.start = start
+        max_len = None
+        if stop is not None:
+            max_len = stop - start
+        # start decoding
+        self.cmd = cmd_decode
+        pipe, self.proc = decode_to_pipe(filename, fmt=fmt,
+                                         sample_rate=sample_rate,
+                                         num_channels=num_channels,
+                                         skip=start, max_len=max_len,
+                                         cmd=cmd_decode, container=container)
+        if container:
+            try:
+                sample_rate, num_channels = _read_wave_header(pipe)[:2]
+            except ValueError:
+                pipe.close()
+                self.proc.wait()
+                raise subprocess.CalledProcessError(self.proc.returncode or 1,
+                                                    cmd_decode)
+        self.sample_rate = sample_rate
+        super(FFmpegSource, self).__init__(pipe, num_channels=num_channels,
+                                           dtype=dtype)
+
+    def close(self):
+        """Stop decoding and close the pipe."""
+        super(FFmpegSource, self).close()
+        self.proc.wait()
+
+
+def load_ffmpeg_blocks(filename, block_size, sample_rate=None,
+                       num_channels=None, start=None, stop=None, dtype=None,
+                       cmd_decode='ffmpeg', cmd_probe='ffprobe'):
+    """
+    Load the audio data from the given file block-wise.
+
+    In contrast to :func:`load_ffmpeg_file`, the file is not decoded into
+    memory as a whole but read block by block from a persistent ffmpeg pipe,
+    hence only a single block of samples must be kept in memory.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the audio sound file to load.
+    block_size : int
+        Number of samples per block.
+    sample_rate : int, optional
+        Sample rate to re-sample the signal to [Hz]; 'None' returns the signal
+        in its original rate.
+    num_channels : int, optional
+        Reduce or expand the signal to `num_channels` channels; 'None' returns
+        the signal with its original channels.
+    start : float, optional
+        Start position [seconds].
+    stop : float, optional
+        Stop position [seconds].
+    dtype : numpy dtype, optional
+        Numpy dtype to return the signal in (supports signed and unsigned
+        8/16/32-bit integers, and single and double precision floats,
+        each in little or big endian). If 'None', np.int16 is used.
+    cmd_decode : {'ffmpeg', 'avconv'}, optional
+        Decoding command (defaults to ffmpeg, alternatively supports avconv).
+    cmd_probe : {'ffprobe', 'avprobe'}, optional
+        Probing command (defaults to ffprobe, alternatively supports avprobe).
+
+    Yields
+    ------
+    block : :class:`.signal.Signal` instance
+        Consecutive blocks of `block_size` samples (the last block may be
+        shorter). The `start` attribute of each block is set to the exact
+        position of its first sample.
+
+    See Also
+    --------
+    :func:`.signal.frame_blocks`
+        Split the blocks into frames.
+
+    """
+    source = FFmpegSource(filename, sample_rate=sample_rate,
+                          num_channels=num_channels, start=start, stop=stop,
+                          dtype=dtype, cmd_decode=cmd_decode,
+                          cmd_probe=cmd_probe)
+    try:
+        num_samples = 0
+        while True:
+            block = source.read(block_size)
+            if not len(block):
+                break
+            # position of the first sample of the block
+            position = source.start + num_samples / float(source.sample_rate)
+            yield Signal(block, sample_rate=source.sample_rate,
+                         start=position)
+            num_samples += len(block)
+            if len(block) < block_size:
+                break
+    finally:
+        # Note: this is also executed if the generator is not exhausted
+        source.close()
+    if source.proc.returncode != 0:
+        raise subprocess.CalledProcessError(source.proc.returncode, source.cmd)
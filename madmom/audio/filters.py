@@ -1562,13 +1562,15 @@ class SemitoneBandpassFilterbank(object):
     -----
     This is a time domain filterbank, thus it cannot be used as the other
     time-frequency filterbanks of this module. Instead of ``np.dot()`` use
-    ``scipy.signal.filtfilt()`` to filter a signal.
+    ``scipy.signal.filtfilt()`` to filter a signal with `filters`, or
+    (numerically more robust) ``scipy.signal.sosfiltfilt()`` with the second
+    order sections given as `sos_filters`.
 
     """
 
     def __init__(self, order=4, passband_ripple=1, stopband_rejection=50,
                  q_factor=25, fmin=27.5, fmax=4200., fref=A4):
-        from scipy.signal import ellip
+        from scipy.signal import ellip, zpk2tf, zpk2sos
         self.order = order
         self.passband_ripple = passband_ripple
         self.stopband_rejection = stopband_rejection
@@ -1580,13 +1582,16 @@ class SemitoneBandpassFilterbank(object):
         self.band_sample_rates[self.center_frequencies > 2000] = 22050
         self.band_sample_rates[self.center_frequencies < 250] = 882
         self.filters = []
+        self.sos_filters = []
         for freq, sample_rate in zip(self.center_frequencies,
                                      self.band_sample_rates):
             freqs = [(freq - freq / q_factor / 2.) * 2. / sample_rate,
                      (freq + freq / q_factor / 2.) * 2. / sample_rate]
-            self.filters.append(ellip(order, passband_ripple,
-                                      stopband_rejection, freqs,
-                                      btype='bandpass'))
+            # design the filter only once and convert it to both forms
+            zpk = ellip(order, passband_ripple, stopband_rejection, freqs,
+                        btype='bandpass', output='zpk')
+            self.filters.append(zpk2tf(*zpk))
+            self.sos_filters.append(zpk2sos(*zpk))
 
     @property
     def num_bands(self):
@@ -40,6 +40,7 @@ class HarmonicPercussiveSourceSeparation(Processor):
            Effects (DAFx), Graz, Austria, 2010.
 
     """
+    online_capable = False
     MASKING = 'binary'
     HARMONIC_FILTER = (15, 1)
     PERCUSSIVE_FILTER = (1, 15)
@@ -214,6 +214,149 @@ def remix(signal, num_channels):
                                   % (num_channels, signal.shape[1]))
 
 
+def _polyphase_filters(up, down, num_zeros=10, beta=5.):
+    """
+    Design the polyphase filters for rational resampling.
+
+    Parameters
+    ----------
+    up : int
+        Upsampling factor.
+    down : int
+        Downsampling factor.
+    num_zeros : int, optional
+        Number of zero crossings of the (low-pass) sinc filter on each side.
+    beta : float, optional
+        Shape parameter of the Kaiser window.
+
+    Returns
+    -------
+    filters : numpy array, shape (up, 2 * half_len + 1)
+        Filter coefficients for each phase.
+    half_len : int
+        Number of input samples before and after the current position each
+        output sample depends on.
+
+    """
+    # cutoff frequency relative to the Nyquist frequency of the upsampled
+    # signal, i.e. the lower of the two Nyquist frequencies
+    cutoff = 1. / max(up, down)
+    half_len = int(np.ceil(num_zeros * max(up, down) / float(up)))
+    # windowed sinc filter (scaled by `up` to compensate the zero stuffing)
+    taps = np.arange(-half_len * up, half_len * up + 1)
+    h = up * cutoff * np.sinc(cutoff * taps) * np.kaiser(len(taps), beta)
+    h = np.concatenate((h, np.zeros(up - 1)))
+    # split into the polyphase components (reversed for direct application
+    # to the input samples)
+    phases = np.arange(up)[:, np.newaxis]
+    taps = np.arange(2 * half_len + 1)[np.newaxis, :]
+    return h[phases + (2 * half_len - taps) * up], half_len
+
+
+def _resample_poly(signal, up, down, num_channels=None, block_size=8192):
+    """
+    Resample the signal by the rational factor `up` / `down`.
+
+    Parameters
+    ----------
+    signal : numpy array
+        Signal to be resampled (can be memory-mapped).
+    up : int
+        Upsampling factor.
+    down : int
+        Downsampling factor.
+    num_channels : int, optional
+        If set to 1, multi-channel signals are down-mixed to mono.
+    block_size : int, optional
+        Number of output samples computed at once.
+
+    Returns
+    -------
+    numpy array
+        Resampled signal (float64, not rescaled).
+
+    Notes
+    -----
+    The signal is filtered with a Kaiser windowed sinc filter in polyphase
+    form. Only the input samples needed for each block of output samples
+    are read (and converted to float), thus memory-mapped signals are never
+    loaded completely. The signal is mirrored at its edges.
+
+    """
+    filters, half_len = _polyphase_filters(up, down)
+    num_samples = len(signal)
+    num_out = -(-num_samples * up // down)
+    downmix = num_channels == 1 and signal.ndim > 1
+    shape = (num_out, ) if downmix else (num_out, ) + signal.shape[1:]
+    out = np.empty(shape, dtype=np.float64)
+    taps = np.arange(2 * half_len + 1)
+    for start in range(0, num_out, block_size):
+        pos = np.arange(start, min(start + block_size, num_out)) * down
+        phases = pos % up
+        pos //= up
+        # input samples needed for this block (mirrored at the edges)
+        first, last = pos[0] - half_len, pos[-1] + half_len + 1
+        data = np.asarray(signal[max(first, 0):min(last, num_samples)],
+                          dtype=np.float64)
+        if downmix:
+            data = np.mean(data, axis=-1)
+        pad = [(max(0, -first), max(0, last - num_samples))]
+        data = np.pad(data, pad + [(0, 0)] * (data.ndim - 1), mode='reflect')
+        data = data[(pos - pos[0])[:, np.newaxis] + taps]
+        out[start:start + len(pos)] = np.einsum('ij,ij...->i...',
+                                                filters[phases], data)
+    return out
+
+
+def _convert_dtype(signal, dtype, signal_dtype=None):
+    """
+    Convert the signal to the given dtype, rescaling it if needed.
+
+    Parameters
+    ----------
+    signal : numpy array
+        Signal to be converted.
+    dtype : numpy dtype
+        Desired data type.
+    signal_dtype : numpy dtype, optional
+        Data type the values of the signal refer to (e.g. for integer signals
+        processed as floats); 'None' uses the dtype of the signal.
+
+    Returns
+    -------
+    numpy array
+        Signal with the given dtype.
+
+    Notes
+    -----
+    Signed integer dtypes use the range [-2**(bits-1), 2**(bits-1)), unsigned
+    integer dtypes are offset by 2**(bits-1), float dtypes use the range
+    [-1, 1). Values exceeding the range of integer dtypes are clipped.
+
+    """
+    def scale_offset(dt):
+        dt = np.dtype(dt)
+        if dt.kind == 'f':
+            return 1., 0.
+        scale = 2. ** (8 * dt.itemsize - 1)
+        return scale, scale if dt.kind == 'u' else 0.
+
+    dtype = np.dtype(dtype)
+    if signal_dtype is None:
+        signal_dtype = signal.dtype
+    if signal.dtype == dtype and np.dtype(signal_dtype) == dtype:
+        return signal
+    in_scale, in_offset = scale_offset(signal_dtype)
+    out_scale, out_offset = scale_offset(dtype)
+    if (in_scale, in_offset) != (out_scale, out_offset):
+        signal = (np.asarray(signal, dtype=np.float64) - in_offset) * \
+                 (out_scale / in_scale) + out_offset
+    if dtype.kind in 'iu':
+        info = np.iinfo(dtype)
+        signal = np.clip(np.round(signal), info.min, info.max)
+    return signal.astype(dtype)
+
+
 def resample(signal, sample_rate, **kwargs):
     """
     Resample the signal.
@@ -225,7 +368,7 @@ def resample(signal, sample_rate, **kwargs):
     sample_rate : int
         Sample rate of the signal.
     kwargs : dict, optional
-        Keyword arguments passed to :func:`load_ffmpeg_file`.
+        Keyword arguments (`dtype`, `num_channels`) for the resampled signal.
 
     Returns
     -------
@@ -234,10 +377,10 @@ def resample(signal, sample_rate, **kwargs):
 
     Notes
     -----
-    This function uses ``ffmpeg`` to resample the signal.
+    This function uses a rational polyphase filter to resample the signal.
 
     """
-    from .ffmpeg import load_ffmpeg_file
+    from fractions import Fraction
     # is the given signal a Signal?
     if not isinstance(signal, Signal):
         raise ValueError('only Signals can resampled, not %s' % type(signal))
@@ -247,11 +390,12 @@ def resample(signal, sample_rate, **kwargs):
     dtype = kwargs.get('dtype', signal.dtype)
     num_channels = kwargs.get('num_channels', signal.num_channels)
     # resample the signal
-    signal, sample_rate = load_ffmpeg_file(signal, sample_rate=sample_rate,
-                                           num_channels=num_channels,
-                                           dtype=dtype)
+    ratio = Fraction(int(sample_rate), int(signal.sample_rate))
+    data = _resample_poly(signal, ratio.numerator, ratio.denominator,
+                          num_channels=num_channels)
+    data = remix(_convert_dtype(data, dtype, signal.dtype), num_channels)
     # return it
-    return Signal(signal, sample_rate=sample_rate)
+    return Signal(data, sample_rate=sample_rate)
 
 
 def rescale(signal, dtype=np.float32):
@@ -453,9 +597,10 @@ def load_wave_file(filename, sample_rate=None, num_channels=None, start=None,
     """
     Load the audio data from the given file and return it as a numpy array.
 
-    Only supports wave files, does not support re-sampling or arbitrary
-    channel number conversions. Reads the data as a memory-mapped file with
-    copy-on-write semantics to defer I/O costs until needed.
+    Only supports wave files, does not support arbitrary channel number
+    conversions. Reads the data as a memory-mapped file with copy-on-write
+    semantics to defer I/O costs until needed. Re-sampling and re-scaling is
+    performed block-wise on the memory-mapped data.
 
     Parameters
     ----------
@@ -492,17 +637,9 @@ def load_wave_file(filename, sample_rate=None, num_channels=None, start=None,
     the original signal without gaps or overlaps.
 
     """
+    from fractions import Fraction
     from scipy.io import wavfile
     file_sample_rate, signal = wavfile.read(filename, mmap=True)
-    # if the sample rate is not the desired one, raise exception
-    if sample_rate is not None and sample_rate != file_sample_rate:
-        raise ValueError('Requested sample rate of %f Hz, but got %f Hz and '
-                         're-sampling is not implemented.' %
-                         (sample_rate, file_sample_rate))
-    # same for the data type
-    if dtype is not None and signal.dtype != dtype:
-        raise ValueError('Requested dtype %s, but got %s and re-scaling is '
-                         'not implemented.' % (dtype, signal.dtype))
     # only request the desired part of the signal
     if start is not None:
         start = int(start * file_sample_rate)
@@ -510,9 +647,21 @@ def load_wave_file(filename, sample_rate=None, num_channels=None, start=None,
         stop = min(len(signal), int(stop * file_sample_rate))
     if start is not None or stop is not None:
         signal = signal[start: stop]
+    if dtype is None:
+        dtype = signal.dtype
+    # re-sample if needed
+    if sample_rate is not None and sample_rate != file_sample_rate:
+        ratio = Fraction(int(sample_rate), int(file_sample_rate))
+        # Note: down-mixing is performed block-wise while re-sampling
+        resampled = _resample_poly(signal, ratio.numerator, ratio.denominator,
+                                   num_channels=num_channels)
+        signal = _convert_dtype(resampled, dtype, signal.dtype)
+        file_sample_rate = sample_rate
     # up-/down-mix if needed
     if num_channels is not None:
         signal = remix(signal, num_channels)
+    # re-scale if needed
+    signal = _convert_dtype(signal, dtype)
     # return the signal
     return signal, file_sample_rate
 
@@ -551,7 +700,7 @@ def write_wave_file(signal, filename, sample_rate=None):
 
 # function for automatically determining how to open audio files
 def load_audio_file(filename, sample_rate=None, num_channels=None, start=None,
-                    stop=None, dtype=None):
+                    stop=None, dtype=None, cache=None):
     """
     Load the audio data from the given file and return it as a numpy array.
     This tries load_wave_file() load_ffmpeg_file() (for ffmpeg and avconv).
@@ -574,6 +723,11 @@ def load_audio_file(filename, sample_rate=None, num_channels=None, start=None,
         The data is returned with the given dtype. If 'None', it is returned
         with its original dtype, otherwise the signal gets rescaled. Integer
         dtypes use the complete value range, float dtypes the range [-1, +1].
+    cache : :class:`.ffmpeg.AudioCache`, str or bool, optional
+        Cache (directory) for audio files decoded with ffmpeg; 'None' uses the
+        default cache (enabled by setting the environment variable
+        MADMOM_AUDIO_CACHE), 'True' requires the default cache to be enabled,
+        'False' disables caching.
 
     Returns
     -------
@@ -588,7 +742,7 @@ def load_audio_file(filename, sample_rate=None, num_channels=None, start=None,
     sample; the sample corresponding to the `stop` value is not returned, thus
     consecutive segment starting with the previous `stop` can be concatenated
     to obtain the original signal without gaps or overlaps.
-    For all other audio files, this can not be guaranteed.
+    For all other audio files, this can only be guaranteed if they are cached.
 
     """
     from subprocess import CalledProcessError
@@ -610,17 +764,17 @@ def load_audio_file(filename, sample_rate=None, num_channels=None, start=None,
                               stop=stop, dtype=dtype)
     except ValueError:
         pass
-    # not a wave file (or other sample rate requested), try ffmpeg
+    # not a wave file, try ffmpeg
     try:
         return load_ffmpeg_file(filename, sample_rate=sample_rate,
                                 num_channels=num_channels, start=start,
-                                stop=stop, dtype=dtype)
+                                stop=stop, dtype=dtype, cache=cache)
     except OSError:
         # ffmpeg is not present, try avconv
         try:
             return load_ffmpeg_file(filename, sample_rate=sample_rate,
                                     num_channels=num_channels, start=start,
-                                    stop=stop, dtype=dtype,
+                                    stop=stop, dtype=dtype, cache=cache,
                                     cmd_decode='avconv', cmd_probe='avprobe')
         except OSError:
             error += " Try installing ffmpeg (or avconv on Ubuntu Linux)."
@@ -709,7 +863,7 @@ class Signal(np.ndarray):
 
     >>> sig = Signal('tests/data/audio/sample.wav', sample_rate=22050)
     >>> sig
-    Signal([-2470, -2553, ...,   517,   677], dtype=int16)
+    Signal([-2491, -2531, ...,   509,   692], dtype=int16)
     >>> sig.sample_rate
     22050
 
@@ -862,7 +1016,7 @@ class SignalProcessor(Processor):
     >>> proc = SignalProcessor(sample_rate=22050, num_channels=1, stop=2)
     >>> sig = proc('tests/data/audio/sample.wav')
     >>> sig
-    Signal([-2470, -2553, ...,  -173,  -265], dtype=int16)
+    Signal([-2491, -2531, ...,  -176,  -261], dtype=int16)
     >>> sig.sample_rate
     22050
     >>> sig.num_channels
@@ -1349,6 +1503,128 @@ class FramedSignal(object):
     spl = sound_pressure_level
 
 
+def frame_blocks(blocks, frame_size=FRAME_SIZE, hop_size=HOP_SIZE, fps=FPS,
+                 origin=ORIGIN, end=END_OF_SIGNAL, **kwargs):
+    """
+    Split a signal given as consecutive blocks into frames.
+
+    The frames are the same as those of a :class:`FramedSignal` of the whole
+    (concatenated) signal, but only the samples needed to build the frames
+    covered by the current block are kept in memory, i.e. the overlap of the
+    frames is carried over to the next block.
+
+    Parameters
+    ----------
+    blocks : iterable
+        Consecutive blocks of the signal, e.g. as yielded by
+        :func:`.ffmpeg.load_ffmpeg_blocks`.
+    frame_size : int, optional
+        Size of one frame [samples].
+    hop_size : float, optional
+        Progress `hop_size` samples between adjacent frames.
+    fps : float, optional
+        Use given frames per second; if set, this computes and overwrites the
+        given `hop_size` value.
+    origin : int, optional
+        Location of the window relative to the reference sample of a frame.
+    end : str, optional
+        End of signal handling (see :class:`FramedSignal`).
+    kwargs : dict, optional
+        If the blocks are no :class:`Signal` instances, they are instantiated
+        with these additional keyword arguments.
+
+    Yields
+    ------
+    frames : :class:`FramedSignal` instance
+        Consecutive frames, which can be built from the samples received so
+        far. The last one contains the remaining frames at the end of the
+        signal.
+
+    Notes
+    -----
+    As for slices of a :class:`FramedSignal`, the frames of the yielded
+    FramedSignals are positioned by adjusting their `origin`. Thus the signal
+    is split preferably at frames with an integer position; if there are none
+    (e.g. for a `hop_size` of 44100 / 86.), frames may be off by one sample.
+
+    Since all frames are computed independently, frame-wise processing (e.g.
+    STFT or spectrograms) can be performed on the yielded FramedSignals.
+
+    Examples
+    --------
+    Compute the spectrogram of an audio file decoded block-wise:
+
+    >>> from madmom.audio.ffmpeg import load_ffmpeg_blocks
+    >>> from madmom.audio.spectrogram import Spectrogram
+    >>> blocks = load_ffmpeg_blocks('tests/data/audio/sample.wav', 44100)
+    >>> spec = np.vstack([Spectrogram(frames)
+    ...                   for frames in frame_blocks(blocks, fps=100)])
+    >>> spec.shape
+    (281, 1024)
+
+    """
+    buffer = None
+    # position of the first sample in the buffer and number of samples
+    buffer_start = num_samples = 0
+    # index of the next frame
+    frame = 0
+    for block in blocks:
+        if not isinstance(block, Signal):
+            block = Signal(block, **kwargs)
+        if buffer is None:
+            # determine the hop size and numeric origin as FramedSignal does
+            frames = FramedSignal(block, frame_size=frame_size,
+                                  hop_size=hop_size, fps=fps, origin=origin,
+                                  end=end)
+            frame_size = frames.frame_size
+            hop_size = frames.hop_size
+            origin = frames.origin
+            sample_rate = block.sample_rate
+            buffer = np.asarray(block)
+        else:
+            buffer = np.concatenate((buffer, block))
+        num_samples += len(block)
+        # frames which are completely covered by the received samples
+        # Note: stop if the reference sample is not covered, since there may
+        #       be no more samples (FramedSignal does not return such frames)
+        stop = frame
+        while stop * hop_size < num_samples and \
+                int(stop * hop_size) - frame_size // 2 - origin + \
+                frame_size <= num_samples:
+            stop += 1
+        # prefer to split at frames with integer positions, since the origin
+        # of the following frames can be adjusted exactly
+        split = stop
+        while split > frame and split * hop_size != int(split * hop_size):
+            split -= 1
+        if split > frame:
+            stop = split
+        if stop > frame:
+            yield FramedSignal(Signal(buffer, sample_rate=sample_rate),
+                               frame_size=frame_size, hop_size=hop_size,
+                               origin=origin - hop_size * frame + buffer_start,
+                               num_frames=stop - frame)
+            frame = stop
+            # discard the samples not needed by the next frame
+            start = int(frame * hop_size) - frame_size // 2 - origin
+            start = min(start, num_samples)
+            if start > buffer_start:
+                buffer = buffer[start - buffer_start:]
+                buffer_start = start
+    if buffer is None:
+        return
+    # remaining frames at the end of the signal
+    if end == 'extend':
+        num_frames = int(np.floor(num_samples / float(hop_size) + 1))
+    else:
+        num_frames = int(np.ceil(num_samples / float(hop_size)))
+    if num_frames > frame:
+        yield FramedSignal(Signal(buffer, sample_rate=sample_rate),
+                           frame_size=frame_size, hop_size=hop_size,
+                           origin=origin - hop_size * frame + buffer_start,
+                           num_frames=num_frames - frame)
+
+
 class FramedSignalProcessor(Processor):
     """
     Slice a Signal into frames.
@@ -1436,6 +1712,11 @@ class FramedSignalProcessor(Processor):
         # instantiate a FramedSignal from the data and return it
         return FramedSignal(data, **args)
 
+    @property
+    def required_frame_size(self):
+        """Number of samples needed to process a frame [samples]."""
+        return self.frame_size
+
     @staticmethod
     def add_arguments(parser, frame_size=FRAME_SIZE, fps=FPS,
                       online=None):
@@ -1494,10 +1775,226 @@ class FramedSignalProcessor(Processor):
         return g
 
 
+# sources for online processing
+class StreamSource(object):
+    """
+    Abstract base class for sources of a (live) audio :class:`Stream`.
+
+    Sources deliver the raw samples of a stream on request, i.e. they must
+    implement the `read()` method.
+
+    """
+
+    def read(self, num_samples):
+        """
+        Read samples from the source (block until they are available).
+
+        Parameters
+        ----------
+        num_samples : int
+            Number of samples to read.
+
+        Returns
+        -------
+        numpy array, shape (num_samples[, num_channels])
+            Samples read from the source. Less than `num_samples` samples are
+            returned only if the end of the source is reached.
+
+        """
+        raise NotImplementedError('must be implemented by subclass.')
+
+    def start(self):
+        """Start the source."""
+        pass
+
+    def is_running(self):
+        """Source is running (i.e. delivers samples)."""
+        return True
+
+    def close(self):
+        """Close the source."""
+        pass
+
+
+class PyAudioSource(StreamSource):
+    """
+    Source reading live audio input via PyAudio.
+
+    Parameters
+    ----------
+    sample_rate : int
+        Sample rate of the signal.
+    num_channels : int, optional
+        Number of channels.
+    frames_per_buffer : int, optional
+        Number of samples per buffer of the PyAudio stream.
+
+    """
+
+    def __init__(self, sample_rate, num_channels=1, frames_per_buffer=1024):
+        # import PyAudio here and not at the module level
+        import pyaudio
+        self.num_channels = num_channels
+        # init PyAudio
+        self.pa = pyaudio.PyAudio()
+        # init a stream to read audio samples from
+        self.stream = self.pa.open(rate=sample_rate, channels=num_channels,
+                                   format=pyaudio.paFloat32, input=True,
+                                   frames_per_buffer=frames_per_buffer,
+                                   start=True)
+
+    def read(self, num_samples):
+        # get the desired number of samples (block until all are present)
+        data = self.stream.read(num_samples, exception_on_overflow=False)
+        # convert it to a numpy array
+        data = np.frombuffer(data, dtype=np.float32)
+        if self.num_channels > 1:
+            data = data.reshape(-1, self.num_channels)
+        return data
+
+    def start(self):
+        self.stream.start_stream()
+
+    def is_running(self):
+        return self.stream.is_active()
+
+    def close(self):
+        self.stream.close()
+        self.pa.terminate()
+
+
+class FileDescriptorSource(StreamSource):
+    """
+    Source reading raw (interleaved) PCM samples from a file descriptor.
+
+    Parameters
+    ----------
+    fd : int or file handle, optional
+        File descriptor or binary file handle to read from. If 'None', the
+        standard input is used.
+    num_channels : int, optional
+        Number of channels.
+    dtype : numpy dtype, optional
+        Data type of the samples.
+
+    """
+
+    def __init__(self, fd=None, num_channels=1, dtype=np.int16):
+        import io
+        if fd is None:
+            fd = 0
+        if isinstance(fd, int):
+            # do not close the file descriptor, it was opened elsewhere
+            fd = io.open(fd, 'rb', buffering=0, closefd=False)
+        self.file = fd
+        self.num_channels = num_channels
+        self.dtype = np.dtype(dtype)
+        self._eof = False
+
+    def read(self, num_samples):
+        data = np.empty((num_samples, self.num_channels), dtype=self.dtype)
+        # read directly into the array (a file may return less bytes than
+        # requested, thus read until the array is filled or EOF is reached)
+        buf = memoryview(data.view(np.uint8).ravel())
+        pos = 0
+        while pos < len(buf):
+            num_bytes = self.file.readinto(buf[pos:])
+            if not num_bytes:
+                self._eof = True
+                break
+            pos += num_bytes
+        # keep only complete samples
+        data = data[:pos // (self.num_channels * self.dtype.itemsize)]
+        if self.num_channels == 1:
+            data = data[:, 0]
+        return data
+
+    def is_running(self):
+        return not self._eof
+
+    def close(self):
+        self.file.close()
+
+
+class UnixSocketSource(FileDescriptorSource):
+    """
+    Source reading raw (interleaved) PCM samples from a Unix domain socket.
+
+    Parameters
+    ----------
+    address : str or socket
+        Path of the socket to connect to or a connected socket.
+    num_channels : int, optional
+        Number of channels.
+    dtype : numpy dtype, optional
+        Data type of the samples.
+
+    """
+
+    def __init__(self, address, num_channels=1, dtype=np.int16):
+        import socket
+        if isinstance(address, socket.socket):
+            sock = address
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(address)
+        self.socket = sock
+        super(UnixSocketSource, self).__init__(
+            sock.makefile('rb'), num_channels=num_channels, dtype=dtype)
+
+    def close(self):
+        super(UnixSocketSource, self).close()
+        self.socket.close()
+
+
+class RawFileSource(FileDescriptorSource):
+    """
+    Source playing back a file with raw (interleaved) PCM samples.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    sample_rate : int
+        Sample rate of the signal.
+    num_channels : int, optional
+        Number of channels.
+    dtype : numpy dtype, optional
+        Data type of the samples.
+    speed : float, optional
+        Play back the file `speed` times faster than real-time; if 'None',
+        the samples are delivered as fast as possible.
+
+    """
+
+    def __init__(self, filename, sample_rate, num_channels=1, dtype=np.int16,
+                 speed=1.):
+        super(RawFileSource, self).__init__(
+            open(filename, 'rb'), num_channels=num_channels, dtype=dtype)
+        self.sample_rate = sample_rate
+        self.speed = speed
+        self._start_time = None
+        self._num_samples = 0
+
+    def read(self, num_samples):
+        import time
+        if self._start_time is None:
+            self._start_time = time.time()
+        data = super(RawFileSource, self).read(num_samples)
+        self._num_samples += len(data)
+        # wait until the samples would have been available in real-time
+        if self.speed:
+            delay = self._start_time - time.time() + self._num_samples / \
+                float(self.sample_rate * self.speed)
+            if delay > 0:
+                time.sleep(delay)
+        return data
+
+
 # class for online processing
 class Stream(object):
     """
-    A Stream handles live (i.e. online, real-time) audio input via PyAudio.
+    A Stream handles live (i.e. online, real-time) audio input.
 
     Parameters
     ----------
@@ -1506,95 +2003,99 @@ class Stream(object):
     num_channels : int, optional
         Number of channels.
     dtype : numpy dtype, optional
-        Data type for the signal.
+        Data type for the signal. Integer samples delivered by the source are
+        rescaled to the range [-1, 1] if a float dtype is given.
     frame_size : int, optional
         Size of one frame [samples].
-    hop_size : int, optional
+    hop_size : float, optional
         Progress `hop_size` samples between adjacent frames.
     fps : float, optional
         Use given frames per second; if set, this computes and overwrites the
-        given `hop_size` value (the resulting `hop_size` must be an integer).
-    queue_size : int
-        Size of the FIFO (first in first out) queue. If the queue is full and
-        new audio samples arrive, the oldest item in the queue will be dropped.
+        given `hop_size` value.
+    source : :class:`StreamSource` instance, optional
+        Source delivering the audio samples. If 'None', the system's audio
+        input is captured via PyAudio.
 
     Notes
     -----
     Stream is implemented as an iterable which blocks until enough new data is
     available.
 
+    The samples are kept in a circular buffer and each frame returned is a
+    view of the last `frame_size` samples, i.e. it is only valid until the
+    next frame is requested.
+
+    Fractional hop sizes are supported, the frames are located at the
+    (truncated) positions of multiples of `hop_size`.
+
     """
 
     def __init__(self, sample_rate=SAMPLE_RATE, num_channels=NUM_CHANNELS,
                  dtype=np.float32, frame_size=FRAME_SIZE, hop_size=HOP_SIZE,
-                 fps=FPS, **kwargs):
-        # import PyAudio here and not at the module level
-        import pyaudio
+                 fps=FPS, source=None, **kwargs):
+        # pylint: disable=unused-argument
         # set attributes
         self.sample_rate = sample_rate
-        self.num_channels = 1 if None else num_channels
+        self.num_channels = 1 if num_channels is None else num_channels
         self.dtype = dtype
-        if frame_size:
-            self.frame_size = int(frame_size)
+        self.frame_size = int(frame_size)
         if fps:
             # use fps instead of hop_size
             hop_size = self.sample_rate / float(fps)
-        if int(hop_size) != hop_size:
-            raise ValueError(
-                'only integer `hop_size` supported, not %s' % hop_size)
-        self.hop_size = int(hop_size)
-        # init PyAudio
-        self.pa = pyaudio.PyAudio()
-        # init a stream to read audio samples from
-        self.stream = self.pa.open(rate=self.sample_rate,
-                                   channels=self.num_channels,
-                                   format=pyaudio.paFloat32, input=True,
-                                   frames_per_buffer=self.hop_size,
-                                   start=True)
-        # create a buffer
-        self.buffer = BufferProcessor(self.frame_size)
+        self.hop_size = float(hop_size)
+        # use PyAudio if no other source is given
+        if source is None:
+            source = PyAudioSource(self.sample_rate, self.num_channels,
+                                   frames_per_buffer=int(self.hop_size))
+        self.source = source
+        # create a (circular) buffer
+        init = np.zeros(self.shape[1:], dtype=self.dtype)
+        self.buffer = BufferProcessor(init=init)
         # frame index counter
         self.frame_idx = 0
-        # PyAudio flags
-        self.paComplete = pyaudio.paComplete
-        self.paContinue = pyaudio.paContinue
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        # get the desired number of samples (block until all are present)
-        data = self.stream.read(self.hop_size, exception_on_overflow=False)
-        # convert it to a numpy array
-        data = np.fromstring(data, 'float32').astype(self.dtype, copy=False)
-        # buffer the data (i.e. append hop_size samples and rotate)
+        # number of samples needed to advance to the next frame
+        num_samples = (int((self.frame_idx + 1) * self.hop_size) -
+                       int(self.frame_idx * self.hop_size))
+        # get the samples (block until all are present)
+        data = self.source.read(num_samples)
+        if not len(data):
+            raise StopIteration
+        # rescale integer samples (e.g. raw PCM) to the range of float dtypes
+        # Note: rescale() uses the same scaling as the STFT of integer signals
+        if np.dtype(self.dtype).kind == 'f' and data.dtype.kind == 'i':
+            data = rescale(data, self.dtype)
+        # buffer the data (i.e. append the samples to the circular buffer)
         data = self.buffer(data)
         # wrap the last frame_size samples as a Signal
-        # TODO: check float / int hop size; theoretically a float hop size
-        #       can be accomplished by making the buffer N samples bigger and
-        #       take the correct portion of the buffer
-        start = (self.frame_idx * float(self.hop_size) / self.sample_rate)
-        signal = Signal(data[-self.frame_size:], sample_rate=self.sample_rate,
-                        dtype=self.dtype, num_channels=self.num_channels,
-                        start=start)
+        start = self.frame_idx * self.hop_size / self.sample_rate
+        signal = Signal(data, sample_rate=self.sample_rate, start=start)
         # increment the frame index
         self.frame_idx += 1
         return signal
 
     next = __next__
 
+    def start(self):
+        """Start the stream."""
+        self.source.start()
+
     def is_running(self):
-        return self.stream.is_active()
+        """Stream is running."""
+        return self.source.is_running()
 
     def close(self):
-        self.stream.close()
-        # TODO: is this the correct place to terminate PyAudio?
-        self.pa.terminate()
+        """Close the stream."""
+        self.source.close()
 
     @property
     def shape(self):
         """Shape of the Stream (None, frame_size[, num_channels])."""
         shape = None, self.frame_size
-        if self.signal.num_channels != 1:
-            shape += (self.signal.num_channels,)
+        if self.num_channels != 1:
+            shape += (self.num_channels,)
         return shape
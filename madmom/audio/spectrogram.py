@@ -1481,6 +1481,42 @@ class MultiBandSpectrogramProcessor(Processor):
         return MultiBandSpectrogram(data, **args)
 
 
+def _frame_energy(signal, frame_size, hop_size, num_frames):
+    """
+    Compute the energy of the frames of a signal.
+
+    The frames are positioned as by :class:`.signal.FramedSignal` (i.e.
+    centered around their reference sample and padded with zeros), but the
+    energies are computed from the cumulative sum of the squared signal
+    without actually framing the signal.
+
+    Parameters
+    ----------
+    signal : numpy array
+        Signal.
+    frame_size : int
+        Size of one frame [samples].
+    hop_size : float
+        Distance between adjacent frames [samples].
+    num_frames : int
+        Number of frames.
+
+    Returns
+    -------
+    numpy array
+        Energy of the frames.
+
+    """
+    # cumulative energy, the zero is needed for frames starting at 0
+    energy = np.concatenate(([0], np.cumsum(np.asarray(signal,
+                                                       dtype=np.float) ** 2)))
+    # start and stop positions of the frames (limited to the signal)
+    start = (np.arange(num_frames) * hop_size).astype(np.int) - frame_size // 2
+    stop = np.clip(start + frame_size, 0, len(signal))
+    start = np.clip(start, 0, len(signal))
+    return energy[stop] - energy[start]
+
+
 class SemitoneBandpassSpectrogram(FilteredSpectrogram):
     """
     Construct a semitone spectrogram by using a time domain filterbank of
@@ -1512,45 +1548,56 @@ class SemitoneBandpassSpectrogram(FilteredSpectrogram):
         pass
 
     def __new__(cls, signal, fps=50., fmin=27.5, fmax=4200.):
-        from scipy.signal import filtfilt
         from .filters import SemitoneBandpassFilterbank
-        from .signal import FramedSignal, Signal, energy, resample
+        from .signal import Signal, resample
+        try:
+            from scipy.signal import sosfiltfilt
+        except ImportError:
+            # scipy < 0.18
+            sosfiltfilt = None
         # check if we got a mono Signal
         if not isinstance(signal, Signal) or signal.num_channels != 1:
             signal = Signal(signal, num_channels=1)
         sample_rate = float(signal.sample_rate)
-        # keep a reference to the original signal
-        signal_ = signal
         # determine how many frames the filtered signal will have
-        num_frames = np.round(len(signal) * fps / sample_rate) + 1
+        num_frames = int(np.round(len(signal) * fps / sample_rate) + 1)
         # compute the energy of the frames of the bandpass filtered signal
         filterbank = SemitoneBandpassFilterbank(fmin=fmin, fmax=fmax)
-        bands = []
-        for filt, band_sample_rate in zip(filterbank.filters,
-                                          filterbank.band_sample_rates):
-            # frames should overlap 50%
-            frame_size = np.round(2 * band_sample_rate / float(fps))
+        band_sample_rates = np.asarray(filterbank.band_sample_rates)
+        bands = np.empty((num_frames, filterbank.num_bands))
+        # process all bands with the same sample rate together, thus the
+        # signal must be re-sampled only once per sample rate
+        for band_sample_rate in np.unique(band_sample_rates):
             # down-sample audio if needed
+            band_signal = signal
             if band_sample_rate != signal.sample_rate:
-                signal = resample(signal_, band_sample_rate)
-            # filter the signal
-            b, a = filt
-            filtered_signal = filtfilt(b, a, signal)
+                band_signal = resample(signal, band_sample_rate)
             # normalise the signal if it has an integer dtype
             try:
-                filtered_signal /= np.iinfo(signal.dtype).max
+                norm = float(np.iinfo(band_signal.dtype).max)
             except ValueError:
-                pass
-            # split into overlapping frames
-            frames = FramedSignal(filtered_signal, frame_size=frame_size,
-                                  fps=fps, sample_rate=band_sample_rate,
-                                  num_frames=num_frames)
-            # compute total energy of the frames
-            # Note: the energy of the signal is computed with respect to the
-            #       reference sampling rate as in the MATLAB chroma toolbox
-            bands.append(energy(frames) / band_sample_rate * 22050.)
+                norm = 1.
+            # frames should overlap 50%
+            frame_size = int(np.round(2 * band_sample_rate / float(fps)))
+            hop_size = band_sample_rate / float(fps)
+            for band in np.nonzero(band_sample_rates == band_sample_rate)[0]:
+                # filter the signal
+                if sosfiltfilt is None:
+                    from scipy.signal import filtfilt
+                    b, a = filterbank.filters[band]
+                    filtered_signal = filtfilt(b, a, band_signal)
+                else:
+                    filtered_signal = sosfiltfilt(
+                        filterbank.sos_filters[band], band_signal)
+                # compute total energy of the frames
+                # Note: the energy of the signal is computed with respect to
+                #       the reference sampling rate as in the MATLAB chroma
+                #       toolbox
+                bands[:, band] = _frame_energy(
+                    filtered_signal / norm, frame_size, hop_size,
+                    num_frames) / band_sample_rate * 22050.
         # cast as SemitoneBandpassSpectrogram
-        obj = np.vstack(bands).T.view(cls)
+        obj = bands.view(cls)
         # save additional attributes
         obj.filterbank = filterbank
         obj.fps = fps
@@ -10,6 +10,10 @@ Evaluation package.
 
 from __future__ import absolute_import, division, print_function
 
+import multiprocessing as mp
+import os
+import warnings
+
 import numpy as np
 
 
@@ -709,6 +713,170 @@ class MeanEvaluation(SumEvaluation):
         return ret
 
 
+# class for summarising Evaluations
+class EvaluationSummary(EvaluationMixin):
+    """
+    Lightweight summary of an evaluation object.
+
+    The summary keeps the name, the counters and the metrics of the evaluation
+    object, but not the arrays with the individual true/false positive and
+    negative detections. It can be used instead of the evaluation object to
+    create sum and mean evaluations.
+
+    Parameters
+    ----------
+    eval_object : evaluation object
+        Evaluation object to be summarised.
+
+    """
+    # attributes needed by the sum and mean evaluation classes
+    ATTRIBUTES = ['num_tp', 'num_fp', 'num_tn', 'num_fn', 'num_annotations',
+                  'mean_error', 'std_error', 'error_histogram', 'window']
+    # attributes which are not kept
+    IGNORE = ['tp', 'fp', 'tn', 'fn']
+
+    def __init__(self, eval_object):
+        self.name = eval_object.name
+        self.METRIC_NAMES = [m for m in eval_object.METRIC_NAMES
+                             if m[0] not in self.IGNORE]
+        self.FLOAT_FORMAT = eval_object.FLOAT_FORMAT
+        # copy all available attributes & metrics
+        attributes = self.ATTRIBUTES + [m[0] for m in self.METRIC_NAMES]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for attr_name in attributes:
+                try:
+                    setattr(self, attr_name, getattr(eval_object, attr_name))
+                except AttributeError:
+                    pass
+        # number of errors (needed to combine the error statistics)
+        errors = getattr(eval_object, 'errors', None)
+        if errors is not None:
+            self.num_errors = len(errors)
+        try:
+            self._length = len(eval_object)
+        except (NotImplementedError, TypeError):
+            self._length = None
+
+    def __len__(self):
+        """Length of the summarised evaluation object."""
+        if self._length is None:
+            raise NotImplementedError('summarised object has no length.')
+        return self._length
+
+
+def combine_errors(eval_objects):
+    """
+    Combine the error statistics of the given evaluation objects.
+
+    Parameters
+    ----------
+    eval_objects : list
+        Evaluation objects (or summaries thereof).
+
+    Returns
+    -------
+    mean_error : float
+        Mean of all errors.
+    std_error : float
+        Standard deviation of all errors.
+
+    Notes
+    -----
+    The statistics are combined from the number, mean and standard deviation
+    of the errors of the individual evaluation objects, thus the same results
+    as for the concatenated errors are obtained without keeping them.
+
+    """
+    num = 0
+    mean = 0.
+    m2 = 0.
+    for e in eval_objects:
+        n = getattr(e, 'num_errors', None)
+        if n is None:
+            n = len(e.errors)
+        if n == 0:
+            continue
+        # combine with the running statistics (Chan et al.)
+        delta = e.mean_error - mean
+        total = num + n
+        mean += delta * n / total
+        m2 += e.std_error ** 2 * n + delta ** 2 * num * n / total
+        num = total
+    if num == 0:
+        return np.nan, np.nan
+    return mean, np.sqrt(m2 / num)
+
+
+def _evaluate_file(task):
+    """
+    Evaluate a single pair of detection and annotation files.
+
+    Parameters
+    ----------
+    task : tuple (eval_class, det_file, ann_file, summarise, kwargs)
+        Evaluation class, detection and annotation files, flag whether to
+        summarise the evaluation object and keyword arguments passed to the
+        evaluation class.
+
+    Returns
+    -------
+    evaluation object or :class:`EvaluationSummary`
+        Evaluation of the files.
+
+    """
+    eval_class, det_file, ann_file, summarise, kwargs = task
+    e = eval_class(det_file, ann_file, name=os.path.basename(ann_file),
+                   **kwargs)
+    if summarise:
+        return EvaluationSummary(e)
+    return e
+
+
+def evaluate_files(files, eval_class, num_workers=1, summarise=False,
+                   **kwargs):
+    """
+    Evaluate pairs of detection and annotation files.
+
+    Parameters
+    ----------
+    files : list of tuples (det_file, ann_file)
+        Pairs of detection and annotation files to be evaluated.
+    eval_class : evaluation class
+        Class used to evaluate the files.
+    num_workers : int, optional
+        Number of parallel working processes.
+    summarise : bool, optional
+        Return only :class:`EvaluationSummary` objects of the evaluations.
+    kwargs : dict, optional
+        Keyword arguments passed to `eval_class`.
+
+    Yields
+    ------
+    evaluation object or :class:`EvaluationSummary`
+        Evaluations of the files (in the same order as the files).
+
+    Notes
+    -----
+    The keyword arguments must be picklable if `num_workers` > 1.
+
+    """
+    tasks = ((eval_class, det_file, ann_file, summarise, kwargs)
+             for det_file, ann_file in files)
+    if num_workers is None or num_workers <= 1 or len(files) <= 1:
+        for task in tasks:
+            yield _evaluate_file(task)
+        return
+    # send multiple files to each worker at once to reduce overhead
+    chunk_size = max(1, min(64, len(files) // (num_workers * 4)))
+    pool = mp.Pool(num_workers)
+    try:
+        for e in pool.imap(_evaluate_file, tasks, chunk_size):
+            yield e
+    finally:
+        pool.terminate()
+
+
 def tostring(eval_objects, **kwargs):
     """
     Format the given evaluation objects as human readable strings.
@@ -865,6 +1033,10 @@ def evaluation_io(parser, ann_suffix, det_suffix, ann_dir=None, det_dir=None):
     g.add_argument('-i', '--ignore_non_existing', action='store_true',
                    help='ignore non-existing detections [default: raise a '
                         'warning and assume empty detections]')
+    # parallel evaluation
+    g.add_argument('-j', dest='num_workers', type=int, default=1,
+                   help='number of parallel working processes '
+                        '[default=%(default)s]')
     # verbose
     parser.add_argument('-v', '--verbose', action='count', default=0,
                         help='increase verbosity level')
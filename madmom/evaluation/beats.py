@@ -31,8 +31,8 @@ from __future__ import absolute_import, division, print_function
 import warnings
 import numpy as np
 
-from . import (find_closest_matches, calc_errors, calc_absolute_errors,
-               evaluation_io, MeanEvaluation)
+from . import (find_closest_matches, calc_errors, evaluation_io,
+               MeanEvaluation)
 from .onsets import OnsetEvaluation
 from ..utils import suppress_warnings
 
@@ -356,6 +356,132 @@ def calc_relative_errors(detections, annotations, matches=None):
     return errors / intervals
 
 
+class BeatContext(object):
+    """
+    Shared matching context of beat detections and annotations.
+
+    The closest matches, errors and intervals of the detections with respect
+    to the annotations are computed only once (when first needed) and can be
+    re-used by all evaluation metrics.
+
+    Parameters
+    ----------
+    detections : list or numpy array
+        Detected beats.
+    annotations : list or numpy array
+        Annotated beats.
+
+    Notes
+    -----
+    The sequences must be ordered.
+
+    """
+
+    def __init__(self, detections, annotations):
+        # make sure the annotations and detections have a float dtype
+        self.detections = np.asarray(detections, dtype=np.float)
+        self.annotations = np.asarray(annotations, dtype=np.float)
+        self._cache = {}
+
+    def _cached(self, name, func):
+        """Compute the value with the given function only once."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = func()
+            return value
+
+    @property
+    def matches(self):
+        """Indices of the closest annotations to the detections."""
+        return self._cached('matches', lambda: find_closest_matches(
+            self.detections, self.annotations))
+
+    @property
+    def errors(self):
+        """Errors of the detections to the closest annotations."""
+        return self._cached('errors', lambda: calc_errors(
+            self.detections, self.annotations, self.matches))
+
+    @property
+    def absolute_errors(self):
+        """Absolute errors of the detections to the closest annotations."""
+        return self._cached('absolute_errors', lambda: np.abs(self.errors))
+
+    @property
+    def closest_intervals(self):
+        """Closest annotated intervals to the detections."""
+        return self._cached('closest_intervals', self._closest_intervals)
+
+    def _closest_intervals(self):
+        """Closest annotated intervals (re-using the matches and errors)."""
+        if len(self.detections) == 0:
+            return np.zeros(0, dtype=np.float)
+        if len(self.annotations) < 2:
+            raise BeatIntervalError
+        # see find_closest_intervals()
+        intervals = np.zeros(len(self.annotations) + 1)
+        intervals[1:-1] = np.diff(self.annotations)
+        intervals[0] = intervals[1]
+        intervals[-1] = intervals[-2]
+        # detections after the annotations use the interval to the next one
+        return intervals[self.matches + (self.errors > 0)]
+
+    @property
+    def relative_errors(self):
+        """Errors relative to the closest annotated intervals."""
+        return self._cached('relative_errors',
+                            lambda: self.errors / self.closest_intervals)
+
+    @property
+    def detection_intervals(self):
+        """Intervals of the detections to the previous detections."""
+        return self._cached('detection_intervals',
+                            lambda: calc_intervals(self.detections))
+
+    @property
+    def annotation_intervals(self):
+        """Intervals of the annotations to the previous annotations."""
+        return self._cached('annotation_intervals',
+                            lambda: calc_intervals(self.annotations))
+
+    @property
+    def reverse(self):
+        """Context with detections and annotations swapped."""
+        return self._cached('reverse', self._reverse)
+
+    def _reverse(self):
+        """Create the reverse context (sharing the computed intervals)."""
+        context = BeatContext(self.annotations, self.detections)
+        for name, other in (('detection_intervals', 'annotation_intervals'),
+                            ('annotation_intervals', 'detection_intervals')):
+            if name in self._cache:
+                context._cache[other] = self._cache[name]
+        context._cache['reverse'] = self
+        return context
+
+    def variation(self, annotations):
+        """
+        Create a context for the same detections but other annotations.
+
+        Parameters
+        ----------
+        annotations : list or numpy array
+            Annotated beats (e.g. a variation of the annotations).
+
+        Returns
+        -------
+        :class:`BeatContext`
+            Context sharing the detection intervals with this one.
+
+        """
+        context = BeatContext(self.detections, annotations)
+        if 'detection_intervals' in self._cache:
+            context._cache['detection_intervals'] = \
+                self._cache['detection_intervals']
+        return context
+
+
 # default beat evaluation parameter values
 FMEASURE_WINDOW = 0.07
 PSCORE_TOLERANCE = 0.2
@@ -369,7 +495,8 @@ INFORMATION_GAIN_BINS = 40
 
 
 # evaluation functions for beat detection
-def pscore(detections, annotations, tolerance=PSCORE_TOLERANCE):
+def pscore(detections, annotations, tolerance=PSCORE_TOLERANCE,
+           context=None):
     """
     Calculate the P-score accuracy for the given detections and annotations.
 
@@ -385,6 +512,8 @@ def pscore(detections, annotations, tolerance=PSCORE_TOLERANCE):
         Annotated beats.
     tolerance : float, optional
         Evaluation tolerance (fraction of the median beat interval).
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -421,13 +550,15 @@ def pscore(detections, annotations, tolerance=PSCORE_TOLERANCE):
         raise ValueError("`tolerance` must be greater than 0.")
 
     # make sure the annotations and detections have a float dtype
-    detections = np.asarray(detections, dtype=np.float)
-    annotations = np.asarray(annotations, dtype=np.float)
+    if context is None:
+        context = BeatContext(detections, annotations)
+    detections = context.detections
+    annotations = context.annotations
 
     # the error window is the given fraction of the median beat interval
     window = tolerance * np.median(np.diff(annotations))
     # errors
-    errors = calc_absolute_errors(detections, annotations)
+    errors = context.absolute_errors
     # count the instances where the error is smaller or equal than the window
     p = len(detections[errors <= window])
     # normalize by the max number of detections/annotations
@@ -436,7 +567,7 @@ def pscore(detections, annotations, tolerance=PSCORE_TOLERANCE):
     return p
 
 
-def cemgil(detections, annotations, sigma=CEMGIL_SIGMA):
+def cemgil(detections, annotations, sigma=CEMGIL_SIGMA, context=None):
     """
     Calculate the Cemgil accuracy for the given detections and annotations.
 
@@ -448,6 +579,8 @@ def cemgil(detections, annotations, sigma=CEMGIL_SIGMA):
         Annotated beats.
     sigma : float, optional
         Sigma for Gaussian error function.
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -473,15 +606,15 @@ def cemgil(detections, annotations, sigma=CEMGIL_SIGMA):
         raise ValueError("`sigma` must be greater than 0.")
 
     # make sure the annotations and detections have a float dtype
-    detections = np.asarray(detections, dtype=np.float)
-    annotations = np.asarray(annotations, dtype=np.float)
+    if context is None:
+        context = BeatContext(detections, annotations)
 
     # determine the abs. errors of the detections to the closest annotations
     # Note: the original implementation searches for the closest matches of
     #       detections given the annotations. Since absolute errors > a usual
     #       beat interval produce high errors (and thus in turn add negligible
     #       values to the accuracy), it is safe to swap those two.
-    errors = calc_absolute_errors(detections, annotations)
+    errors = context.absolute_errors
     # apply a Gaussian error function with the given std. dev. on the errors
     acc = np.exp(-(errors ** 2.) / (2. * (sigma ** 2.)))
     # and sum up the accuracy
@@ -493,7 +626,7 @@ def cemgil(detections, annotations, sigma=CEMGIL_SIGMA):
 
 
 def goto(detections, annotations, threshold=GOTO_THRESHOLD, sigma=GOTO_SIGMA,
-         mu=GOTO_MU):
+         mu=GOTO_MU, context=None):
     """
     Calculate the Goto and Muraoka accuracy for the given detections and
     annotations.
@@ -510,6 +643,8 @@ def goto(detections, annotations, threshold=GOTO_THRESHOLD, sigma=GOTO_SIGMA,
         Allowed std. dev. of the errors in the longest segment.
     mu : float, optional
         Allowed mean. of the errors in the longest segment.
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -551,18 +686,18 @@ def goto(detections, annotations, threshold=GOTO_THRESHOLD, sigma=GOTO_SIGMA,
         raise ValueError("Threshold, sigma and mu must be positive.")
 
     # make sure the annotations and detections have a float dtype
-    detections = np.asarray(detections, dtype=np.float)
-    annotations = np.asarray(annotations, dtype=np.float)
+    if context is None:
+        context = BeatContext(detections, annotations)
 
     # get the indices of the closest detections to the annotations to determine
     # the longest continuous segment
-    closest = find_closest_matches(annotations, detections)
+    closest = context.reverse.matches
     # keep only those which have abs(errors) <= threshold
     # Note: both the original paper and the Matlab implementation normalize by
     #       half a beat interval, thus our threshold is halved (same applies to
     #       sigma and mu)
     # errors of the detections relative to the surrounding annotation interval
-    errors = calc_relative_errors(detections, annotations)
+    errors = context.relative_errors
     # the absolute error must be smaller than the given threshold
     closest = closest[np.abs(errors[closest]) <= threshold]
     # get the length and start position of the longest continuous segment
@@ -591,7 +726,7 @@ def goto(detections, annotations, threshold=GOTO_THRESHOLD, sigma=GOTO_SIGMA,
 
 
 def cml(detections, annotations, phase_tolerance=CONTINUITY_PHASE_TOLERANCE,
-        tempo_tolerance=CONTINUITY_TEMPO_TOLERANCE):
+        tempo_tolerance=CONTINUITY_TEMPO_TOLERANCE, context=None):
     """
     Calculate the cmlc and cmlt scores for the given detections and
     annotations.
@@ -606,6 +741,8 @@ def cml(detections, annotations, phase_tolerance=CONTINUITY_PHASE_TOLERANCE,
         Allowed phase tolerance.
     tempo_tolerance : float, optional
         Allowed tempo tolerance.
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -647,17 +784,19 @@ def cml(detections, annotations, phase_tolerance=CONTINUITY_PHASE_TOLERANCE,
         raise ValueError("Tempo and phase tolerances must be greater than 0")
 
     # make sure the annotations and detections have a float dtype
-    detections = np.asarray(detections, dtype=np.float)
-    annotations = np.asarray(annotations, dtype=np.float)
+    if context is None:
+        context = BeatContext(detections, annotations)
+    detections = context.detections
+    annotations = context.annotations
 
     # determine closest annotations to detections
-    closest = find_closest_matches(detections, annotations)
+    closest = context.matches
     # errors of the detections wrt. to the annotations
-    errors = calc_absolute_errors(detections, annotations, closest)
+    errors = context.absolute_errors
     # detection intervals
-    det_interval = calc_intervals(detections)
+    det_interval = context.detection_intervals
     # annotation intervals (get those intervals at the correct positions)
-    ann_interval = calc_intervals(annotations)[closest]
+    ann_interval = context.annotation_intervals[closest]
     # a detection is correct, if it fulfills 2 conditions:
     # 1) must match an annotation within a certain tolerance window, i.e. the
     #    phase must be correct
@@ -691,7 +830,7 @@ def cml(detections, annotations, phase_tolerance=CONTINUITY_PHASE_TOLERANCE,
 def continuity(detections, annotations,
                phase_tolerance=CONTINUITY_PHASE_TOLERANCE,
                tempo_tolerance=CONTINUITY_TEMPO_TOLERANCE,
-               offbeat=True, double=True, triple=True):
+               offbeat=True, double=True, triple=True, context=None):
     """
     Calculate the cmlc, cmlt, amlc and amlt scores for the given detections and
     annotations.
@@ -712,6 +851,8 @@ def continuity(detections, annotations,
         Include double and half tempo variations (and offbeat thereof).
     triple  : bool, optional
         Include triple and third tempo variations (and offbeats thereof).
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -736,8 +877,12 @@ def continuity(detections, annotations,
     if len(detections) <= 1 or len(annotations) <= 1:
         return 0., 0., 0., 0.
 
+    if context is None:
+        context = BeatContext(detections, annotations)
+
     # evaluate the correct tempo
-    cmlc, cmlt = cml(detections, annotations, tempo_tolerance, phase_tolerance)
+    cmlc, cmlt = cml(detections, annotations, tempo_tolerance, phase_tolerance,
+                     context)
     amlc = cmlc
     amlt = cmlt
     # speed up calculation by skipping other metrical levels if the score is
@@ -748,8 +893,9 @@ def continuity(detections, annotations,
 
     # create different variants of the annotations:
     # Note: double also includes half as does triple third, respectively
-    sequences = variations(annotations, offbeat=offbeat, double=double,
-                           half=double, triple=triple, third=triple)
+    sequences = variations(context.annotations, offbeat=offbeat,
+                           double=double, half=double, triple=triple,
+                           third=triple)
     # evaluate these metrical variants
     for sequence in sequences:
         # if other metrical levels achieve higher accuracies, take these values
@@ -757,7 +903,8 @@ def continuity(detections, annotations,
             # Note: catch the IntervalError here, because the beat variants
             #       could be too short for valid interval calculation;
             #       ok, since we already have valid values for amlc & amlt
-            c, t = cml(detections, sequence, tempo_tolerance, phase_tolerance)
+            c, t = cml(detections, sequence, tempo_tolerance,
+                       phase_tolerance, context.variation(sequence))
         except BeatIntervalError:
             c, t = np.nan, np.nan
         amlc = max(amlc, c)
@@ -804,7 +951,7 @@ def _histogram_bins(num_bins):
     return np.linspace(-0.5 - offset, 0.5 + offset, num_bins + 2)
 
 
-def _error_histogram(detections, annotations, histogram_bins):
+def _error_histogram(detections, annotations, histogram_bins, context=None):
     """
     Helper function to calculate the relative errors of the given detections
     and annotations and map them to an histogram with the given bins edges.
@@ -817,6 +964,8 @@ def _error_histogram(detections, annotations, histogram_bins):
         Annotated beats.
     histogram_bins : numpy array
         Beat error histogram bin edges.
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -831,7 +980,9 @@ def _error_histogram(detections, annotations, histogram_bins):
 
     """
     # get the relative errors of the detections to the annotations
-    errors = calc_relative_errors(detections, annotations)
+    if context is None:
+        context = BeatContext(detections, annotations)
+    errors = context.relative_errors
     # map the relative beat errors to the range of -0.5..0.5
     errors = np.mod(errors + 0.5, -1) + 0.5
     # get bin counts for the given errors over the distribution
@@ -893,7 +1044,8 @@ def _information_gain(error_histogram):
     return np.log2(len(error_histogram)) - entropy
 
 
-def information_gain(detections, annotations, num_bins=INFORMATION_GAIN_BINS):
+def information_gain(detections, annotations, num_bins=INFORMATION_GAIN_BINS,
+                     context=None):
     """
     Calculate information gain for the given detections and annotations.
 
@@ -905,6 +1057,8 @@ def information_gain(detections, annotations, num_bins=INFORMATION_GAIN_BINS):
         Annotated beats.
     num_bins : int, optional
         Number of bins for the beat error histogram.
+    context : :class:`BeatContext`, optional
+        Pre-computed matching context of the detections and annotations.
 
     Returns
     -------
@@ -950,13 +1104,18 @@ def information_gain(detections, annotations, num_bins=INFORMATION_GAIN_BINS):
     # create bins edges for the error histogram
     histogram_bins = _histogram_bins(num_bins)
 
+    if context is None:
+        context = BeatContext(detections, annotations)
+
     # evaluate detections against annotations
-    fwd_histogram = _error_histogram(detections, annotations, histogram_bins)
+    fwd_histogram = _error_histogram(detections, annotations, histogram_bins,
+                                     context)
     fwd_ig = _information_gain(fwd_histogram)
     # if only a few (but correct) beats are detected, the errors could be small
     # thus evaluate also the annotations against the detections, i.e. simulate
     # a lot of false positive detections
-    bwd_histogram = _error_histogram(annotations, detections, histogram_bins)
+    bwd_histogram = _error_histogram(annotations, detections, histogram_bins,
+                                     context.reverse)
     bwd_ig = _information_gain(bwd_histogram)
 
     # only use the lower information gain
@@ -1059,20 +1218,22 @@ class BeatEvaluation(OnsetEvaluation):
         # perform onset evaluation with the appropriate fmeasure_window
         super(BeatEvaluation, self).__init__(detections, annotations,
                                              window=fmeasure_window, **kwargs)
-        # other scores
-        self.pscore = pscore(detections, annotations, pscore_tolerance)
-        self.cemgil = cemgil(detections, annotations, cemgil_sigma)
+        # other scores (all share the matches, errors and intervals)
+        context = BeatContext(detections, annotations)
+        self.pscore = pscore(detections, annotations, pscore_tolerance,
+                             context)
+        self.cemgil = cemgil(detections, annotations, cemgil_sigma, context)
         self.goto = goto(detections, annotations, goto_threshold,
-                         goto_sigma, goto_mu)
+                         goto_sigma, goto_mu, context)
         # continuity scores
         scores = continuity(detections, annotations,
                             continuity_tempo_tolerance,
                             continuity_phase_tolerance,
-                            offbeat, double, triple)
+                            offbeat, double, triple, context)
         self.cmlc, self.cmlt, self.amlc, self.amlt = scores
         # information gain stuff
         scores = information_gain(detections, annotations,
-                                  information_gain_bins)
+                                  information_gain_bins, context)
         self.information_gain, self.error_histogram = scores
 
     @property
@@ -0,0 +1,126 @@
+# encoding: utf-8
+# cython: embedsignature=True
+"""
+This module contains the speed crucial event matching functionality used by
+the onset and note evaluation.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+def match_events(detections, annotations, window, detection_groups=None,
+                 annotation_groups=None):
+    """
+    Greedily match detections with annotations.
+
+    Both the detections and the annotations are traversed in ascending order.
+    If the current detection and annotation are not further apart than
+    `window`, they are matched, otherwise the earlier one of them remains
+    unmatched.
+
+    Parameters
+    ----------
+    detections : numpy array, shape (num_detections,)
+        Detected events (sorted, see notes).
+    annotations : numpy array, shape (num_annotations,)
+        Annotated ground truth events (sorted, see notes).
+    window : float
+        Evaluation window.
+    detection_groups : numpy array, shape (num_detections,), optional
+        Group (e.g. MIDI note or file number) of the detections.
+    annotation_groups : numpy array, shape (num_annotations,), optional
+        Group of the annotations.
+
+    Returns
+    -------
+    numpy array, shape (num_detections,)
+        Index of the matching annotation for each detection, -1 if the
+        detection is not matched.
+
+    Notes
+    -----
+    Events are matched only within the same group, thus all groups can be
+    matched in a single pass. Detections and annotations must be sorted by
+    group and time, e.g. with ``np.lexsort((times, groups))``.
+
+    The matching takes linear time and is computed without holding the GIL.
+
+    """
+    cdef double [::1] det = np.ascontiguousarray(detections, dtype=np.float)
+    cdef double [::1] ann = np.ascontiguousarray(annotations, dtype=np.float)
+    if detection_groups is None:
+        detection_groups = np.zeros(len(det), dtype=np.intp)
+    if annotation_groups is None:
+        annotation_groups = np.zeros(len(ann), dtype=np.intp)
+    if len(detection_groups) != len(det) or \
+            len(annotation_groups) != len(ann):
+        raise ValueError('groups must have the same length as the events')
+    cdef np.intp_t [::1] det_groups = np.ascontiguousarray(detection_groups,
+                                                           dtype=np.intp)
+    cdef np.intp_t [::1] ann_groups = np.ascontiguousarray(annotation_groups,
+                                                           dtype=np.intp)
+    cdef double window_ = window
+    matches = np.empty(len(det), dtype=np.intp)
+    cdef np.intp_t [::1] matches_ = matches
+    with nogil:
+        _match_events(det, ann, window_, det_groups, ann_groups, matches_)
+    return matches
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _match_events(double [::1] det, double [::1] ann, double window,
+                        np.intp_t [::1] det_groups, np.intp_t [::1] ann_groups,
+                        np.intp_t [::1] matches) nogil:
+    """
+    Greedily match sorted detections with sorted annotations.
+
+    Parameters
+    ----------
+    det : double memoryview
+        Detections.
+    ann : double memoryview
+        Annotations.
+    window : double
+        Evaluation window.
+    det_groups : intp memoryview
+        Groups of the detections.
+    ann_groups : intp memoryview
+        Groups of the annotations.
+    matches : intp memoryview
+        Buffer for the indices of the matching annotations.
+
+    """
+    cdef Py_ssize_t num_det = det.shape[0]
+    cdef Py_ssize_t num_ann = ann.shape[0]
+    cdef Py_ssize_t i = 0, j = 0, k
+    cdef double diff
+    for k in range(num_det):
+        matches[k] = -1
+    while i < num_det and j < num_ann:
+        if det_groups[i] < ann_groups[j]:
+            # no annotation left in the group of the detection: FP
+            i += 1
+        elif det_groups[i] > ann_groups[j]:
+            # no detection left in the group of the annotation: FN
+            j += 1
+        else:
+            diff = det[i] - ann[j]
+            if -window <= diff <= window:
+                # TP
+                matches[i] = j
+                i += 1
+                j += 1
+            elif diff < 0:
+                # FP
+                i += 1
+            else:
+                # FN
+                j += 1
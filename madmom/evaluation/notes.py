@@ -12,8 +12,9 @@ from __future__ import absolute_import, division, print_function
 import warnings
 import numpy as np
 
-from . import (evaluation_io, MultiClassEvaluation, SumEvaluation,
-               MeanEvaluation)
+from . import (evaluation_io, combine_errors, MultiClassEvaluation,
+               SumEvaluation, MeanEvaluation)
+from .matching import match_events
 from .onsets import onset_evaluation, OnsetEvaluation
 from ..utils import suppress_warnings
 
@@ -153,31 +154,29 @@ def note_onset_evaluation(detections, annotations, window=WINDOW):
     detections = detections[:, :2]
     annotations = annotations[:, :2]
 
-    # get a list of all notes detected / annotated
-    notes = np.unique(np.concatenate((detections[:, 1],
-                                      annotations[:, 1]))).tolist()
-    # iterate over all notes
-    for note in notes:
-        # perform normal onset detection on each note
-        det = detections[detections[:, 1] == note]
-        ann = annotations[annotations[:, 1] == note]
-        tp_, fp_, _, fn_, err_ = onset_evaluation(det[:, 0], ann[:, 0], window)
-        # convert returned arrays to lists and append the detections and
-        # annotations to the correct lists
-        tp = np.vstack((tp, det[np.in1d(det[:, 0], tp_)]))
-        fp = np.vstack((fp, det[np.in1d(det[:, 0], fp_)]))
-        fn = np.vstack((fn, ann[np.in1d(ann[:, 0], fn_)]))
-        # append the note number to the errors
-        err_ = np.vstack((np.array(err_),
-                          np.repeat(np.asarray([note]), len(err_)))).T
-        errors = np.vstack((errors, err_))
-    # check calculations
-    if len(tp) + len(fp) != len(detections):
-        raise AssertionError('bad TP / FP calculation')
-    if len(tp) + len(fn) != len(annotations):
-        raise AssertionError('bad FN calculation')
-    if len(tp) != len(errors):
-        raise AssertionError('bad errors calculation')
+    # all notes are matched in a single pass, events are matched only if
+    # they have the same note number
+    _, notes = np.unique(np.concatenate((detections[:, 1],
+                                         annotations[:, 1])),
+                         return_inverse=True)
+    det_notes = notes[:len(detections)]
+    ann_notes = notes[len(detections):]
+    # sort the detections and annotations by note and time
+    det_sort = np.lexsort((detections[:, 0], det_notes))
+    ann_sort = np.lexsort((annotations[:, 0], ann_notes))
+    det = detections[det_sort]
+    ann = annotations[ann_sort]
+    matches = match_events(det[:, 0], ann[:, 0], window,
+                           det_notes[det_sort], ann_notes[ann_sort])
+    # determine TP, FP and FN detections
+    tp_ = matches >= 0
+    fn_ = np.ones(len(ann), dtype=np.bool)
+    fn_[matches[tp_]] = False
+    tp = det[tp_]
+    fp = det[~tp_]
+    fn = ann[fn_]
+    # errors with the note number
+    errors = np.vstack((tp[:, 0] - ann[matches[tp_], 0], tp[:, 1])).T
     # sort the arrays
     # Note: The errors must have the same sorting order as the TPs, so they
     #       must be done first (before the TPs get sorted)
@@ -306,6 +305,18 @@ class NoteSumEvaluation(SumEvaluation, NoteEvaluation):
             return np.zeros((0, 2))
         return np.concatenate([e.errors for e in self.eval_objects])
 
+    @property
+    def mean_error(self):
+        """Mean of the errors."""
+        warnings.warn('mean_error is given for all notes, this will change!')
+        return combine_errors(self.eval_objects)[0]
+
+    @property
+    def std_error(self):
+        """Standard deviation of the errors."""
+        warnings.warn('std_error is given for all notes, this will change!')
+        return combine_errors(self.eval_objects)[1]
+
 
 class NoteMeanEvaluation(MeanEvaluation, NoteSumEvaluation):
     """
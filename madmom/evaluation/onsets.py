@@ -18,7 +18,9 @@ from __future__ import absolute_import, division, print_function
 
 import numpy as np
 
-from . import evaluation_io, Evaluation, SumEvaluation, MeanEvaluation
+from . import (evaluation_io, combine_errors, Evaluation, SumEvaluation,
+               MeanEvaluation)
+from .matching import match_events
 from ..utils import suppress_warnings, combine_events
 
 
@@ -133,54 +135,87 @@ def onset_evaluation(detections, annotations, window=WINDOW):
     # sort the detections and annotations
     det = np.sort(detections)
     ann = np.sort(annotations)
-    # cache variables
-    det_length = len(detections)
-    ann_length = len(annotations)
-    det_index = 0
-    ann_index = 0
-    # iterate over all detections and annotations
-    while det_index < det_length and ann_index < ann_length:
-        # fetch the first detection
-        d = det[det_index]
-        # fetch the first annotation
-        a = ann[ann_index]
-        # compare them
-        if abs(d - a) <= window:
-            # TP detection
-            tp = np.append(tp, d)
-            # append the error to the array
-            errors = np.append(errors, d - a)
-            # increase the detection and annotation index
-            det_index += 1
-            ann_index += 1
-        elif d < a:
-            # FP detection
-            fp = np.append(fp, d)
-            # increase the detection index
-            det_index += 1
-            # do not increase the annotation index
-        elif d > a:
-            # we missed a annotation: FN
-            fn = np.append(fn, a)
-            # do not increase the detection index
-            # increase the annotation index
-            ann_index += 1
-        else:
-            # can't match detected with annotated onset
-            raise AssertionError('can not match % with %', d, a)
-    # the remaining detections are FP
-    fp = np.append(fp, det[det_index:])
-    # the remaining annotations are FN
-    fn = np.append(fn, ann[ann_index:])
-    # check calculations
-    if len(tp) + len(fp) != len(detections):
-        raise AssertionError('bad TP / FP calculation')
-    if len(tp) + len(fn) != len(annotations):
-        raise AssertionError('bad FN calculation')
-    if len(tp) != len(errors):
-        raise AssertionError('bad errors calculation')
-    # convert to numpy arrays and return them
-    return np.array(tp), np.array(fp), tn, np.array(fn), np.array(errors)
+    # match them
+    matches = match_events(det, ann, window)
+    tp = matches >= 0
+    # annotations without matching detection are FN
+    fn = np.ones(len(ann), dtype=np.bool)
+    fn[matches[tp]] = False
+    # return the arrays
+    return det[tp], det[~tp], tn, ann[fn], det[tp] - ann[matches[tp]]
+
+
+def onset_evaluation_batch(detections, annotations, window=WINDOW):
+    """
+    Determine the true/false positive/negative detections of multiple pieces.
+
+    Parameters
+    ----------
+    detections : list of numpy arrays
+        Detected notes of the pieces.
+    annotations : list of numpy arrays
+        Annotated ground truth notes of the pieces.
+    window : float, optional
+        Evaluation window [seconds].
+
+    Returns
+    -------
+    list
+        True/false positive/negative detections and errors of each piece, as
+        returned by :func:`onset_evaluation`.
+
+    Notes
+    -----
+    The detections and annotations of all pieces are matched in one call,
+    which avoids the overhead of evaluating many pieces individually.
+
+    """
+    if len(detections) != len(annotations):
+        raise ValueError('number of detections and annotations must match')
+    # make sure the arrays have the correct types and dimensions
+    detections = [np.asarray(d, dtype=np.float) for d in detections]
+    annotations = [np.asarray(a, dtype=np.float) for a in annotations]
+    if any(d.ndim > 1 for d in detections + annotations):
+        raise NotImplementedError('please implement multi-dim support')
+    if not detections:
+        return []
+    # window must be greater than 0
+    if float(window) <= 0:
+        raise ValueError('window must be greater than 0')
+    # concatenate the pieces and sort the events by piece and time
+    det_lengths = [len(d) for d in detections]
+    ann_lengths = [len(a) for a in annotations]
+    det_groups = np.repeat(np.arange(len(detections)), det_lengths)
+    ann_groups = np.repeat(np.arange(len(annotations)), ann_lengths)
+    det = np.concatenate(detections)
+    ann = np.concatenate(annotations)
+    det = det[np.lexsort((det, det_groups))]
+    ann = ann[np.lexsort((ann, ann_groups))]
+    # match them
+    matches = match_events(det, ann, window, det_groups, ann_groups)
+    tp = matches >= 0
+    fn = np.ones(len(ann), dtype=np.bool)
+    fn[matches[tp]] = False
+    # Note: compute the errors only for matched detections, unmatched ones
+    #       would index `ann` with -1 (or fail if there are no annotations)
+    errors = np.zeros(len(det))
+    errors[tp] = det[tp] - ann[matches[tp]]
+    # split the results into the individual pieces
+    det_splits = np.cumsum(det_lengths)[:-1]
+    ann_splits = np.cumsum(ann_lengths)[:-1]
+    results = []
+    for i, (det_, tp_, err_, ann_, fn_) in enumerate(zip(
+            np.split(det, det_splits), np.split(tp, det_splits),
+            np.split(errors, det_splits), np.split(ann, ann_splits),
+            np.split(fn, ann_splits))):
+        if len(det_) == 0 or len(ann_) == 0:
+            # return exactly the same as for an individual evaluation
+            results.append(onset_evaluation(detections[i], annotations[i],
+                                            window))
+            continue
+        results.append((det_[tp_], det_[~tp_], np.zeros(0), ann_[fn_],
+                        err_[tp_]))
+    return results
 
 
 # for onset evaluation with Precision, Recall, F-measure use the Evaluation
@@ -275,6 +310,16 @@ class OnsetSumEvaluation(SumEvaluation, OnsetEvaluation):
             return np.zeros(0)
         return np.concatenate([e.errors for e in self.eval_objects])
 
+    @property
+    def mean_error(self):
+        """Mean of the errors."""
+        return combine_errors(self.eval_objects)[0]
+
+    @property
+    def std_error(self):
+        """Standard deviation of the errors."""
+        return combine_errors(self.eval_objects)[1]
+
 
 class OnsetMeanEvaluation(MeanEvaluation, OnsetSumEvaluation):
     """
@@ -212,6 +212,7 @@ class MultiModelSelectionProcessor(Processor):
     array([ 0.00759,  0.00901,  ...,  0.00843,  0.01834], dtype=float32)
 
     """
+    online_capable = False
 
     def __init__(self, num_ref_predictions, **kwargs):
         # pylint: disable=unused-argument
@@ -423,6 +424,7 @@ class BeatTrackingProcessor(Processor):
     array([ 0.11,  0.45,  0.79,  1.13,  1.47,  1.81,  2.15,  2.49])
 
     """
+    online_capable = False
     LOOK_ASIDE = 0.2
     LOOK_AHEAD = 10
     # tempo defaults
@@ -631,7 +633,7 @@ def _process_crf(process_tuple):
     Extract the best beat sequence for a piece.
 
     This proxy function is necessary to process different intervals in parallel
-    using the multiprocessing module.
+    using a pool of threads.
 
     Parameters
     ----------
@@ -720,10 +722,13 @@ class CRFBeatDetectionProcessor(BeatTrackingProcessor):
         num_threads = min(len(factors) if use_factors else num_intervals,
                           kwargs.get('num_threads', 1))
         # init a pool of workers (if needed)
+        # Note: the CRF functions release the GIL, thus use threads which
+        #       share the activations instead of processes which need to
+        #       pickle them for every interval
         self.map = map
         if num_threads != 1:
-            import multiprocessing as mp
-            self.map = mp.Pool(num_threads).map
+            from multiprocessing.pool import ThreadPool
+            self.map = ThreadPool(num_threads).map
 
     def process(self, activations, **kwargs):
         """
@@ -918,6 +923,7 @@ class DBNBeatTrackingProcessor(Processor):
     array([ 0.1 ,  0.45,  0.8 ,  1.12,  1.48,  1.8 ,  2.15,  2.49])
 
     """
+    online_capable = False
     MIN_BPM = 55.
     MAX_BPM = 215.
     NUM_TEMPI = None
@@ -1173,6 +1179,7 @@ class DBNDownBeatTrackingProcessor(Processor):
            [ 2.49,  4.  ]])
 
     """
+    online_capable = False
 
     MIN_BPM = 55.
     MAX_BPM = 215.
@@ -1523,6 +1530,7 @@ SpectrogramDifferenceProcessor, MultiBandSpectrogramProcessor
            [ 3.7 ,  3.  ],
            [ 4.66,  4.  ]])
     """
+    online_capable = False
     # TODO: this should not be lists (lists are mutable!)
     MIN_BPM = [55, 60]
     MAX_BPM = [205, 225]
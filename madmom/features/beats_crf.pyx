@@ -96,11 +96,54 @@ def normalisation_factors(activations, transition_distribution):
     numpy array
         Normalisation factors for model.
 
+    Notes
+    -----
+    The normalisation factor of each frame is the (forward) correlation of
+    the activations with the transition distribution. It is computed without
+    holding the GIL, thus factors for multiple intervals can be computed in
+    parallel threads.
+
+    """
+    cdef float [::1] act = np.ascontiguousarray(activations,
+                                                dtype=np.float32)
+    cdef float [::1] trans = np.ascontiguousarray(transition_distribution,
+                                                  dtype=np.float32)
+    norm_fact = np.empty(len(act), dtype=np.float32)
+    cdef float [::1] norm_fact_ = norm_fact
+    with nogil:
+        _normalisation_factors(act, trans, norm_fact_)
+    return norm_fact
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _normalisation_factors(float [::1] activations, float [::1] trans,
+                                 float [::1] norm_fact) nogil:
+    """
+    Correlate the activations with the transition distribution.
+
+    Parameters
+    ----------
+    activations : float memoryview
+        Beat activation function of the piece.
+    trans : float memoryview
+        Transition distribution of the model.
+    norm_fact : float memoryview
+        Buffer for the normalisation factors.
+
     """
-    from scipy.ndimage.filters import correlate1d
-    return correlate1d(activations, transition_distribution,
-                       mode='constant', cval=0,
-                       origin=-int(transition_distribution.shape[0] / 2))
+    cdef Py_ssize_t num_act = activations.shape[0]
+    cdef Py_ssize_t num_trans = trans.shape[0]
+    cdef Py_ssize_t i, j, num
+    cdef double tmp
+    for i in range(num_act):
+        # activations beyond the end are considered to be 0
+        num = min(num_trans, num_act - i)
+        tmp = 0
+        for j in range(num):
+            tmp += activations[i + j] * trans[j]
+        norm_fact[i] = <float>tmp
 
 
 def best_sequence(activations, interval, interval_sigma):
@@ -169,6 +212,11 @@ def viterbi(float [::1] pi, float[::1] transition, float[::1] norm_factor,
     log_prob : float
         Log probability of the beat sequence.
 
+    Notes
+    -----
+    The GIL is released during the computation, thus multiple sequences can
+    be decoded in parallel threads.
+
     """
     # number of states
     cdef int num_st = activations.shape[0]
@@ -177,66 +225,76 @@ def viterbi(float [::1] pi, float[::1] transition, float[::1] norm_factor,
     # number of beat variables
     cdef int num_x = num_st / tau
 
-    # current viterbi variables
-    cdef float [::1] v_c = np.empty(num_st, dtype=np.float32)
-    # previous viterbi variables. will be initialized with prior (first beat)
-    cdef float [::1] v_p = np.empty(num_st, dtype=np.float32)
+    # buffers for the current and previous viterbi variables; the pointers
+    # v_c and v_p are swapped after each beat
+    cdef float [::1] v_a = np.empty(num_st, dtype=np.float32)
+    cdef float [::1] v_b = np.empty(num_st, dtype=np.float32)
     # back-tracking pointers;
     cdef long [:, ::1] bps = np.empty((num_x - 1, num_st), dtype=np.int)
     # back tracked path, a.k.a. path sequence
     cdef long [::1] path = np.empty(num_x, dtype=np.int)
 
+    # current viterbi variables
+    cdef float *v_c = &v_a[0]
+    # previous viterbi variables. will be initialized with prior (first beat)
+    cdef float *v_p = &v_b[0]
+    cdef float *v_tmp
+
     # counters etc.
     cdef int k, i, j, next_state
     cdef double new_prob, path_prob
 
-    # init first beat
-    for i in range(num_st):
-        v_p[i] = pi[i] + activations[i] + norm_factor[i]
-
-    # iterate over all beats; the 1st beat is given by prior
-    for k in range(num_x - 1):
-        # reset all current viterbi variables
-        v_c[:] = -INFINITY
-
-        # find the best transition for each state i
+    with nogil:
+        # init first beat
+        for i in range(num_st):
+            v_p[i] = pi[i] + activations[i] + norm_factor[i]
+
+        # iterate over all beats; the 1st beat is given by prior
+        for k in range(num_x - 1):
+            # reset all current viterbi variables
+            for i in range(num_st):
+                v_c[i] = -INFINITY
+
+            # find the best transition for each state i
+            for i in range(num_st):
+                # j is the number of frames we look back
+                for j in range(min(i, num_tr)):
+                    # Important remark: the actual computation we'd have to do
+                    # here is v_p[i - j] + norm_factor[i - j] + transition[j]
+                    # + activations[i].
+                    #
+                    # For speedup, we can add the activation after
+                    # the loop, since it does not change with j. Additionally,
+                    # if we immediately add the normalisation factor to v_c[i],
+                    # we can skip adding norm_factor[i - j] for each v_p[i - j].
+                    new_prob = v_p[i - j] + transition[j]
+                    if new_prob > v_c[i]:
+                        v_c[i] = new_prob
+                        bps[k, i] = i - j
+
+                # Add activation and norm_factor. For the last random variable,
+                # we'll subtract norm_factor later when searching the maximum
+                v_c[i] += activations[i] + norm_factor[i]
+
+            v_tmp = v_p
+            v_p = v_c
+            v_c = v_tmp
+
+        # add the final best state to the path
+        path_prob = -INFINITY
         for i in range(num_st):
-            # j is the number of frames we look back
-            for j in range(min(i, num_tr)):
-                # Important remark: the actual computation we'd have to do here
-                # is v_p[i - j] + norm_factor[i - j] + transition[j] +
-                # activations[i].
-                #
-                # For speedup, we can add the activation after
-                # the loop, since it does not change with j. Additionally,
-                # if we immediately add the normalisation factor to v_c[i],
-                # we can skip adding norm_factor[i - j] for each v_p[i - j].
-                new_prob = v_p[i - j] + transition[j]
-                if new_prob > v_c[i]:
-                    v_c[i] = new_prob
-                    bps[k, i] = i - j
-
-            # Add activation and norm_factor. For the last random variable,
-            # we'll subtract norm_factor later when searching the maximum
-            v_c[i] += activations[i] + norm_factor[i]
-
-        v_p, v_c = v_c, v_p
-
-    # add the final best state to the path
-    path_prob = -INFINITY
-    for i in range(num_st):
-        # subtract the norm factor because they shouldn't have been added
-        # for the last random variable
-        v_p[i] -= norm_factor[i]
-        if v_p[i] > path_prob:
-            next_state = i
-            path_prob = v_p[i]
-    path[num_x - 1] = next_state
-
-    # track the path backwards
-    for i in range(num_x - 2, -1, -1):
-        next_state = bps[i, next_state]
-        path[i] = next_state
+            # subtract the norm factor because they shouldn't have been added
+            # for the last random variable
+            v_p[i] -= norm_factor[i]
+            if v_p[i] > path_prob:
+                next_state = i
+                path_prob = v_p[i]
+        path[num_x - 1] = next_state
+
+        # track the path backwards
+        for i in range(num_x - 2, -1, -1):
+            next_state = bps[i, next_state]
+            path[i] = next_state
 
     # return the best sequence and its log probability
     return np.asarray(path), path_prob
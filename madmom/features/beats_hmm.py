@@ -17,6 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 import numpy as np
 
+from madmom.ml.gmm import GMMStack
 from madmom.ml.hmm import TransitionModel, ObservationModel
 
 
@@ -620,6 +621,8 @@ class GMMPatternTrackingObservationModel(ObservationModel):
                                        num_beats + densities_idx_offset)
             # increase the offset by the number of GMMs
             densities_idx_offset += num_gmms
+        # stack all GMMs to be able to compute the densities in one go
+        self.gmms = GMMStack([gmm for gmms in pattern_files for gmm in gmms])
         # instantiate a ObservationModel with the pointers
         super(GMMPatternTrackingObservationModel, self).__init__(pointers)
 
@@ -638,16 +641,5 @@ class GMMPatternTrackingObservationModel(ObservationModel):
             Log densities of the observations.
 
         """
-        # number of GMMs of all patterns
-        num_gmms = sum([len(pattern) for pattern in self.pattern_files])
-        # init the densities
-        log_densities = np.empty((len(observations), num_gmms), dtype=np.float)
-        # define the observation densities
-        i = 0
-        for pattern in self.pattern_files:
-            for gmm in pattern:
-                # get the predictions of each GMM for the observations
-                log_densities[:, i] = gmm.score(observations)
-                i += 1
-        # return the densities
-        return log_densities
+        # get the predictions of all GMMs for the observations
+        return self.gmms.score(observations)
@@ -15,7 +15,8 @@ from __future__ import absolute_import, division, print_function
 
 import numpy as np
 
-from .onsets import peak_picking, OnsetPeakPickingProcessor
+from .onsets import (peak_picking, OnsetPeakPickingProcessor,
+                     StreamingPeakPicker)
 from ..processors import SequentialProcessor, ParallelProcessor
 from ..utils import suppress_warnings, combine_events
 
@@ -345,10 +346,36 @@ class NotePeakPickingProcessor(OnsetPeakPickingProcessor):
             post_avg=post_avg, pre_max=pre_max, post_max=post_max,
             combine=combine, delay=delay, online=online, fps=fps)
 
+    def reset(self):
+        """Reset NotePeakPickingProcessor."""
+        super(NotePeakPickingProcessor, self).reset()
+        # last reported onset of each pitch
+        self.last_onset = {}
+
     def process(self, activations, **kwargs):
         """
         Detect the notes in the given activation function.
 
+        Parameters
+        ----------
+        activations : numpy array
+            Note activation function.
+
+        Returns
+        -------
+        onsets : numpy array
+            Detected notes [seconds, pitches].
+
+        """
+        if self.online:
+            return self.process_online(activations, **kwargs)
+        else:
+            return self.process_sequence(activations, **kwargs)
+
+    def process_sequence(self, activations, **kwargs):
+        """
+        Detect the notes in the given activation function.
+
         Parameters
         ----------
         activations : numpy array
@@ -373,19 +400,53 @@ class NotePeakPickingProcessor(OnsetPeakPickingProcessor):
         # shift if necessary
         if self.delay:
             onsets += self.delay
-        # combine notes
+        # stack onsets and pitches
+        notes = np.vstack((onsets, pitches)).T
+        # combine notes (each pitch separately)
         if self.combine > 0:
-            notes = []
-            # iterate over each detected note pitch separately
-            for pitch in np.unique(pitches):
-                # get all onsets for this pitch
-                onsets_ = onsets[pitches == pitch]
-                # combine onsets
-                onsets_ = combine_events(onsets_, self.combine, 'left')
-                # zip onsets and pitches and add them to list of detections
-                notes.extend(list(zip(onsets_, [pitch] * len(onsets_))))
-        else:
-            # just zip all detected notes
-            notes = list(zip(onsets, pitches))
-        # sort the detections and return as numpy array
-        return np.asarray(sorted(notes))
+            notes = combine_events(notes, self.combine, 'left')
+        # sort the detections
+        return notes[np.lexsort(notes.T[::-1])]
+
+    def process_online(self, activations, reset=True, **kwargs):
+        """
+        Detect the notes in the given activation function.
+
+        Parameters
+        ----------
+        activations : numpy array
+            Note activation function.
+        reset : bool, optional
+            Reset the processor to its initial state before processing.
+
+        Returns
+        -------
+        onsets : numpy array
+            Detected notes [seconds, pitches].
+
+        """
+        # reset the peak-picking
+        if self.peak_picker is None or reset:
+            self.reset()
+            # convert timing information to frames
+            timings = np.array([self.pre_avg, self.post_avg, self.pre_max,
+                                self.post_max]) * self.fps
+            timings = np.round(timings).astype(int)
+            self.peak_picker = StreamingPeakPicker(self.threshold, *timings)
+        # detect the peaks (relative to the first frame after the reset)
+        frames, pitches = self.peak_picker.process(activations)
+        # shift if necessary
+        if self.delay:
+            raise ValueError('delay not supported yet in online mode')
+        # report only if there was no note of the same pitch within the last
+        # combine seconds (peaks are ordered by time)
+        notes = []
+        for onset, pitch in zip(frames / float(self.fps), pitches + 21):
+            last_onset = self.last_onset.get(pitch)
+            if (self.combine and last_onset is not None and
+                    onset - last_onset <= self.combine + 1e-12):
+                continue
+            self.last_onset[pitch] = onset
+            notes.append((onset, pitch))
+        # return the notes
+        return np.asarray(notes).reshape(-1, 2)
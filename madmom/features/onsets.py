@@ -13,8 +13,7 @@ import numpy as np
 from scipy.ndimage import uniform_filter
 from scipy.ndimage.filters import maximum_filter
 
-from ..processors import (Processor, SequentialProcessor, ParallelProcessor,
-                          BufferProcessor)
+from ..processors import Processor, SequentialProcessor, ParallelProcessor
 from ..audio.signal import smooth as smooth_signal
 from ..utils import combine_events
 
@@ -965,6 +964,171 @@ def peak_picking(activations, threshold, smooth=None, pre_avg=0, post_avg=0,
         raise ValueError('`activations` must be either 1D or 2D')
 
 
+class StreamingPeakPicker(Processor):
+    """
+    Streaming version of :func:`peak_picking`.
+
+    The activations can be fed in chunks of arbitrary length (including single
+    frames). The moving average is computed with a running sum and the moving
+    maximum with a block-wise ascending/descending maximum (a monotonic
+    queue of constant size), hence each frame is processed in constant time
+    regardless of the size of the averaging and maximum windows.
+
+    Parameters
+    ----------
+    threshold : float
+        Threshold for peak-picking
+    pre_avg : int, optional
+        Use `pre_avg` frames past information for moving average.
+    post_avg : int, optional
+        Use `post_avg` frames future information for moving average.
+    pre_max : int, optional
+        Use `pre_max` frames past information for moving maximum.
+    post_max : int, optional
+        Use `post_max` frames future information for moving maximum.
+
+    Notes
+    -----
+    A frame can only be reported once all its future context is available,
+    i.e. the peaks are reported with a latency of `post_avg` + `post_max`
+    frames. Apart from the frames at the very end of the signal (which are not
+    reported until their future context is available), the detected peaks are
+    the same as those returned by :func:`peak_picking` without smoothing.
+
+    Examples
+    --------
+    >>> act = np.array([0, 0.1, 0.6, 0.2, 0.7, 0.9, 0.3, 0.1, 0.8, 0.4])
+    >>> peak_picking(act, 0.5, pre_max=2, post_max=1)
+    array([2, 5, 8])
+    >>> proc = StreamingPeakPicker(0.5, pre_max=2, post_max=1)
+    >>> [proc.process(a) for a in np.split(act, [4, 6])]
+    [array([2]), array([], dtype=int64), array([5, 8])]
+
+    """
+
+    def __init__(self, threshold, pre_avg=0, post_avg=0, pre_max=1,
+                 post_max=1):
+        self.threshold = threshold
+        self.pre_avg = int(pre_avg)
+        self.post_avg = int(post_avg)
+        self.pre_max = int(pre_max)
+        self.post_max = int(post_max)
+        self.reset()
+
+    @property
+    def lookahead(self):
+        """Number of future frames needed for peak-picking."""
+        return self.post_avg + self.post_max
+
+    def reset(self):
+        """Reset StreamingPeakPicker."""
+        # number of activation frames processed so far
+        self.counter = 0
+        # internal state, initialised with the first frame(s)
+        self._activations = None
+
+    def _init_state(self, num_columns):
+        """Initialise the internal state for the given number of columns."""
+        avg_length = self.pre_avg + self.post_avg + 1
+        max_length = self.pre_max + self.post_max + 1
+        # ring buffer with the activations inside the averaging window
+        self._activations = np.zeros((avg_length, num_columns))
+        self._mov_avg = np.zeros(num_columns)
+        # ring buffer with the detections awaiting their future context
+        self._detections = np.zeros((self.post_max + 1, num_columns))
+        # the moving maximum is computed over blocks of the window length:
+        # the maximum of the current block up to the current position and
+        # the (descending) maxima of the previous block from a position on
+        self._block = np.zeros((max_length, num_columns))
+        self._prefix_max = np.zeros(num_columns)
+        self._suffix_max = np.zeros((max_length, num_columns))
+        # position in the detection stream (prepended by `pre_max` zeros, as
+        # the maximum filter uses zero padding)
+        self._position = 0
+        for _ in range(self.pre_max):
+            self._moving_maximum(np.zeros(num_columns))
+
+    def _moving_maximum(self, detection):
+        """Add a detection and return the maximum over the last window."""
+        max_length = len(self._block)
+        pos = self._position % max_length
+        if pos == 0:
+            # start a new block, compute the descending maxima of the old one
+            self._suffix_max = np.maximum.accumulate(
+                self._block[::-1], axis=0)[::-1]
+            self._prefix_max = detection.copy()
+        else:
+            np.maximum(self._prefix_max, detection, out=self._prefix_max)
+        self._block[pos] = detection
+        self._position += 1
+        if pos == max_length - 1:
+            return self._prefix_max
+        return np.maximum(self._suffix_max[pos + 1], self._prefix_max)
+
+    def process(self, activations, **kwargs):
+        """
+        Detect the peaks in the given activation function (chunk).
+
+        Parameters
+        ----------
+        activations : numpy array
+            Activation function, 1D or 2D (the peaks are detected for each
+            column individually).
+
+        Returns
+        -------
+        peak_idx : numpy array or tuple
+            Indices (relative to the first frame after the last reset) of the
+            peaks detected in the given or previously processed activations.
+            For 2D activations a tuple with the frame and column indices.
+
+        """
+        # pylint: disable=unused-argument
+        activations = np.asarray(activations, dtype=np.float)
+        if activations.ndim not in (1, 2):
+            raise ValueError('`activations` must be either 1D or 2D')
+        ndim = activations.ndim
+        # nothing to do for empty chunks (which can not be reshaped)
+        if len(activations) == 0:
+            frames = np.zeros(0, dtype=np.int)
+            return frames if ndim == 1 else (frames, frames.copy())
+        activations = activations.reshape(len(activations), -1)
+        if self._activations is None:
+            self._init_state(activations.shape[1])
+        avg_length = len(self._activations)
+        num_detections = len(self._detections)
+        frames, columns = [], []
+        for act in activations:
+            # update the running moving average
+            # Note: the oldest activation in the ring buffer falls out of the
+            #       averaging window and gets replaced by the new one
+            idx = self.counter % avg_length
+            if avg_length > 1:
+                self._mov_avg += (act - self._activations[idx]) / avg_length
+            self._activations[idx] = act
+            self.counter += 1
+            # the frame whose averaging window is complete
+            frame = self.counter - 1 - self.post_avg
+            if frame < 0:
+                continue
+            act = self._activations[frame % avg_length]
+            detection = act * (act >= self._mov_avg + self.threshold)
+            self._detections[frame % num_detections] = detection
+            mov_max = self._moving_maximum(detection)
+            # the frame whose maximum window is complete
+            frame -= self.post_max
+            if frame < 0:
+                continue
+            detection = self._detections[frame % num_detections]
+            peaks = np.nonzero(detection * (detection == mov_max))[0]
+            frames.extend([frame] * len(peaks))
+            columns.extend(peaks)
+        frames = np.array(frames, dtype=np.int)
+        if ndim == 1:
+            return frames
+        return frames, np.array(columns, dtype=np.int)
+
+
 class PeakPickingProcessor(Processor):
     """
     Deprecated as of version 0.15. Will be removed in version 0.16. Use either
@@ -1108,9 +1272,8 @@ class OnsetPeakPickingProcessor(Processor):
             smooth = 0
             post_avg = 0
             post_max = 0
-            # init buffer
-            self.buffer = None
-            self.counter = 0
+            # init peak-picking
+            self.peak_picker = None
             self.last_onset = None
         # save parameters
         self.threshold = threshold
@@ -1126,10 +1289,19 @@ class OnsetPeakPickingProcessor(Processor):
 
     def reset(self):
         """Reset OnsetPeakPickingProcessor."""
-        self.buffer = None
-        self.counter = 0
+        self.peak_picker = None
         self.last_onset = None
 
+    @property
+    def online_capable(self):
+        """Peak-picking operates in online mode."""
+        return self.online
+
+    @property
+    def latency(self):
+        """Future information needed for peak-picking [seconds]."""
+        return self.post_avg + self.post_max
+
     def process(self, activations, **kwargs):
         """
         Detect the onsets in the given activation function.
@@ -1198,30 +1370,18 @@ class OnsetPeakPickingProcessor(Processor):
             Detected onsets [seconds].
 
         """
-        # buffer data
-        if self.buffer is None or reset:
-            # reset the processor
+        # reset the peak-picking
+        if self.peak_picker is None or reset:
             self.reset()
-            # put 0s in front (depending on conext given by pre_max
-            init = np.zeros(int(np.round(self.pre_max * self.fps)))
-            buffer = np.insert(activations, 0, init, axis=0)
-            # offset the counter, because we buffer the activations
-            self.counter = -len(init)
-            # use the data for the buffer
-            self.buffer = BufferProcessor(init=buffer)
-        else:
-            buffer = self.buffer(activations)
-        # convert timing information to frames and set default values
-        # TODO: use at least 1 frame if any of these values are > 0?
-        timings = np.array([self.smooth, self.pre_avg, self.post_avg,
-                            self.pre_max, self.post_max]) * self.fps
-        timings = np.round(timings).astype(int)
-        # detect the peaks (function returns int indices)
-        peaks = peak_picking(buffer, self.threshold, *timings)
+            # convert timing information to frames
+            timings = np.array([self.pre_avg, self.post_avg, self.pre_max,
+                                self.post_max]) * self.fps
+            timings = np.round(timings).astype(int)
+            self.peak_picker = StreamingPeakPicker(self.threshold, *timings)
+        # detect the peaks (relative to the first frame after the reset)
+        peaks = self.peak_picker.process(activations)
         # convert to onset timings
-        onsets = (self.counter + peaks) / float(self.fps)
-        # increase counter
-        self.counter += len(activations)
+        onsets = peaks / float(self.fps)
         # shift if necessary
         if self.delay:
             raise ValueError('delay not supported yet in online mode')
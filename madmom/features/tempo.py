@@ -48,7 +48,8 @@ def smooth_histogram(histogram, smooth):
 
 
 # interval detection
-def interval_histogram_acf(activations, min_tau=1, max_tau=None):
+def interval_histogram_acf(activations, min_tau=1, max_tau=None,
+                           method='direct', block_size=None):
     """
     Compute the interval histogram of the given (beat) activation function via
     auto-correlation as in [1]_.
@@ -56,19 +57,34 @@ def interval_histogram_acf(activations, min_tau=1, max_tau=None):
     Parameters
     ----------
     activations : numpy array
-        Beat activation function.
+        Beat activation function. If a 2D array is given, each column is
+        treated as an individual activation function.
     min_tau : int, optional
         Minimal delay for the auto-correlation function [frames].
     max_tau : int, optional
         Maximal delay for the auto-correlation function [frames].
+    method : {'direct', 'fft'}, optional
+        Compute the auto-correlation directly for each delay or via FFT.
+    block_size : int, optional
+        If set, process the activations in blocks of this size [frames] when
+        using the 'fft' method; useful for very long activation functions.
 
     Returns
     -------
     histogram_bins : numpy array
-        Bins of the tempo histogram.
+        Bins of the tempo histogram (one row per column of 2D activations).
     histogram_delays : numpy array
         Corresponding delays [frames].
 
+    Notes
+    -----
+    The 'direct' method is faster if only a few delays are computed; the
+    'fft' method scales better with the number of delays. Both methods
+    produce the same bins up to floating point precision.
+
+    To process activation functions of different lengths at once, stack
+    them as columns of a 2D array padded with zeros.
+
     References
     ----------
     .. [1] Sebastian Böck and Markus Schedl,
@@ -77,7 +93,7 @@ def interval_histogram_acf(activations, min_tau=1, max_tau=None):
            Effects (DAFx), 2011.
 
     """
-    if activations.ndim != 1:
+    if activations.ndim not in (1, 2):
         raise NotImplementedError('too many dimensions for autocorrelation '
                                   'interval histogram calculation.')
     # set the maximum delay
@@ -85,17 +101,65 @@ def interval_histogram_acf(activations, min_tau=1, max_tau=None):
         max_tau = len(activations) - min_tau
     # test all possible delays
     taus = list(range(min_tau, max_tau + 1))
-    bins = []
-    # Note: this is faster than:
-    #   corr = np.correlate(activations, activations, mode='full')
-    #   bins = corr[len(activations) + min_tau - 1: len(activations) + max_tau]
-    for tau in taus:
-        bins.append(np.sum(np.abs(activations[tau:] * activations[0:-tau])))
+    if method == 'fft':
+        acf = _autocorrelation_fft(np.abs(activations), max_tau, block_size)
+        bins = acf[min_tau:max_tau + 1].T
+    elif method == 'direct':
+        bins = []
+        # Note: this is faster than:
+        #   corr = np.correlate(activations, activations, mode='full')
+        #   bins = corr[len(activations) + min_tau - 1:
+        #               len(activations) + max_tau]
+        for tau in taus:
+            bins.append(np.sum(np.abs(activations[tau:] *
+                                      activations[0:-tau]), axis=0))
+        bins = np.array(bins).T
+    else:
+        raise ValueError("`method` must be either 'direct' or 'fft'.")
     # return histogram
-    return np.array(bins), np.array(taus)
+    return bins, np.array(taus)
 
 
-def interval_histogram_comb(activations, alpha, min_tau=1, max_tau=None):
+def _autocorrelation_fft(signal, max_lag, block_size=None):
+    """
+    Compute the auto-correlation of the signal for lags 0..max_lag via FFT.
+
+    Parameters
+    ----------
+    signal : numpy array
+        Signal (1D or 2D with the signals as columns).
+    max_lag : int
+        Maximum lag [frames].
+    block_size : int, optional
+        Process the signal in blocks of this size [frames].
+
+    Returns
+    -------
+    numpy array
+        Auto-correlation (lags aligned along the first axis).
+
+    """
+    num_frames = len(signal)
+    if block_size is None:
+        block_size = max(num_frames, 1)
+    block_size = int(block_size)
+    if block_size < 1:
+        raise ValueError('`block_size` must be greater than 0.')
+    # the FFT must be long enough to avoid circular aliasing
+    n_fft = 1 << int(np.ceil(np.log2(block_size + max_lag + 1)))
+    acf = np.zeros((max_lag + 1, ) + signal.shape[1:])
+    # correlate each block with the block itself plus the following frames
+    for start in range(0, num_frames, block_size):
+        block = signal[start:start + block_size]
+        context = signal[start:start + block_size + max_lag]
+        corr = np.fft.irfft(np.conj(np.fft.rfft(block, n_fft, axis=0)) *
+                            np.fft.rfft(context, n_fft, axis=0), n_fft, axis=0)
+        acf += corr[:max_lag + 1]
+    return acf
+
+
+def interval_histogram_comb(activations, alpha, min_tau=1, max_tau=None,
+                            num_threads=1):
     """
     Compute the interval histogram of the given (beat) activation function via
     a bank of resonating comb filters as in [1]_.
@@ -111,6 +175,8 @@ def interval_histogram_comb(activations, alpha, min_tau=1, max_tau=None):
         Minimal delay for the comb filter [frames].
     max_tau : int, optional
         Maximal delta for comb filter [frames].
+    num_threads : int, optional
+        Number of threads used for comb filtering.
 
     Returns
     -------
@@ -129,22 +195,18 @@ def interval_histogram_comb(activations, alpha, min_tau=1, max_tau=None):
 
     """
     # import comb filter
-    from madmom.audio.comb_filters import CombFilterbankProcessor
+    from madmom.audio.comb_filters import comb_filter_histogram
     # set the maximum delay
     if max_tau is None:
         max_tau = len(activations) - min_tau
     # get the range of taus
     taus = np.arange(min_tau, max_tau + 1)
-    # create a comb filter bank instance
-    cfb = CombFilterbankProcessor('backward', taus, alpha)
     if activations.ndim in (1, 2):
-        # apply a bank of comb filters
-        act = cfb.process(activations)
-        # determine the tau with the highest value for each time step
-        act_max = act == np.max(act, axis=-1)[..., np.newaxis]
-        # sum up these maxima weighted by the activation value to yield the
-        # histogram bin values
-        histogram_bins = np.sum(act * act_max, axis=0)
+        # apply a bank of comb filters, determine the tau with the highest
+        # value for each time step and sum up these maxima weighted by the
+        # activation value to yield the histogram bin values
+        histogram_bins = comb_filter_histogram(activations, taus, alpha,
+                                               num_threads=num_threads)
     else:
         raise NotImplementedError('too many dimensions for comb filter '
                                   'interval histogram calculation.')
@@ -215,7 +277,7 @@ def detect_tempo(histogram, fps):
     if len(peaks) == 0:
         # a flat histogram has no peaks, use the center bin
         if len(bins):
-            ret = np.asarray([tempi[len(bins) / 2], 1.])
+            ret = np.asarray([tempi[len(bins) // 2], 1.])
         else:
             # otherwise: no peaks, no tempo
             ret = np.asarray([NO_TEMPO, 0.])
@@ -255,6 +317,21 @@ class TempoEstimationProcessor(Processor):
         Scaling factor for the comb filter.
     fps : float, optional
         Frames per second.
+    num_threads : int, optional
+        Number of threads used for comb filtering.
+    online : bool, optional
+        Estimate the tempo incrementally, i.e. frame by frame.
+    hist_decay : float, optional
+        In online mode, the weight of past frames in the tempo histogram
+        decays by a factor of e every `hist_decay` seconds; if 'None', the
+        histogram is accumulated over the whole stream.
+
+    Notes
+    -----
+    In online mode, the processor keeps the state of the comb filters (or the
+    auto-correlation accumulators), thus updating the histogram costs
+    O(num_taus) per frame. The activations are smoothed causally. The 'dbn'
+    method is not supported in online mode.
 
     Examples
     --------
@@ -285,11 +362,17 @@ class TempoEstimationProcessor(Processor):
     HIST_SMOOTH = 9
     ACT_SMOOTH = 0.14
     ALPHA = 0.79
+    HIST_DECAY = 10.
+    ONLINE = False
 
     def __init__(self, method=METHOD, min_bpm=MIN_BPM, max_bpm=MAX_BPM,
                  act_smooth=ACT_SMOOTH, hist_smooth=HIST_SMOOTH, alpha=ALPHA,
-                 fps=None, **kwargs):
+                 fps=None, num_threads=1, online=ONLINE, hist_decay=HIST_DECAY,
+                 **kwargs):
         # pylint: disable=unused-argument
+        if online and method not in ('comb', 'acf'):
+            raise ValueError("only 'comb' and 'acf' methods are supported in "
+                             "online mode")
         # save variables
         self.method = method
         self.min_bpm = min_bpm
@@ -298,6 +381,11 @@ class TempoEstimationProcessor(Processor):
         self.hist_smooth = hist_smooth
         self.alpha = alpha
         self.fps = fps
+        self.num_threads = num_threads
+        self.online = online
+        self.hist_decay = hist_decay
+        # state for online processing
+        self.reset()
 
     @property
     def min_interval(self):
@@ -309,10 +397,42 @@ class TempoEstimationProcessor(Processor):
         """Maximum beat interval [frames]."""
         return int(np.ceil(60. * self.fps / self.min_bpm))
 
+    def reset(self):
+        """Reset the TempoEstimationProcessor."""
+        self._act_buffer = None
+        self._buffer = None
+        self._histogram = None
+        self._counter = 0
+
+    @property
+    def online_capable(self):
+        """Tempo estimation operates in online mode."""
+        return self.online
+
     def process(self, activations, **kwargs):
         """
         Detect the tempi from the (beat) activations.
 
+        Parameters
+        ----------
+        activations : numpy array
+            Beat activation function.
+
+        Returns
+        -------
+        tempi : numpy array
+            Array with the dominant tempi [bpm] (first column) and their
+            relative strengths (second column).
+
+        """
+        if getattr(self, 'online', False):
+            return self.process_online(activations, **kwargs)
+        return self.process_sequence(activations, **kwargs)
+
+    def process_sequence(self, activations, **kwargs):
+        """
+        Detect the tempi from the (beat) activations.
+
         Parameters
         ----------
         activations : numpy array
@@ -335,6 +455,104 @@ class TempoEstimationProcessor(Processor):
         # detect the tempi and return them
         return detect_tempo(histogram, self.fps)
 
+    def process_online(self, activations, reset=True, **kwargs):
+        """
+        Detect the tempi from the (beat) activations in online mode.
+
+        The activations are appended to the previously processed ones and the
+        interval histogram is updated incrementally.
+
+        Parameters
+        ----------
+        activations : numpy array
+            Beat activation function (of the current frame(s)).
+        reset : bool, optional
+            Reset the processor to its initial state before processing.
+
+        Returns
+        -------
+        tempi : numpy array
+            Array with the dominant tempi [bpm] (first column) and their
+            relative strengths (second column) of the stream so far.
+
+        """
+        if self._histogram is None or reset:
+            self.reset()
+            self._init_online()
+        # causally smooth the activations
+        activations = np.array(activations, dtype=np.float, ndmin=1).ravel()
+        if len(self._act_buffer):
+            data = np.hstack((self._act_buffer, activations))
+            self._act_buffer = data[len(activations):]
+            activations = np.convolve(data, self._act_kernel, 'valid')
+        # update the histogram with chunks of `min_interval` frames; all
+        # delayed values needed for these frames are known already
+        for start in range(0, len(activations), self.min_interval):
+            self._update_histogram(
+                activations[start:start + self.min_interval])
+        # smooth the histogram
+        histogram = smooth_histogram((self._histogram, self._taus),
+                                     self.hist_smooth)
+        # detect the tempi and return them
+        return detect_tempo(histogram, self.fps)
+
+    def _init_online(self):
+        """Initialise the state needed for online processing."""
+        # causal smoothing kernel and buffer for the previous activations
+        act_smooth = int(round(self.fps * self.act_smooth))
+        if act_smooth > 1:
+            self._act_kernel = np.hamming(act_smooth)
+        else:
+            self._act_kernel = np.ones(1)
+        self._act_buffer = np.zeros(len(self._act_kernel) - 1)
+        # delays and a circular buffer holding the last `max_interval` comb
+        # filter outputs (or activations for the auto-correlation)
+        self._taus = np.arange(self.min_interval, self.max_interval + 1)
+        if self.method == 'comb':
+            self._buffer = np.zeros((self.max_interval, len(self._taus)))
+        else:
+            self._buffer = np.zeros(self.max_interval)
+        self._histogram = np.zeros(len(self._taus))
+        # decay of the histogram per frame
+        self._decay = 1.
+        if self.hist_decay:
+            self._decay = np.exp(-1. / (self.hist_decay * self.fps))
+        self._counter = 0
+
+    def _update_histogram(self, activations):
+        """
+        Update the histogram with the given activations.
+
+        Parameters
+        ----------
+        activations : numpy array
+            Smoothed activations, at most `min_interval` frames.
+
+        """
+        num_frames = len(activations)
+        # (absolute) frame indices and positions of the delayed values inside
+        # the circular buffer
+        frames = self._counter + np.arange(num_frames)
+        delayed = (frames[:, np.newaxis] - self._taus) % len(self._buffer)
+        if self.method == 'comb':
+            # y[n] = x[n] + α * y[n - τ]
+            taus = np.arange(len(self._taus))
+            y = activations[:, np.newaxis] + \
+                self.alpha * self._buffer[delayed, taus]
+            self._buffer[frames % len(self._buffer)] = y
+            # weight the maxima of each frame with their value
+            bins = y * (y == np.max(y, axis=1)[:, np.newaxis])
+        else:
+            bins = np.abs(activations[:, np.newaxis] * self._buffer[delayed])
+            self._buffer[frames % len(self._buffer)] = activations
+        # decay the histogram and add the new frames
+        if self._decay != 1:
+            weights = self._decay ** np.arange(num_frames - 1, -1, -1)
+            bins *= weights[:, np.newaxis]
+            self._histogram *= self._decay ** num_frames
+        self._histogram += np.sum(bins, axis=0)
+        self._counter += num_frames
+
     def interval_histogram(self, activations):
         """
         Compute the histogram of the beat intervals with the selected method.
@@ -359,7 +577,8 @@ class TempoEstimationProcessor(Processor):
         elif self.method == 'comb':
             return interval_histogram_comb(activations, self.alpha,
                                            self.min_interval,
-                                           self.max_interval)
+                                           self.max_interval,
+                                           getattr(self, 'num_threads', 1))
         elif self.method == 'dbn':
             from .beats import DBNBeatTrackingProcessor
             # instantiate a DBN for beat tracking
@@ -0,0 +1,268 @@
+# encoding: utf-8
+# cython: embedsignature=True
+"""
+This module contains an implementation of Conditional Random Fields (CRFs)
+"""
+# pylint: disable=no-member
+# pylint: disable=invalid-name
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+from ..processors import Processor
+
+
+ctypedef np.uint32_t uint32_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef void _viterbi(double [:, ::1] potentials, double [:, ::1] transition,
+                   double [::1] initial, double [::1] final,
+                   uint32_t [:, ::1] bt_pointers, double [::1] viterbi,
+                   double [::1] previous, uint32_t [::1] path) nogil:
+    """
+    Max-product recursion of a linear-chain CRF.
+
+    Parameters
+    ----------
+    potentials : double memoryview, shape (num_observations, num_states)
+        Observation and bias potentials of all frames.
+    transition : double memoryview, shape (num_states, num_states)
+        Transposed transition potentials, i.e. rows are the 'to' dimension.
+    initial : double memoryview, shape (num_states,)
+        Initial potentials.
+    final : double memoryview, shape (num_states,)
+        Final potentials.
+    bt_pointers : uint32 memoryview, shape (num_observations, num_states)
+        Buffer for the back tracking pointers.
+    viterbi : double memoryview, shape (num_states,)
+        Buffer for the current viterbi variables.
+    previous : double memoryview, shape (num_states,)
+        Buffer for the previous viterbi variables.
+    path : uint32 memoryview, shape (num_observations,)
+        Buffer for the most probable state sequence.
+
+    """
+    cdef Py_ssize_t num_observations = potentials.shape[0]
+    cdef Py_ssize_t num_states = potentials.shape[1]
+    cdef Py_ssize_t frame, state, prev_state
+    cdef uint32_t best_state
+    cdef double best, trans
+
+    # init with the initial potentials
+    for state in range(num_states):
+        previous[state] = initial[state]
+    # iterate over all observations
+    for frame in range(num_observations):
+        for state in range(num_states):
+            # search for the best transition into this state; use the first
+            # one if there are multiple (same as numpy's argmax)
+            best = transition[state, 0] + previous[0]
+            best_state = 0
+            for prev_state in range(1, num_states):
+                trans = transition[state, prev_state] + previous[prev_state]
+                if trans > best:
+                    best = trans
+                    best_state = prev_state
+            viterbi[state] = potentials[frame, state] + best
+            bt_pointers[frame, state] = best_state
+        # overwrite the old states with the current ones
+        for state in range(num_states):
+            previous[state] = viterbi[state]
+    # determine the best final state
+    best_state = 0
+    best = previous[0] + final[0]
+    for state in range(1, num_states):
+        trans = previous[state] + final[state]
+        if trans > best:
+            best = trans
+            best_state = state
+    # track the path backwards
+    path[num_observations - 1] = best_state
+    for frame in range(num_observations - 1, 0, -1):
+        path[frame - 1] = bt_pointers[frame, path[frame]]
+
+
+class ConditionalRandomField(Processor):
+    """
+    Implements a linear-chain Conditional Random Field using a
+    matrix-based definition:
+
+    .. math::
+        P(Y|X) = exp[E(Y,X)] / Σ_{Y'}[E(Y', X)]
+
+        E(Y,X) = Σ_{i=1}^{N} [y_{n-1}^T  A  y_n + y_n^T c + x_n^T W y_n ] +
+                y_0^T π + y_N^T τ,
+
+    where Y is a sequence of labels in one-hot encoding and X are the observed
+    features.
+
+    Parameters
+    ----------
+    initial : numpy array
+        Initial potential (π) of the CRF. Also defines the number of states.
+    final : numpy array
+        Potential (τ) of the last variable of the CRF.
+    bias : numpy array
+        Label bias potential (c).
+    transition : numpy array
+        Matrix defining the transition potentials (A), where the rows are the
+        'from' dimension, and columns the 'to' dimension.
+    observation : numpy array
+        Matrix defining the observation potentials (W), where the rows are the
+        'observation' dimension, and columns the 'state' dimension.
+
+    Examples
+    --------
+    Create a CRF that emulates a simple hidden markov model. This means that
+    the bias and final potential will be constant and thus have no effect
+    on the predictions.
+
+    >>> eta = np.spacing(1)  # for numerical stability
+    >>> initial = np.log(np.array([0.7, 0.2, 0.1]) + eta)
+    >>> final = np.ones(3)
+    >>> bias = np.ones(3)
+    >>> transition = np.log(np.array([[0.6, 0.2, 0.2],
+    ...                               [0.1, 0.7, 0.2],
+    ...                               [0.1, 0.1, 0.8]]) + eta)
+    >>> observation = np.log(np.array([[0.9, 0.5, 0.1],
+    ...                                [0.1, 0.5, 0.1]]) + eta)
+    >>> crf = ConditionalRandomField(initial, final, bias,
+    ...                              transition, observation)
+    >>> crf  # doctest: +ELLIPSIS
+    <madmom.ml.crf.ConditionalRandomField object at 0x...>
+
+    We can now decode the most probable state sequence given an observation
+    sequence. Since we are emulating a discrete HMM, the observation sequence
+    needs to be observation ids in one-hot encoding.
+
+    The following observation sequence corresponds to "0, 0, 1, 0, 1, 1":
+
+    >>> obs = np.array([[1, 0], [1, 0], [0, 1], [1, 0], [0, 1], [0, 1]])
+
+    Now we can find the most likely state sequence:
+
+    >>> crf.process(obs)
+    array([0, 0, 1, 1, 1, 1], dtype=uint32)
+
+    Multiple sequences can be decoded at once by passing them as a list:
+
+    >>> crf.process([obs, obs[:3]])
+    [array([0, 0, 1, 1, 1, 1], dtype=uint32), array([0, 0, 1], dtype=uint32)]
+
+    """
+    online_capable = False
+
+    def __init__(self, initial, final, bias, transition, observation):
+        self.pi = initial
+        self.tau = final
+        self.c = bias
+        self.A = transition
+        self.W = observation
+
+    def process(self, observations, **kwargs):
+        """
+        Determine the most probable configuration of Y given the state
+        sequence x:
+
+        .. math::
+            y^* = argmax_y P(Y=y|X=x)
+
+        Parameters
+        ----------
+        observations : numpy array or list
+            Observations (x) to decode the most probable state sequence for.
+            If a list (or tuple) of numpy arrays or a 3D array is given, all
+            observation sequences are decoded; any other list is treated as a
+            single observation sequence.
+
+        Returns
+        -------
+        y_star : numpy array or list
+            Most probable state sequence (list thereof if multiple observation
+            sequences are given).
+
+        """
+        # decode multiple sequences
+        if (isinstance(observations, (list, tuple)) and
+                all(isinstance(obs, np.ndarray) for obs in observations)) or \
+                (isinstance(observations, np.ndarray) and
+                 observations.ndim == 3):
+            sequences = list(observations)
+            if not sequences:
+                return []
+            # compute the observation potentials of all sequences at once
+            lengths = [len(obs) for obs in sequences]
+            potentials = self._potentials(np.concatenate(sequences))
+            starts = np.cumsum(lengths) - lengths
+            return [self._decode(potentials[start:start + length])
+                    for start, length in zip(starts, lengths)]
+        return self._decode(self._potentials(observations))
+
+    def _potentials(self, observations):
+        """
+        Compute the observation and bias potentials of all frames.
+
+        Parameters
+        ----------
+        observations : numpy array
+            Observations (x).
+
+        Returns
+        -------
+        numpy array, shape (num_observations, num_states)
+            Potentials.
+
+        """
+        observations = np.asarray(observations)
+        if observations.ndim == 1:
+            observations = observations[:, np.newaxis]
+        potentials = np.dot(observations, self.W) + self.c
+        return np.ascontiguousarray(potentials, dtype=np.float)
+
+    def _decode(self, potentials):
+        """
+        Decode the most probable state sequence.
+
+        Parameters
+        ----------
+        potentials : numpy array, shape (num_observations, num_states)
+            Observation and bias potentials of all frames.
+
+        Returns
+        -------
+        y_star : numpy array
+            Most probable state sequence.
+
+        """
+        num_observations, num_states = potentials.shape
+        y_star = np.empty(num_observations, dtype=np.uint32)
+        if num_observations == 0:
+            return y_star
+        # buffers for the recursion
+        bt_pointers = np.empty((num_observations, num_states), dtype=np.uint32)
+        viterbi = np.empty(num_states, dtype=np.float)
+        previous = np.empty(num_states, dtype=np.float)
+        # parameters of the CRF
+        cdef double [:, ::1] transition = np.ascontiguousarray(
+            np.asarray(self.A, dtype=np.float).T)
+        cdef double [::1] initial = np.ascontiguousarray(self.pi,
+                                                         dtype=np.float)
+        cdef double [::1] final = np.ascontiguousarray(self.tau,
+                                                       dtype=np.float)
+        # memoryviews of the buffers
+        cdef double [:, ::1] potentials_ = potentials
+        cdef uint32_t [:, ::1] bt_pointers_ = bt_pointers
+        cdef double [::1] viterbi_ = viterbi
+        cdef double [::1] previous_ = previous
+        cdef uint32_t [::1] y_star_ = y_star
+        with nogil:
+            _viterbi(potentials_, transition, initial, final, bt_pointers_,
+                     viterbi_, previous_, y_star_)
+        return y_star
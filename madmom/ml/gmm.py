@@ -384,3 +384,156 @@ class GMM(object):
         self.weights = gmm.weights_
         # and return self
         return self
+
+
+def _full_covars(covars, covariance_type, n_components, n_features):
+    """Expand covariance parameters to full covariance matrices."""
+    covars = np.asarray(covars, dtype=np.float)
+    if covariance_type == 'full':
+        return covars
+    if covariance_type == 'tied':
+        return np.tile(covars, (n_components, 1, 1))
+    if covariance_type == 'spherical':
+        covars = covars.reshape(n_components, -1)
+        covars = np.tile(covars, (1, n_features // covars.shape[1]))
+    # 'diag' and 'spherical' have (n_components, n_features) shape now
+    full = np.zeros((n_components, n_features, n_features))
+    full[:, np.arange(n_features), np.arange(n_features)] = covars
+    return full
+
+
+def _precision_cholesky(covars, min_covar=1.e-7):
+    """
+    Compute the Cholesky factors of the precision matrices.
+
+    Parameters
+    ----------
+    covars : numpy array, shape (n_components, n_features, n_features)
+        Full covariance matrices.
+    min_covar : float, optional
+        Regularisation added to the diagonal of covariance matrices which are
+        not positive-definite.
+
+    Returns
+    -------
+    prec_chol : numpy array, shape (n_components, n_features, n_features)
+        Upper triangular matrices `U` with `U U^T` being the precision matrix,
+        i.e. `||(x - mu) U||^2` is the squared Mahalanobis distance.
+    log_det : numpy array, shape (n_components,)
+        Log determinants of the covariance matrices.
+
+    """
+    n_components, n_dim, _ = covars.shape
+    prec_chol = np.empty_like(covars)
+    log_det = np.empty(n_components)
+    for c, cv in enumerate(covars):
+        # same handling of degenerated components as in
+        # _log_multivariate_normal_density_full()
+        try:
+            cv_chol = linalg.cholesky(cv, lower=True)
+        except linalg.LinAlgError:
+            try:
+                cv_chol = linalg.cholesky(cv + min_covar * np.eye(n_dim),
+                                          lower=True)
+            except linalg.LinAlgError:
+                raise ValueError("'covars' must be symmetric, "
+                                 "positive-definite")
+        log_det[c] = 2 * np.sum(np.log(np.diagonal(cv_chol)))
+        prec_chol[c] = linalg.solve_triangular(cv_chol, np.eye(n_dim),
+                                               lower=True).T
+    return prec_chol, log_det
+
+
+class GMMStack(object):
+    """
+    Stack of Gaussian Mixture Models which are scored jointly.
+
+    The components of all GMMs are stacked and the Cholesky factors of their
+    precision matrices, as well as the normalisation terms are computed once
+    at construction time. Scoring observations needs only a single matrix
+    multiplication for all components of all GMMs.
+
+    Parameters
+    ----------
+    gmms : list
+        List with fitted :class:`GMM` instances. All GMMs must have the same
+        number of features.
+
+    Attributes
+    ----------
+    num_gmms : int
+        Number of GMMs.
+    num_components : numpy array
+        Number of mixture components of each GMM.
+
+    """
+
+    def __init__(self, gmms):
+        # pylint: disable=protected-access
+        gmms = list(gmms)
+        if not gmms:
+            raise ValueError('at least one GMM must be given.')
+        n_features = gmms[0].means.shape[1]
+        means, prec_chol, log_norm = [], [], []
+        for gmm in gmms:
+            if gmm.means.shape[1] != n_features:
+                raise ValueError('all GMMs must have the same number of '
+                                 'features.')
+            covars = _full_covars(gmm.covars, gmm.covariance_type,
+                                  len(gmm.means), n_features)
+            chol, log_det = _precision_cholesky(covars)
+            means.append(gmm.means)
+            prec_chol.append(chol)
+            log_norm.append(np.log(gmm.weights) - 0.5 *
+                            (n_features * np.log(2 * np.pi) + log_det))
+        self.num_gmms = len(gmms)
+        self.num_components = np.asarray([len(m) for m in means])
+        # index of the first component of each GMM
+        self._first = np.cumsum(self.num_components) - self.num_components
+        prec_chol = np.concatenate(prec_chol)
+        num_comp = len(prec_chol)
+        # stack the precision Cholesky factors so that all components can be
+        # computed with a single matrix multiplication; resulting shape is
+        # (n_features, n_components * n_features)
+        self._prec_chol = np.ascontiguousarray(
+            prec_chol.transpose(1, 0, 2).reshape(n_features, -1))
+        # the means are transformed accordingly
+        self._means = np.einsum('kd,kde->ke', np.concatenate(means),
+                                prec_chol).reshape(1, num_comp, n_features)
+        self._log_norm = np.concatenate(log_norm)
+        self._n_features = n_features
+
+    def score(self, x):
+        """
+        Compute the log probabilities under all models.
+
+        Parameters
+        ----------
+        x : array_like, shape (n_samples, n_features)
+            List of n_features-dimensional data points.  Each row
+            corresponds to a single data point.
+
+        Returns
+        -------
+        log_prob : numpy array, shape (n_samples, num_gmms)
+            Log probabilities of each data point in `x` under each GMM.
+
+        """
+        x = np.asarray(x, dtype=np.float)
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        if x.shape[1] != self._n_features:
+            raise ValueError('The shape of x is not compatible with self')
+        if len(x) == 0:
+            return np.empty((0, self.num_gmms))
+        # transform the data for all components at once
+        y = np.dot(x, self._prec_chol).reshape(len(x), -1, self._n_features)
+        y -= self._means
+        # weighted log probabilities of all components
+        lpr = self._log_norm - 0.5 * np.einsum('nkd,nkd->nk', y, y)
+        # logsumexp over the components of each GMM
+        vmax = np.maximum.reduceat(lpr, self._first, axis=1)
+        lpr -= np.repeat(vmax, self.num_components, axis=1)
+        log_prob = np.log(np.add.reduceat(np.exp(lpr), self._first, axis=1))
+        log_prob += vmax
+        return log_prob
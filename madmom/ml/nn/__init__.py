@@ -109,6 +109,11 @@ class NeuralNetwork(Processor):
         for layer in self.layers:
             layer.reset()
 
+    @property
+    def online_capable(self):
+        """All layers of the neural network can be activated frame-wise."""
+        return all(layer.online_capable for layer in self.layers)
+
 
 class NeuralNetworkEnsemble(SequentialProcessor):
     """
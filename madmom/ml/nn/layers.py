@@ -22,6 +22,9 @@ class Layer(object):
     Generic callable network layer.
 
     """
+    # by default, layers need no future information, i.e. they can be
+    # activated frame by frame
+    online_capable = True
 
     def __call__(self, *args, **kwargs):
         # this magic method makes a Layer callable
@@ -199,6 +202,7 @@ class BidirectionalLayer(Layer):
         Backward layer.
 
     """
+    online_capable = False
 
     def __init__(self, fwd_layer, bwd_layer):
         self.fwd_layer = fwd_layer
@@ -737,6 +741,7 @@ class ConvolutionalLayer(FeedForwardLayer):
         Activation function.
 
     """
+    online_capable = False
 
     def __init__(self, weights, bias, stride=1, pad='valid',
                  activation_fn=linear):
@@ -801,6 +806,7 @@ class StrideLayer(Layer):
         Re-arrange (stride) the data in blocks of given size.
 
     """
+    online_capable = False
 
     def __init__(self, block_size):
         self.block_size = block_size
@@ -839,6 +845,7 @@ class MaxPoolLayer(Layer):
         If None `stride` = `size`.
 
     """
+    online_capable = False
 
     def __init__(self, size, stride=None):
         self.size = size
@@ -17,7 +17,10 @@ from __future__ import absolute_import, division, print_function
 
 import os
 import sys
+import time
+import contextlib
 import argparse
+import threading
 import itertools as it
 import multiprocessing as mp
 
@@ -25,12 +28,40 @@ import numpy as np
 
 from collections import MutableSequence
 
+try:
+    from time import perf_counter as _perf_counter
+    from time import process_time as _process_time
+except ImportError:
+    # Python 2
+    from time import time as _perf_counter
+    from time import clock as _process_time
+
 
 class Processor(object):
     """
     Abstract base class for processing data.
 
+    Attributes
+    ----------
+    online_capable : bool
+        Whether the processor is able to process data frame by frame, i.e.
+        without knowing the complete sequence in advance.
+    latency : float
+        Algorithmic latency of the processor, i.e. the amount of future
+        information needed to process a frame [seconds].
+    required_frame_size : int or None
+        Number of (past) signal samples needed to process a frame of a
+        (live) signal stream [samples].
+
+    Notes
+    -----
+    Processors needing the complete sequence, future information or a certain
+    signal frame size must overwrite the respective attributes.
+
     """
+    online_capable = True
+    latency = 0.
+    required_frame_size = None
 
     @classmethod
     def load(cls, infile):
@@ -125,6 +156,8 @@ class Processor(object):
 
     def __call__(self, *args, **kwargs):
         # this magic method makes a Processor callable
+        if _profiler is not None:
+            return _profiler.call(self, self.process, args, kwargs)
         return self.process(*args, **kwargs)
 
 
@@ -200,9 +233,349 @@ def _process(process_tuple):
         return process_tuple[0](*process_tuple[1:-1], **process_tuple[-1])
     else:
         # just call whatever we got here (e.g. a function) without kwargs
+        if _profiler is not None:
+            return _profiler.call(process_tuple[0], process_tuple[0],
+                                  process_tuple[1:-1], {})
         return process_tuple[0](*process_tuple[1:-1])
 
 
+# functions to query the online capabilities of processors
+# Note: everything callable (e.g. functions) is considered to be online-capable
+def _online_capable(processor):
+    """Online capability of the processor (or function)."""
+    return getattr(processor, 'online_capable', True)
+
+
+def _latency(processor):
+    """Latency of the processor (or function) [seconds]."""
+    return getattr(processor, 'latency', 0.)
+
+
+def _required_frame_size(processors):
+    """Maximum frame size required by any of the processors [samples]."""
+    frame_sizes = [getattr(p, 'required_frame_size', None) for p in processors]
+    frame_sizes = [f for f in frame_sizes if f is not None]
+    return max(frame_sizes) if frame_sizes else None
+
+
+# profiling of processors
+# Note: the active profiler is stored globally, so that processors called
+#       anywhere inside a processing tree are recorded
+_profiler = None
+
+
+def _shape(data):
+    """Shape of the data (or the shapes of its items for lists/tuples)."""
+    if hasattr(data, 'shape'):
+        return tuple(data.shape)
+    if isinstance(data, (list, tuple)):
+        return [_shape(d) for d in data]
+    return None
+
+
+class Profiler(object):
+    """
+    Profiler recording the run time, CPU time, input and output shapes and the
+    peak memory allocation of all processors called while it is active.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Trace the memory allocations (with `tracemalloc`, if available).
+
+    Notes
+    -----
+    Processors are identified by their path inside the processing tree, i.e.
+    the names of all processors they were called from, joined by '/'.
+    Processors running in another process (e.g. processors of a
+    :class:`ParallelProcessor` using multiple threads) are not recorded.
+
+    The peak memory allocation of a processor is the maximum amount of memory
+    allocated while it is processing, relative to the memory allocated when it
+    was called. Tracing the memory allocations slows down processing
+    considerably. For Python versions without `tracemalloc.reset_peak()`, it
+    is emulated by restarting the tracing, which discards the traces of
+    previously allocated memory; memory freed afterwards is thus not subtracted
+    and the peak memory is an upper bound.
+
+    Examples
+    --------
+    Record all processors called inside the `with` statement, and output a
+    table with the aggregated results and a trace viewable in Chrome
+    (chrome://tracing).
+
+    >>> from madmom.audio.signal import SignalProcessor, FramedSignalProcessor
+    >>> processors = [SignalProcessor(), FramedSignalProcessor()]
+    >>> proc = SequentialProcessor(processors)
+    >>> with Profiler() as profiler:
+    ...     frames = proc('tests/data/audio/sample.wav')
+    >>> print(profiler.table())  # doctest: +SKIP
+    processor                         calls  wall [s]   cpu [s]  peak [MB] ...
+    SequentialProcessor                   1     0.004     0.004       0.54 ...
+      SignalProcessor                     1     0.002     0.002       0.27 ...
+      FramedSignalProcessor               1     0.000     0.000       0.00 ...
+    >>> profiler.write_trace('trace.json')  # doctest: +SKIP
+
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.records = []
+        self._local = threading.local()
+        self._nodes = {}
+        self._names = {}
+        self._mem_base = 0
+        self._trace_memory = False
+
+    def start(self):
+        """Start recording."""
+        global _profiler
+        if _profiler is not None and _profiler is not self:
+            raise RuntimeError('another Profiler is active already.')
+        # trace memory allocations, if not done so already
+        self._trace_memory = False
+        if self.memory:
+            try:
+                import tracemalloc
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._trace_memory = True
+            except ImportError:
+                self.memory = False
+        _profiler = self
+
+    def stop(self):
+        """Stop recording."""
+        global _profiler
+        if _profiler is self:
+            _profiler = None
+        if self._trace_memory:
+            import tracemalloc
+            tracemalloc.stop()
+            self._trace_memory = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def _stack(self):
+        """Processors currently being called (by the current thread)."""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _get_memory(self):
+        """Currently traced and peak memory [bytes]."""
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        return self._mem_base + current, self._mem_base + peak
+
+    def _reset_peak(self):
+        """Reset the peak of the traced memory to the current value."""
+        import tracemalloc
+        try:
+            tracemalloc.reset_peak()
+        except AttributeError:
+            # Python < 3.9: restart tracing
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            tracemalloc.start()
+            self._mem_base += current
+
+    def _path(self, processor, parent):
+        """Path of the processor inside the processing tree."""
+        key = (parent, id(processor))
+        try:
+            return self._nodes[key]
+        except KeyError:
+            name = getattr(processor, '__name__', type(processor).__name__)
+            path = name if parent is None else '%s/%s' % (parent, name)
+            # distinguish multiple processors with the same name
+            num = self._names.get(path, 0) + 1
+            self._names[path] = num
+            if num > 1:
+                path = '%s#%d' % (path, num)
+            self._nodes[key] = path
+            return path
+
+    def call(self, processor, func, args, kwargs):
+        """
+        Call a function and record it as processor.
+
+        Parameters
+        ----------
+        processor : :class:`Processor` instance or function
+            Processor to be recorded.
+        func : function
+            Function to be called (e.g. the processor's process() method).
+        args : tuple
+            Positional arguments of the call, the first one is considered to
+            be the processor's input data.
+        kwargs : dict
+            Keyword arguments of the call.
+
+        Returns
+        -------
+        depends on the function
+            Result of the function call.
+
+        """
+        stack = self._stack
+        parent = stack[-1] if stack else None
+        node = {'path': self._path(processor,
+                                   parent['path'] if parent else None),
+                'peak': 0}
+        if self._trace_memory:
+            current, peak = self._get_memory()
+            if parent is not None:
+                parent['peak'] = max(parent['peak'], peak)
+            self._reset_peak()
+            node['memory'] = node['peak'] = current
+        stack.append(node)
+        start = time.time()
+        wall = _perf_counter()
+        cpu = _process_time()
+        try:
+            data = func(*args, **kwargs)
+        finally:
+            cpu = _process_time() - cpu
+            wall = _perf_counter() - wall
+            stack.pop()
+            peak_memory = None
+            if self._trace_memory:
+                _, peak = self._get_memory()
+                node['peak'] = max(node['peak'], peak)
+                if parent is not None:
+                    parent['peak'] = max(parent['peak'], node['peak'])
+                peak_memory = node['peak'] - node['memory']
+        self.records.append({
+            'path': node['path'], 'depth': len(stack), 'start': start,
+            'wall': wall, 'cpu': cpu, 'peak_memory': peak_memory,
+            'input_shape': _shape(args[0]) if args else None,
+            'output_shape': _shape(data), 'pid': os.getpid(),
+            'tid': threading.current_thread().ident})
+        return data
+
+    def summary(self):
+        """
+        Summary of the recorded processors, aggregated over all calls.
+
+        Returns
+        -------
+        list
+            Dictionaries with the path, depth, number of calls, total wall and
+            CPU time [seconds], maximum peak memory allocation [bytes] and the
+            input and output shapes of the last call of each processor (in
+            the order in which the processors were called first).
+
+        """
+        summary = {}
+        for record in sorted(self.records, key=lambda r: r['start']):
+            path = record['path']
+            if path not in summary:
+                summary[path] = {'path': path, 'depth': record['depth'],
+                                 'calls': 0, 'wall': 0., 'cpu': 0.,
+                                 'peak_memory': record['peak_memory'],
+                                 'first_call': record['start']}
+            node = summary[path]
+            node['calls'] += 1
+            node['wall'] += record['wall']
+            node['cpu'] += record['cpu']
+            if record['peak_memory'] is not None:
+                node['peak_memory'] = max(node['peak_memory'],
+                                          record['peak_memory'])
+            node['input_shape'] = record['input_shape']
+            node['output_shape'] = record['output_shape']
+        # sort the processors as a tree
+        first_call = {path: node['first_call']
+                      for path, node in summary.items()}
+
+        def sort_key(path):
+            """Sort by the first calls of all processors of the path."""
+            parts = path.split('/')
+            return [first_call.get('/'.join(parts[:i + 1]), 0)
+                    for i in range(len(parts))]
+
+        return [summary[path] for path in sorted(summary, key=sort_key)]
+
+    def table(self):
+        """
+        Flat table of the recorded processors, aggregated over all calls.
+
+        Returns
+        -------
+        str
+            Table with the number of calls, total wall and CPU time, maximum
+            peak memory allocation and the input and output shapes of each
+            processor, indented according to the processing tree.
+
+        """
+        summary = self.summary()
+        names = ['  ' * node['depth'] + node['path'].rsplit('/', 1)[-1]
+                 for node in summary]
+        width = max([len(name) for name in names] + [len('processor')])
+        lines = ['%-*s %6s %9s %9s %10s  %s' %
+                 (width, 'processor', 'calls', 'wall [s]', 'cpu [s]',
+                  'peak [MB]', 'input -> output shape')]
+        for name, node in zip(names, summary):
+            peak = node['peak_memory']
+            peak = '-' if peak is None else '%.2f' % (peak / 1024. / 1024.)
+            shapes = ['-' if shape is None else str(shape) for shape in
+                      (node['input_shape'], node['output_shape'])]
+            lines.append('%-*s %6d %9.3f %9.3f %10s  %s -> %s' % (
+                width, name, node['calls'], node['wall'], node['cpu'], peak,
+                shapes[0], shapes[1]))
+        return '\n'.join(lines) + '\n'
+
+    def trace_events(self):
+        """
+        Chrome trace events of the recorded processor calls.
+
+        Returns
+        -------
+        dict
+            Trace in Chrome's trace event format (complete events with
+            timestamps and durations in microseconds).
+
+        """
+        events = []
+        for record in self.records:
+            events.append({
+                'name': record['path'].rsplit('/', 1)[-1],
+                'cat': 'processor', 'ph': 'X', 'pid': record['pid'],
+                'tid': record['tid'], 'ts': record['start'] * 1e6,
+                'dur': record['wall'] * 1e6,
+                'args': {'path': record['path'], 'cpu': record['cpu'],
+                         'peak_memory': record['peak_memory'],
+                         'input_shape': record['input_shape'],
+                         'output_shape': record['output_shape']}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, outfile):
+        """
+        Write the recorded processor calls as Chrome trace (JSON).
+
+        Parameters
+        ----------
+        outfile : str or file handle
+            Output file.
+
+        """
+        import json
+        trace = json.dumps(self.trace_events())
+        try:
+            outfile.write(trace)
+        except AttributeError:
+            with open(outfile, 'w') as f:
+                f.write(trace)
+
+
 class SequentialProcessor(MutableSequence, Processor):
     """
     Processor class for sequential processing of data.
@@ -336,6 +709,21 @@ class SequentialProcessor(MutableSequence, Processor):
             data = _process((processor, data, kwargs))
         return data
 
+    @property
+    def online_capable(self):
+        """All processors of the processing chain are online-capable."""
+        return all(_online_capable(p) for p in self.processors)
+
+    @property
+    def latency(self):
+        """Total latency of the processing chain [seconds]."""
+        return sum(_latency(p) for p in self.processors)
+
+    @property
+    def required_frame_size(self):
+        """Maximum frame size required by the processing chain [samples]."""
+        return _required_frame_size(self.processors)
+
 
 # inherit from SequentialProcessor because of append() and extend()
 class ParallelProcessor(SequentialProcessor):
@@ -396,6 +784,11 @@ class ParallelProcessor(SequentialProcessor):
         return list(self.map(_process, zip(self.processors, it.repeat(data),
                                            it.repeat(kwargs))))
 
+    @property
+    def latency(self):
+        """Maximum latency of the parallel processors [seconds]."""
+        return max([_latency(p) for p in self.processors] or [0.])
+
 
 class IOProcessor(OutputProcessor):
     """
@@ -492,6 +885,54 @@ class IOProcessor(OutputProcessor):
         # process the data by the output processor and return it
         return _process((self.out_processor, data, output, kwargs))
 
+    @property
+    def online_capable(self):
+        """Input and output processors are online-capable."""
+        return (_online_capable(self.in_processor) and
+                _online_capable(self.out_processor))
+
+    @property
+    def latency(self):
+        """Total latency of the input and output processors [seconds]."""
+        return _latency(self.in_processor) + _latency(self.out_processor)
+
+    @property
+    def required_frame_size(self):
+        """Maximum frame size required by the input and output processors."""
+        return _required_frame_size((self.in_processor, self.out_processor))
+
+
+# functions to profile the processing
+@contextlib.contextmanager
+def _profiling(profile=False, profile_trace=None, **kwargs):
+    """
+    Context manager profiling the processing if requested.
+
+    Parameters
+    ----------
+    profile : bool, optional
+        Profile the processing and write a table with the results to STDERR.
+    profile_trace : str, optional
+        Profile the processing and write a Chrome trace to this file.
+
+    """
+    # pylint: disable=unused-argument
+    if not (profile or profile_trace):
+        yield None
+        return
+    with Profiler() as profiler:
+        yield profiler
+    _output_profile(profiler, profile, profile_trace)
+
+
+def _output_profile(profiler, profile=False, profile_trace=None, **kwargs):
+    """Output the results of the profiler (see :func:`_profiling`)."""
+    # pylint: disable=unused-argument
+    if profile:
+        sys.stderr.write(profiler.table())
+    if profile_trace:
+        profiler.write_trace(profile_trace)
+
 
 # functions and classes to process files with a Processor
 def process_single(processor, infile, outfile, **kwargs):
@@ -514,7 +955,8 @@ def process_single(processor, infile, outfile, **kwargs):
         kwargs['origin'] = 'online'
         kwargs['reset'] = False
     # process the input file
-    _process((processor, infile, outfile, kwargs))
+    with _profiling(**kwargs):
+        _process((processor, infile, outfile, kwargs))
 
 
 class _ParallelProcess(mp.Process):
@@ -525,15 +967,19 @@ class _ParallelProcess(mp.Process):
     ----------
     task_queue :
         Queue with tasks, i.e. tuples ('processor', 'infile', 'outfile')
+    profile_queue : optional
+        Queue to put the profiling records of each task into; if 'None', the
+        tasks are not profiled.
 
     Notes
     -----
     Usually, multiple instances are created via :func:`process_batch`.
 
     """
-    def __init__(self, task_queue):
+    def __init__(self, task_queue, profile_queue=None):
         super(_ParallelProcess, self).__init__()
         self.task_queue = task_queue
+        self.profile_queue = profile_queue
 
     def run(self):
         """Process all tasks from the task queue."""
@@ -541,11 +987,20 @@ class _ParallelProcess(mp.Process):
         while True:
             # get the task tuple
             processor, infile, outfile, kwargs = self.task_queue.get()
+            profiler = None
+            if self.profile_queue is not None:
+                profiler = Profiler()
+                profiler.start()
             try:
                 # process the Processor with the data
                 _process((processor, infile, outfile, kwargs))
             except LoadAudioFileError as e:
                 print(e)
+            finally:
+                # send the profiling records of this task
+                if profiler is not None:
+                    profiler.stop()
+                    self.profile_queue.put(profiler.records)
             # signal that it is done
             self.task_queue.task_done()
 
@@ -584,6 +1039,10 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
     methods with high memory consumptions if consecutive files are rather
     long).
 
+    If `profile` or `profile_trace` is given as keyword argument, the
+    processing of all files is profiled and the aggregated results are output
+    (see :class:`Profiler`).
+
     """
     # pylint: disable=unused-argument
     # either output_dir or output_suffix must be given
@@ -600,8 +1059,12 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
 
     # create task queue
     tasks = mp.JoinableQueue()
+    # create queue for the profiling records
+    profiling = kwargs.get('profile') or kwargs.get('profile_trace')
+    profiles = mp.Queue() if profiling else None
     # create working threads
-    processes = [_ParallelProcess(tasks) for _ in range(num_workers)]
+    processes = [_ParallelProcess(tasks, profiles)
+                 for _ in range(num_workers)]
     for p in processes:
         p.daemon = True
         p.start()
@@ -628,6 +1091,12 @@ def process_batch(processor, files, output_dir=None, output_suffix=None,
         tasks.put((processor, input_file, output_file, kwargs))
     # wait for all processing tasks to finish
     tasks.join()
+    # aggregate the profiling records of all tasks
+    if profiling:
+        profiler = Profiler()
+        for _ in files:
+            profiler.records.extend(profiles.get())
+        _output_profile(profiler, **kwargs)
 
 
 # processor for buffering data
@@ -639,6 +1108,11 @@ class BufferProcessor(Processor):
     ----------
     buffer_size : int or tuple
         Size of the buffer (time steps, [additional dimensions]).
+    init : numpy array, optional
+        Init the buffer with this array.
+    init_value : float, optional
+        If only `buffer_size` is given but no `init`, use this value to
+        initialise the buffer.
 
     Notes
     -----
@@ -649,6 +1123,13 @@ class BufferProcessor(Processor):
     E.g. SpectrogramDifference needs a context of two frames to be able to
     compute the difference between two consecutive frames.
 
+    The buffer is implemented as a circular buffer, which stores all items
+    twice (in a backing array of double length). This way, the last
+    `buffer_size` items are always available as a contiguous view and adding
+    new data only copies the data itself but not the whole buffer. The
+    returned buffer is thus updated in place by subsequent calls; copy it if
+    it needs to be retained.
+
     """
 
     def __init__(self, buffer_size=None, init=None, init_value=0):
@@ -664,7 +1145,34 @@ class BufferProcessor(Processor):
             init = np.ones(buffer_size) * init_value
         # save variables
         self.buffer_size = buffer_size
-        self.buffer = init
+        self.init = init
+        self.reset()
+
+    def reset(self, init=None):
+        """
+        Reset BufferProcessor to its initial state.
+
+        Parameters
+        ----------
+        init : numpy array, optional
+            Init the buffer with this array instead of the initial one.
+
+        """
+        if init is None:
+            init = self.init
+        self._buffer = None
+        self._start = 0
+        if init is not None:
+            # backing array of double size, the items are stored twice
+            # Note: np.tile() keeps subclasses (and their attributes) intact
+            self._buffer = np.tile(init, (2, ) + (1, ) * (init.ndim - 1))
+
+    @property
+    def buffer(self):
+        """Contiguous view of the buffered data."""
+        if self._buffer is None:
+            return None
+        return self._buffer[self._start:self._start + len(self._buffer) // 2]
 
     def process(self, data, **kwargs):
         """
@@ -685,16 +1193,204 @@ class BufferProcessor(Processor):
         ndmin = len(self.buffer_size)
         # cast the data to have that many dimensions
         data = np.array(data, copy=False, subok=True, ndmin=ndmin)
-        # length of the data
-        data_length = len(data)
-        # remove `data_length` from buffer at the beginning and append new data
-        self.buffer = np.roll(self.buffer, -data_length, axis=0)
-        self.buffer[-data_length:] = data
+        # size of the buffer
+        size = len(self._buffer) // 2
+        # keep only the last `size` items
+        data = data[-size:]
+        # the new data replaces the oldest items, i.e. those at the beginning
+        # of the current view, in both halves of the backing array
+        idx = (self._start + np.arange(len(data))) % size
+        self._buffer[idx] = data
+        self._buffer[idx + size] = data
+        # move the start of the view behind the newly added data
+        self._start = (self._start + len(data)) % size
         # return the complete buffer
         return self.buffer
 
-    # alias for easier / more intuitive calling
-    buffer = process
+
+# functions to serve a processor
+# Note: the processor (and keyword arguments) of the server workers; this is
+#       set once when the workers are started and used for all requests
+_server = None
+
+
+def _init_server_worker(processor, kwargs):
+    """Set the processor used by the server worker."""
+    global _server
+    _server = (processor, kwargs)
+
+
+def _parse_request(request, num_channels=1, **kwargs):
+    """
+    Parse a request sent to the server.
+
+    Parameters
+    ----------
+    request : bytes
+        Request, either an input file name (terminated by a newline), or a
+        header line 'pcm <sample_rate> [<num_channels> [<dtype>]]' followed by
+        raw (interleaved) PCM samples.
+    num_channels : int, optional
+        Up-/down-mix raw PCM samples to this number of channels.
+
+    Returns
+    -------
+    str or :class:`.audio.signal.Signal` instance
+        Input file name or signal.
+
+    """
+    # pylint: disable=unused-argument
+    header, _, data = request.partition(b'\n')
+    header = header.decode('utf-8').strip()
+    if not header.startswith('pcm '):
+        return header
+    from .audio.signal import Signal, remix
+    header = header.split()
+    sample_rate = int(header[1])
+    channels = int(header[2]) if len(header) > 2 else 1
+    dtype = np.dtype(header[3]) if len(header) > 3 else np.int16
+    # keep only complete samples
+    data = np.frombuffer(data, dtype=dtype)
+    data = data[:len(data) // channels * channels]
+    if channels > 1:
+        data = data.reshape(-1, channels)
+    # Note: Signal does not remix arrays, thus do it here like it is done
+    #       when audio files are loaded
+    return Signal(remix(data, num_channels or 1), sample_rate=sample_rate)
+
+
+def _serve_request(request):
+    """
+    Process a request with the processor of the server worker.
+
+    Parameters
+    ----------
+    request : bytes
+        Request (see :func:`_parse_request`).
+
+    Returns
+    -------
+    bytes
+        Output of the processor or an error message starting with 'ERROR:'.
+
+    """
+    import io
+    processor, kwargs = _server
+    output = io.BytesIO()
+    try:
+        data = _parse_request(request, **kwargs)
+        _process((processor, data, output, kwargs))
+    except Exception as e:
+        # report errors to the client but keep serving
+        # pylint: disable=broad-except
+        return ('ERROR: %s\n' % e).encode('utf-8')
+    return output.getvalue()
+
+
+def _serve_connection(pool, connection):
+    """Read a request from a connection and send the response."""
+    with contextlib.closing(connection):
+        request = bytearray()
+        while True:
+            data = connection.recv(65536)
+            if not data:
+                break
+            request.extend(data)
+            # a file name is terminated by a newline, raw PCM samples by
+            # shutting down the writing side of the connection
+            if b'\n' in request and not request.startswith(b'pcm '):
+                break
+        connection.sendall(pool.apply(_serve_request, (bytes(request), )))
+
+
+def process_server(processor, address=None, infile=None, outfile=None,
+                   num_workers=mp.cpu_count(), **kwargs):
+    """
+    Serve the Processor, i.e. process all requests sent to it.
+
+    The processor is loaded only once and all requests are processed by a
+    pool of worker processes.
+
+    Parameters
+    ----------
+    processor : :class:`Processor` instance
+        Processor to be served.
+    address : str, optional
+        Path of the Unix domain socket to listen on. If 'None', the input file
+        names are read line by line from `infile`.
+    infile : file handle, optional
+        Binary file handle to read the input file names from (if no `address`
+        is given) [default: STDIN].
+    outfile : file handle, optional
+        Binary file handle to write the output to (if no `address` is given)
+        [default: STDOUT].
+    num_workers : int, optional
+        Number of workers processing the requests in parallel.
+    kwargs : dict, optional
+        Keyword arguments for processing.
+
+    Notes
+    -----
+    Every connection to the socket is a single request, either an input file
+    name (terminated by a newline) or a header line
+    'pcm <sample_rate> [<num_channels> [<dtype>]]' followed by raw
+    (interleaved) PCM samples (terminated by shutting down the writing side
+    of the connection). Raw PCM samples are down-mixed to mono, unless
+    `num_channels` is given as keyword argument. The output of the processor
+    is sent back, then the connection is closed.
+
+    When reading from `infile`, the outputs are written in the order of the
+    input file names, each followed by an empty line.
+
+    If processing fails, an error message starting with 'ERROR:' is returned
+    instead of the output.
+
+    Raises
+    ------
+    IOError
+        If `address` exists and is not a socket.
+
+    """
+    # remove the socket file of a previous server, but nothing else
+    if address is not None and os.path.exists(address):
+        import stat
+        if not stat.S_ISSOCK(os.stat(address).st_mode):
+            raise IOError('%s exists and is not a socket.' % address)
+        os.unlink(address)
+    # create the worker pool, the workers inherit the loaded processor
+    pool = mp.Pool(num_workers, _init_server_worker, (processor, kwargs))
+    try:
+        if address is None:
+            # read the input file names line by line
+            if infile is None:
+                infile = getattr(sys.stdin, 'buffer', sys.stdin)
+            if outfile is None:
+                outfile = getattr(sys.stdout, 'buffer', sys.stdout)
+            requests = (line for line in iter(infile.readline, b'')
+                        if line.strip())
+            for output in pool.imap(_serve_request, requests):
+                outfile.write(output + b'\n')
+                outfile.flush()
+        else:
+            import signal
+            import socket
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            # clean up when terminated
+            signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+            try:
+                server.bind(address)
+                server.listen(max(num_workers, 1) * 4)
+                while True:
+                    connection, _ = server.accept()
+                    thread = threading.Thread(target=_serve_connection,
+                                              args=(pool, connection))
+                    thread.daemon = True
+                    thread.start()
+            finally:
+                server.close()
+                os.unlink(address)
+    finally:
+        pool.terminate()
 
 
 # function to process live input
@@ -706,31 +1402,51 @@ def process_online(processor, infile, outfile, **kwargs):
     ----------
     processor : :class:`Processor` instance
         Processor to be processed.
-    infile : str or file handle, optional
-        Input file (handle). If none is given, the stream present at the
-        system's audio inpup is used. Additional keyword arguments can be used
-        to influence the frame size and hop size.
+    infile : str, file handle, :class:`.audio.signal.Stream` or
+             :class:`.audio.signal.StreamSource` instance, optional
+        Input file (handle), stream or source of a stream. If none is given,
+        the stream present at the system's audio inpup is used. Additional
+        keyword arguments can be used to influence the frame size and hop
+        size.
     outfile : str or file handle
         Output file (handle).
     kwargs : dict, optional
         Keyword arguments passed to :class:`.audio.signal.Stream` if
-        `in_stream` is 'None'.
+        `infile` is 'None' or a :class:`.audio.signal.StreamSource`.
 
     Notes
     -----
-    Right now there is no way to determine if a processor is online-capable or
-    not. Thus, calling any processor with this function may not produce the
-    results expected.
+    The size of the frames fed into the processor is set to the maximum frame
+    size required by any of the processors (e.g. `FramedSignalProcessor`). If
+    no processor declares its requirements, the `frame_size` given as keyword
+    argument is used.
+
+    Raises
+    ------
+    ValueError
+        If the processor is not online-capable.
 
     """
-    from madmom.audio.signal import Stream, FramedSignal
+    from madmom.audio.signal import Stream, StreamSource, FramedSignal
+    # refuse processors which need the complete sequence
+    if not _online_capable(processor):
+        raise ValueError('%s is not online-capable.' %
+                         processor.__class__.__name__)
     # set default values
     kwargs['sample_rate'] = kwargs.get('sample_rate', 44100)
     kwargs['num_channels'] = kwargs.get('num_channels', 1)
+    # use the frame size required by the processor
+    frame_size = _required_frame_size([processor])
+    if frame_size is not None:
+        kwargs['frame_size'] = frame_size
     # if no iput file is given, create a Stream with the given arguments
-    if infile is None:
-        # open a stream and start if not running already
-        stream = Stream(**kwargs)
+    if infile is None or isinstance(infile, (Stream, StreamSource)):
+        # open a stream (reading from the given source) and start if not
+        # running already
+        if isinstance(infile, Stream):
+            stream = infile
+        else:
+            stream = Stream(source=infile, **kwargs)
         if not stream.is_running():
             stream.start()
     # use the input file
@@ -740,12 +1456,11 @@ def process_online(processor, infile, outfile, **kwargs):
         frame_size = kwargs.get('frame_size', FRAME_SIZE)
         hop_size = kwargs.get('hop_size', HOP_SIZE)
         fps = kwargs.get('fps', FPS)
-        # FIXME: overwrite the frame size with the maximum value of all used
-        #        processors. This is needed if multiple frame sizes are used
-        import warnings
-        warnings.warn('make sure that the `frame_size` (%d) is equal to the '
-                      'maximum value used by any `FramedSignalProcessor`.' %
-                      frame_size)
+        if _required_frame_size([processor]) is None:
+            import warnings
+            warnings.warn('make sure that the `frame_size` (%d) is equal to '
+                          'the maximum value used by any '
+                          '`FramedSignalProcessor`.' % frame_size)
         # Note: origin must be 'online' and num_frames 'None' to behave exactly
         #       the same as with live input
         stream = FramedSignal(infile, frame_size=frame_size, hop_size=hop_size,
@@ -755,8 +1470,9 @@ def process_online(processor, infile, outfile, **kwargs):
     #       processors at every time step (kwargs contains file handles etc.)
     process_args = {'reset': False}  # do not reset stateful processors
     # process everything frame-by-frame
-    for frame in stream:
-        _process((processor, frame, outfile, process_args))
+    with _profiling(**kwargs):
+        for frame in stream:
+            _process((processor, frame, outfile, process_args))
 
 
 # function for pickling a processor
@@ -801,6 +1517,13 @@ def io_arguments(parser, output_suffix='.txt', pickle=True, online=False):
     # add general options
     parser.add_argument('-v', dest='verbose', action='count',
                         help='increase verbosity level')
+    parser.add_argument('--profile', action='store_true',
+                        help='profile the processors and output the run '
+                             'time, CPU time, memory usage and data shapes '
+                             'of every processor to STDERR')
+    parser.add_argument('--trace', dest='profile_trace', default=None,
+                        help='profile the processors and save the results as '
+                             'Chrome trace (JSON) to this file')
     # add subparsers
     sub_parsers = parser.add_subparsers(title='processing options')
 
@@ -849,6 +1572,22 @@ def io_arguments(parser, output_suffix='.txt', pickle=True, online=False):
                          'order]')
     sp.set_defaults(num_threads=1)
 
+    # server options
+    sp = sub_parsers.add_parser(
+        'serve', help='serve the processor, i.e. load it once and process '
+                      'input files or raw PCM samples sent via a Unix domain '
+                      'socket or STDIN')
+    sp.set_defaults(func=process_server)
+    sp.add_argument('address', nargs='?', default=None,
+                    help='Unix domain socket to listen on [default: read '
+                         'input file names line by line from STDIN]')
+    sp.add_argument('-o', dest='outfile', type=argparse.FileType('wb'),
+                    default=output, help='output file if reading from STDIN '
+                                         '[default: STDOUT]')
+    sp.add_argument('-j', dest='num_workers', type=int, default=mp.cpu_count(),
+                    help='number of workers [default=%(default)s]')
+    sp.set_defaults(num_threads=1)
+
     # online processing options
     if online:
         sp = sub_parsers.add_parser('online', help='online processing')
@@ -12,6 +12,9 @@ from __future__ import absolute_import, division, print_function
 
 import argparse
 import contextlib
+import fnmatch
+import os
+import warnings
 
 import numpy as np
 
@@ -53,7 +56,6 @@ def suppress_warnings(function):
             Decorated function.
 
         """
-        import warnings
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             return function(*args, **kwargs)
@@ -79,7 +81,6 @@ def filter_files(files, suffix):
         List of files.
 
     """
-    import fnmatch
     # make sure files is a list
     if not isinstance(files, list):
         files = [files]
@@ -117,7 +118,6 @@ def search_path(path, recursion_depth=0):
 
     """
     # adapted from http://stackoverflow.com/a/234329
-    import os
     # remove the rightmost path separator (needed for recursion depth count)
     path = path.rstrip(os.path.sep)
     # we can only handle directories
@@ -161,7 +161,6 @@ def search_files(files, suffix=None, recursion_depth=0):
     The list of returned files is sorted.
 
     """
-    import os
     file_list = []
     # determine the files
     if isinstance(files, list):
@@ -235,9 +234,6 @@ def match_file(filename, match_list, suffix=None, match_suffix=None,
     Asterisks "*" can be used to match any string or suffix.
 
     """
-    import os
-    import fnmatch
-
     # get the base name without the path
     basename = os.path.basename(strip_suffix(filename, suffix))
     # init return list
@@ -256,6 +252,40 @@ def match_file(filename, match_list, suffix=None, match_suffix=None,
     return matches
 
 
+def index_files(files, suffix=None):
+    """
+    Index files by their base name without suffix.
+
+    Parameters
+    ----------
+    files : list
+        List of filenames or strings to index.
+    suffix : str, optional
+        Index only files with this suffix (which is stripped off).
+
+    Returns
+    -------
+    dict
+        Dictionary with base names as keys and lists of matching files as
+        values.
+
+    Notes
+    -----
+    Looking up ``os.path.basename(strip_suffix(filename, suffix))`` in the
+    index yields the same files as :func:`match_file` with `match_exactly`
+    set, but takes constant instead of linear time per lookup.
+
+    """
+    index = {}
+    for f in files:
+        # filter the files with the given suffix (asterisks are allowed)
+        if suffix is not None and not fnmatch.fnmatch(f, '*%s' % suffix):
+            continue
+        basename = os.path.basename(strip_suffix(f, suffix))
+        index.setdefault(basename, []).append(f)
+    return index
+
+
 @suppress_warnings
 def load_events(filename):
     """
@@ -326,7 +356,9 @@ def combine_events(events, delta, combine='mean'):
     Parameters
     ----------
     events : list or numpy array
-        Events to be combined.
+        Events to be combined. If 2D, the first column contains the event
+        times and events are only combined with events of the same value in
+        the second column (e.g. notes with the same MIDI pitch).
     delta : float
         Combination delta. All events within this `delta` are combined.
     combine : {'mean', 'left', 'right'}
@@ -341,7 +373,14 @@ def combine_events(events, delta, combine='mean'):
     numpy array
         Combined events.
 
+    Notes
+    -----
+    The order of the events is kept. The other columns of combined 2D events
+    are taken from the left event ('mean', 'left') or the right event
+    ('right').
+
     """
+    from .events import combine_times
     # add a small value to delta, otherwise we end up in floating point hell
     delta += 1e-12
     # return immediately if possible
@@ -349,29 +388,15 @@ def combine_events(events, delta, combine='mean'):
         return events
     # create working copy
     events = np.array(events, copy=True)
-    # set start position
-    idx = 0
-    # get first event
-    left = events[idx]
-    # iterate over all remaining events
-    for right in events[1:]:
-        if right - left <= delta:
-            # combine the two events
-            if combine == 'mean':
-                left = events[idx] = 0.5 * (right + left)
-            elif combine == 'left':
-                left = events[idx] = left
-            elif combine == 'right':
-                left = events[idx] = right
-            else:
-                raise ValueError("don't know how to combine two events with "
-                                 "%s" % combine)
-        else:
-            # move forward
-            idx += 1
-            left = events[idx] = right
-    # return the combined events
-    return events[:idx + 1]
+    if events.ndim == 1:
+        idx, times = combine_times(events, delta, combine)
+        return times.astype(events.dtype)
+    # combine the times of the events separately for each group
+    idx, times = combine_times(events[:, 0], delta, combine,
+                               groups=events[:, 1])
+    events = events[idx]
+    events[:, 0] = times
+    return events
 
 
 def quantize_events(events, fps, length=None, shift=None):
@@ -381,7 +406,9 @@ def quantize_events(events, fps, length=None, shift=None):
     Parameters
     ----------
     events : numpy array
-        Events to be quantized.
+        Events to be quantized. If 2D, the first column contains the event
+        times and the second column the (integer) index of the event class
+        (e.g. MIDI pitch).
     fps : float
         Quantize with `fps` frames per second.
     length : int, optional
@@ -392,14 +419,20 @@ def quantize_events(events, fps, length=None, shift=None):
     Returns
     -------
     numpy array
-        Quantized events.
+        Quantized events. If `events` is 2D, the returned array has one column
+        for each event class, i.e. shape (length, max. class index + 1).
 
     """
     # convert to numpy array if needed
     events = np.asarray(events, dtype=np.float)
+    if events.ndim > 1:
+        classes = events[:, 1].astype(np.int)
+        events = events[:, 0]
+    else:
+        classes = None
     # shift all events if needed
     if shift:
-        events += shift
+        events = events + shift
     # determine the length for the quantized array
     if length is None:
         # set the length to be long enough to cover all events
@@ -407,14 +440,20 @@ def quantize_events(events, fps, length=None, shift=None):
     else:
         # else filter all events which do not fit in the array
         # since we apply rounding later, we need to subtract half a bin
-        events = events[:np.searchsorted(events, float(length - 0.5) / fps)]
-    # init array
-    quantized = np.zeros(length)
-    # quantize
-    events *= fps
+        valid = events < float(length - 0.5) / fps
+        events = events[valid]
+        if classes is not None:
+            classes = classes[valid]
     # indices to be set in the quantized array
-    idx = np.unique(np.round(events).astype(np.int))
-    quantized[idx] = 1
+    idx = np.round(events * fps).astype(np.int)
+    # init array and quantize
+    if classes is None:
+        quantized = np.zeros(length)
+        quantized[idx] = 1
+    else:
+        quantized = np.zeros((length, np.max(classes) + 1 if len(classes)
+                              else 0))
+        quantized[idx, classes] = 1
     # return the quantized array
     return quantized
 
@@ -579,7 +618,6 @@ def segment_axis(signal, frame_size, hop_size, axis=None, end='cut',
                                   dtype=signal.dtype)
     except TypeError:
         # TODO: remove warning?
-        import warnings
         warnings.warn("Problem with ndarray creation forces copy.")
         signal = signal.copy()
         # shape doesn't change but strides does
@@ -0,0 +1,138 @@
+# encoding: utf-8
+# cython: embedsignature=True
+"""
+This module contains the speed crucial event combination functionality.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+# how to combine the events
+COMBINE_MODES = {'mean': 0, 'left': 1, 'right': 2}
+
+
+def combine_times(times, delta, combine='mean', groups=None):
+    """
+    Combine all event times within a certain range.
+
+    Events are processed in the given order. An event is combined with the
+    current (i.e. last not combined) event of the same group if it is not
+    more than `delta` later.
+
+    Parameters
+    ----------
+    times : numpy array, shape (num_events,)
+        Event times.
+    delta : float
+        Combination delta.
+    combine : {'mean', 'left', 'right'}
+        How to combine two adjacent events:
+
+            - 'mean': replace by the mean of the two events
+            - 'left': replace by the left of the two events
+            - 'right': replace by the right of the two events
+    groups : numpy array, shape (num_events,), optional
+        Group (e.g. MIDI note) of the events, only events of the same group
+        are combined.
+
+    Returns
+    -------
+    indices : numpy array
+        Index of the event (i.e. the left or right one) each combined event
+        refers to.
+    times : numpy array
+        Times of the combined events.
+
+    Notes
+    -----
+    The combined events are ordered by the index of their first event. The
+    combination takes linear time and is computed without holding the GIL.
+
+    """
+    cdef int mode
+    try:
+        mode = COMBINE_MODES[combine]
+    except KeyError:
+        raise ValueError("don't know how to combine two events with %s" %
+                         combine)
+    cdef double delta_ = delta
+    cdef double [::1] times_ = np.ascontiguousarray(times, dtype=np.float)
+    cdef Py_ssize_t num_events = len(times_)
+    cdef Py_ssize_t num_groups = 1
+    if groups is None:
+        groups = np.zeros(num_events, dtype=np.intp)
+    else:
+        # map the groups to consecutive numbers
+        _, groups = np.unique(groups, return_inverse=True)
+        num_groups = np.max(groups) + 1 if num_events else 1
+    cdef Py_ssize_t [::1] groups_ = np.ascontiguousarray(groups,
+                                                         dtype=np.intp)
+    indices = np.empty(num_events, dtype=np.intp)
+    combined = np.empty(num_events, dtype=np.float)
+    current = np.empty(num_groups, dtype=np.intp)
+    cdef Py_ssize_t [::1] indices_ = indices
+    cdef double [::1] combined_ = combined
+    cdef Py_ssize_t [::1] current_ = current
+    cdef Py_ssize_t num_combined
+    with nogil:
+        num_combined = _combine_times(times_, groups_, delta_, mode, indices_,
+                                      combined_, current_)
+    return indices[:num_combined], combined[:num_combined]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _combine_times(double [::1] times, Py_ssize_t [::1] groups,
+                               double delta, int mode,
+                               Py_ssize_t [::1] indices, double [::1] combined,
+                               Py_ssize_t [::1] current) nogil:
+    """
+    Combine the event times.
+
+    Parameters
+    ----------
+    times : double memoryview
+        Event times.
+    groups : Py_ssize_t memoryview
+        Group of the events (consecutive numbers starting at 0).
+    delta : double
+        Combination delta.
+    mode : int
+        Combination mode (0: 'mean', 1: 'left', 2: 'right').
+    indices : Py_ssize_t memoryview
+        Buffer for the indices of the combined events.
+    combined : double memoryview
+        Buffer for the times of the combined events.
+    current : Py_ssize_t memoryview
+        Buffer for the current combined event of each group.
+
+    Returns
+    -------
+    Py_ssize_t
+        Number of combined events.
+
+    """
+    cdef Py_ssize_t i, j, num_combined = 0
+    current[:] = -1
+    for i in range(times.shape[0]):
+        j = current[groups[i]]
+        if j >= 0 and times[i] - combined[j] <= delta:
+            # combine the two events
+            if mode == 0:
+                combined[j] = 0.5 * (times[i] + combined[j])
+            elif mode == 2:
+                combined[j] = times[i]
+                indices[j] = i
+        else:
+            # start a new combined event
+            combined[num_combined] = times[i]
+            indices[num_combined] = i
+            current[groups[i]] = num_combined
+            num_combined += 1
+    return num_combined
@@ -55,6 +55,9 @@ import math
 import struct
 import numpy as np
 
+from .midi_parser import (parse_track, write_track, EVENT_DTYPE, META_EVENT,
+                          SYSEX_EVENT)
+
 
 # constants
 OCTAVE_MAX_VALUE = 12
@@ -1084,6 +1087,108 @@ def _add_channel(notes, channel=0):
     raise ValueError('unable to handle `notes` with %d columns' % columns)
 
 
+def _events_from_array(events, data):
+    """
+    Create event objects from an event array.
+
+    Parameters
+    ----------
+    events : numpy structured array
+        Events (see :func:`madmom.utils.midi_parser.parse_track`).
+    data : bytes or bytearray
+        Data the offsets of the events refer to.
+
+    Returns
+    -------
+    list
+        :class:`Event` instances.
+
+    """
+    data = bytearray(data)
+    event_list = []
+    for tick, status, channel, data1, _, offset, length in events.tolist():
+        event_data = list(data[offset:offset + length])
+        if status == META_EVENT:
+            event_cls = EventRegistry.meta_events.get(data1, UnknownMetaEvent)
+            event_list.append(event_cls(tick=tick, data=event_data,
+                                        meta_command=data1))
+        elif status == SYSEX_EVENT:
+            event_list.append(SysExEvent(tick=tick, data=event_data))
+        else:
+            event_cls = EventRegistry.events[status]
+            event_list.append(event_cls(tick=tick, channel=channel,
+                                        data=event_data))
+    return event_list
+
+
+def _array_from_events(events):
+    """
+    Create an event array from event objects.
+
+    Parameters
+    ----------
+    events : list
+        :class:`Event` instances.
+
+    Returns
+    -------
+    events : numpy structured array
+        Events (see :func:`madmom.utils.midi_parser.parse_track`).
+    data : bytearray
+        Data the offsets of the events refer to.
+
+    """
+    data = bytearray()
+    event_list = []
+    for e in events:
+        offset = len(data)
+        data.extend(e.data)
+        if isinstance(e, MetaEvent):
+            event_list.append((e.tick, META_EVENT, 0, e.meta_command, 0,
+                               offset, len(e.data)))
+        elif isinstance(e, SysExEvent):
+            event_list.append((e.tick, SYSEX_EVENT, 0, 0, 0, offset,
+                               len(e.data)))
+        elif isinstance(e, Event):
+            data1 = e.data[0] if len(e.data) > 0 else 0
+            data2 = e.data[1] if len(e.data) > 1 else 0
+            event_list.append((e.tick, e.status_msg, e.channel, data1, data2,
+                               offset, len(e.data)))
+        else:
+            raise ValueError("Unknown MIDI Event: " + str(e))
+    return np.array(event_list, dtype=EVENT_DTYPE), data
+
+
+def _sort_events(events):
+    """
+    Sort an event array the same way as event objects are sorted.
+
+    Parameters
+    ----------
+    events : numpy structured array
+        Events (see :func:`madmom.utils.midi_parser.parse_track`).
+
+    Returns
+    -------
+    numpy structured array
+        Events sorted by their ticks and the `sort` attribute of their event
+        classes; the order of otherwise equal events is kept.
+
+    """
+    sort = np.zeros(len(events))
+    for status in np.unique(events['status']):
+        idx = events['status'] == status
+        if status == META_EVENT:
+            for cmd in np.unique(events['data1'][idx]):
+                event_cls = EventRegistry.meta_events.get(cmd,
+                                                          UnknownMetaEvent)
+                sort[idx & (events['data1'] == cmd)] = event_cls.sort
+        else:
+            sort[idx] = EventRegistry.events[status].sort
+    # lexsort is stable
+    return events[np.lexsort((sort, events['tick']))]
+
+
 # MIDI Track
 class MIDITrack(object):
     """
@@ -1145,19 +1250,43 @@ class MIDITrack(object):
             # do not sort the events, since they can have relative timing!
             self.events = events
 
-    def _make_ticks_abs(self):
-        """Make the track's events timing information absolute."""
-        running_tick = 0
-        for event in self.events:
-            event.tick += running_tick
-            running_tick = event.tick
+    @property
+    def events(self):
+        """Events of the track."""
+        if self._events is None:
+            # create the event objects only when they are needed, from now on
+            # the events (which can be altered) are used
+            self._events = _events_from_array(self._event_array, self._data)
+            self._event_array = self._data = None
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        """Set the events of the track."""
+        self._events = events
+        self._event_array = self._data = None
+
+    @property
+    def event_array(self):
+        """
+        Events of the track as a structured numpy array.
+
+        See :func:`madmom.utils.midi_parser.parse_track` for a description of
+        the fields. The `offset` and `length` fields refer to `event_data`.
+
+        """
+        return self._arrays()[0]
+
+    @property
+    def event_data(self):
+        """Data of the events referred to by `event_array`."""
+        return self._arrays()[1]
 
-    def _make_ticks_rel(self):
-        """Make the track's events timing information relative."""
-        running_tick = 0
-        for event in self.events:
-            event.tick -= running_tick
-            running_tick += event.tick
+    def _arrays(self):
+        """Event array and the data its `offset` and `length` refer to."""
+        if self._event_array is None:
+            return _array_from_events(self._events)
+        return self._event_array, self._data
 
     @property
     def data_stream(self):
@@ -1166,39 +1295,13 @@ class MIDITrack(object):
 
         """
         # sort the events
-        self.events.sort()
-        # first make sure the timing information is relative
-        self._make_ticks_rel()
-        # and unset the status message
-        status = None
+        if self._events is None:
+            self._event_array = _sort_events(self._event_array)
+        else:
+            self._events.sort()
         # then encode all events of the track
-        track_data = bytearray()
-        for event in self.events:
-            # encode the event data, first the timing information
-            track_data.extend(write_variable_length(event.tick))
-            # is the event a MetaEvent?
-            if isinstance(event, MetaEvent):
-                track_data.append(event.status_msg)
-                track_data.append(event.meta_command)
-                track_data.extend(write_variable_length(len(event.data)))
-                track_data.extend(event.data)
-            # is this event a SysEx Event?
-            elif isinstance(event, SysExEvent):
-                track_data.append(0xF0)
-                track_data.extend(event.data)
-                track_data.append(0xF7)
-            # not a meta or SysEx event, must be a general message
-            elif isinstance(event, Event):
-                if not status or status.status_msg != event.status_msg or \
-                        status.channel != event.channel:
-                    status = event
-                    track_data.append(event.status_msg | event.channel)
-                track_data.extend(event.data)
-            else:
-                raise ValueError("Unknown MIDI Event: " + str(event))
         # TODO: should we add a EndOfTrackEvent?
-        # convert events back to absolute ticks
-        self._make_ticks_abs()
+        track_data = write_track(*self._arrays())
         # prepare the data
         data = bytearray()
         # generate a MIDI header
@@ -1225,80 +1328,46 @@ class MIDITrack(object):
             :class:`MIDITrack` instance
 
         """
-        events = []
-        # reset the status
-        status = None
         # first four bytes are Track header
         chunk = midi_stream.read(4)
         if chunk != b'MTrk':
             raise TypeError("Bad track header in MIDI file: %s" % chunk)
         # next four bytes are track size
         track_size = struct.unpack(">L", midi_stream.read(4))[0]
-        track_data = iter(midi_stream.read(track_size))
-        # read in all events
-        while True:
-            try:
-                # first datum is variable length representing the delta-time
-                tick = read_variable_length(track_data)
-                # next byte is status message
-                status_msg = byte2int(next(track_data))
-                # is the event a MetaEvent?
-                if MetaEvent.status_msg == status_msg:
-                    meta_cmd = byte2int(next(track_data))
-                    if meta_cmd not in EventRegistry.meta_events:
-                        import warnings
-                        warnings.warn("Unknown Meta MIDI Event: %s" % meta_cmd)
-                        event_cls = UnknownMetaEvent
-                    else:
-                        event_cls = EventRegistry.meta_events[meta_cmd]
-                    data_len = read_variable_length(track_data)
-                    data = [byte2int(next(track_data)) for _ in
-                            range(data_len)]
-                    # create an event and append it to the list
-                    events.append(event_cls(tick=tick, data=data,
-                                            meta_command=meta_cmd))
-                # is this event a SysEx Event?
-                elif SysExEvent.status_msg == status_msg:
-                    data = []
-                    while True:
-                        datum = byte2int(next(track_data))
-                        if datum == 0xF7:
-                            break
-                        data.append(datum)
-                    # create an event and append it to the list
-                    events.append(SysExEvent(tick=tick, data=data))
-                # not a meta or SysEx event, must be a general MIDI event
-                else:
-                    key = status_msg & 0xF0
-                    if key not in EventRegistry.events:
-                        assert status, "Bad byte value"
-                        data = []
-                        key = status & 0xF0
-                        event_cls = EventRegistry.events[key]
-                        channel = status & 0x0F
-                        data.append(status_msg)
-                        data += [byte2int(next(track_data)) for _ in
-                                 range(event_cls.length - 1)]
-                        # create an event and append it to the list
-                        events.append(event_cls(tick=tick, channel=channel,
-                                                data=data))
-                    else:
-                        status = status_msg
-                        event_cls = EventRegistry.events[key]
-                        channel = status & 0x0F
-                        data = [byte2int(next(track_data)) for _ in
-                                range(event_cls.length)]
-                        # create an event and append it to the list
-                        events.append(event_cls(tick=tick, channel=channel,
-                                                data=data))
-            # no more events to be processed
-            except StopIteration:
-                break
+        track_data = midi_stream.read(track_size)
+        # parse all events into an array, the event objects are created only
+        # when they are accessed
+        events = parse_track(track_data)
+        meta_commands = events['data1'][events['status'] == META_EVENT]
+        for meta_cmd in np.unique(meta_commands):
+            if meta_cmd not in EventRegistry.meta_events:
+                import warnings
+                warnings.warn("Unknown Meta MIDI Event: %s" % meta_cmd)
         # create a new track
-        track = cls(events)
-        # make the timing of the events (i.e. the ticks) absolute
-        track._make_ticks_abs()
-        # return this track
+        return cls._from_arrays(events, track_data)
+
+    @classmethod
+    def _from_arrays(cls, events, data):
+        """
+        Create a MIDI track from an event array.
+
+        Parameters
+        ----------
+        events : numpy structured array
+            Events (see :func:`madmom.utils.midi_parser.parse_track`).
+        data : bytes or bytearray
+            Data the `offset` and `length` fields of the events refer to.
+
+        Returns
+        -------
+        :class:`MIDITrack` instance
+            :class:`MIDITrack` instance
+
+        """
+        track = cls()
+        track._events = None
+        track._event_array = events
+        track._data = data
         return track
 
     @classmethod
@@ -1348,31 +1417,29 @@ class MIDITrack(object):
         tempo = SetTempoEvent(tick=0)
         tempo.microseconds_per_quarter_note = int(quarter_note_length * 1e6)
 
-        # list for events (ticks in absolute timing)
-        events = []
-
-        # add the notes
-        for note in notes:
-            onset, pitch, duration, velocity, channel = note
-            # add NoteOn
-            e_on = NoteOnEvent()
-            e_on.tick = int(onset * ticks_per_second)
-            e_on.pitch = int(pitch)
-            e_on.velocity = int(velocity)
-            e_on.channel = int(channel)
-            # and NoteOff
-            e_off = NoteOffEvent()
-            e_off.tick = int((onset + duration) * ticks_per_second)
-            e_off.pitch = int(pitch)
-            e_off.channel = int(channel)
-            events.append(e_on)
-            events.append(e_off)
-        # sort the events and prepend the tempo and time signature events
-        events = sorted(events)
-        events.insert(0, sig)
-        events.insert(0, tempo)
+        # events and their data (ticks in absolute timing)
+        events, data = _array_from_events([tempo, sig])
+
+        # add the notes, alternating NoteOn and NoteOff events
+        onsets = notes[:, 0]
+        note_events = np.zeros(2 * len(notes), dtype=EVENT_DTYPE)
+        note_events['tick'][0::2] = (onsets * ticks_per_second).astype(int)
+        note_events['tick'][1::2] = ((onsets + notes[:, 2]) *
+                                     ticks_per_second).astype(int)
+        note_events['status'][0::2] = NoteOnEvent.status_msg
+        note_events['status'][1::2] = NoteOffEvent.status_msg
+        note_events['channel'] = np.repeat(notes[:, 4].astype(int), 2)
+        note_events['data1'] = np.repeat(notes[:, 1].astype(int), 2)
+        note_events['data2'][0::2] = notes[:, 3].astype(int)
+        # sort the events, the tempo and time signature events come first
+        note_events = _sort_events(note_events)
+        note_events['offset'] = len(data) + 2 * np.arange(len(note_events))
+        note_events['length'] = 2
+        data.extend(np.column_stack((note_events['data1'],
+                                     note_events['data2'])).tobytes())
+        events = np.hstack((events, note_events))
         # create a track from the events
-        return cls(events)
+        return cls._from_arrays(events, data)
 
 
 # File I/O classes
@@ -1488,38 +1555,33 @@ class MIDIFile(object):
             warnings.warn('this method will be removed soon, do not rely on '
                           'its output, rather fix issue #192 ;)')
         # create an empty tempo list
-        tempo_events = []
+        tempi = np.zeros((0, 2))
         for i, track in enumerate(self.tracks):
-            # get a list with tempo events
-            track_tempo_events = [e for e in track.events if
-                                  isinstance(e, SetTempoEvent)]
+            # get the tempo events
+            events, data = track._arrays()
+            events = events[(events['status'] == META_EVENT) &
+                            (events['data1'] == SetTempoEvent.meta_command)]
             # tempo events should be only in the first track of a MIDI file
-            if track_tempo_events and i > 0:
+            if len(events) and i > 0:
                 raise ValueError('SetTempoEvents should be only in the first '
                                  'track of a MIDI file.')
-            tempo_events.extend(track_tempo_events)
-
-        # convert to desired format (tick, microseconds per tick)
-        tempi = [(e.tick, e.microseconds_per_quarter_note /
-                  (1e6 * self.resolution)) for e in tempo_events]
-        # make sure a tempo is set
-        if tempi is None:
-            tempi = [(0, SECONDS_PER_TICK)]
-        # and the first tempo occurs at tick 0
-        if tempi[0][0] > 0:
-            tempi.insert(0, (0, SECONDS_PER_TICK))
+            # convert to desired format (tick, microseconds per tick)
+            data = np.frombuffer(bytes(data), dtype=np.uint8).astype(np.int64)
+            offset = events['offset']
+            mpqn = (data[offset] << 16) + (data[offset + 1] << 8) + \
+                data[offset + 2]
+            tempi = np.vstack((tempi, np.column_stack(
+                (events['tick'], mpqn / (1e6 * self.resolution)))))
+        # make sure a tempo is set and the first tempo occurs at tick 0
+        if len(tempi) == 0 or tempi[:, 0].min() > 0:
+            tempi = np.vstack(([[0, SECONDS_PER_TICK]], tempi))
         # sort (just to be sure)
-        tempi.sort()
-        # re-iterate over the list to calculate the cumulative time
-        for i, _ in enumerate(tempi):
-            if i == 0:
-                tempi[i] = (tempi[i][0], tempi[i][1], 0)
-            else:
-                ticks = tempi[i][0] - tempi[i - 1][0]
-                cum_time = tempi[i - 1][2] + ticks * tempi[i - 1][1]
-                tempi[i] = (tempi[i][0], tempi[i][1], cum_time)
+        tempi = tempi[np.lexsort((tempi[:, 1], tempi[:, 0]))]
+        # calculate the cumulative time
+        cum_time = np.zeros(len(tempi))
+        cum_time[1:] = np.cumsum(np.diff(tempi[:, 0]) * tempi[:-1, 1])
         # return tempo
-        return np.asarray(tempi, np.float)
+        return np.column_stack((tempi, cum_time))
 
     def time_signatures(self, suppress_warnings=False):
         """
@@ -1537,23 +1599,28 @@ class MIDIFile(object):
                           'its output, rather fix issue #192 ;)')
         signatures = None
         for track in self.tracks:
-            # get a list with time signature events
-            time_signature_events = [e for e in track.events if
-                                     isinstance(e, TimeSignatureEvent)]
-            if signatures is None and len(time_signature_events) > 0:
+            # get the time signature events
+            events, data = track._arrays()
+            events = events[(events['status'] == META_EVENT) &
+                            (events['data1'] ==
+                             TimeSignatureEvent.meta_command)]
+            if signatures is None and len(events) > 0:
                 # convert to desired format
-                signatures = [(e.tick, e.numerator, e.denominator)
-                              for e in time_signature_events]
-            elif signatures is not None and len(time_signature_events) > 0:
+                data = np.frombuffer(bytes(data), dtype=np.uint8)
+                signatures = np.column_stack(
+                    (events['tick'], data[events['offset']],
+                     2 ** data[events['offset'] + 1].astype(np.int64)))
+                signatures = [tuple(sig) for sig in signatures.tolist()]
+            elif signatures is not None and len(events) > 0:
                 # time signature events should be contained only in the first
                 # track of a MIDI file, thus raise an error
                 raise ValueError('TimeSignatureEvent should be only in the '
                                  'first track of a MIDI file.')
         # make sure a time signature is set and the first one occurs at tick 0
         if signatures is None:
-            signatures = [(0, TIME_SIGNATURE)]
+            signatures = [(0, ) + TIME_SIGNATURE]
         if signatures[0][0] > 0:
-            signatures.insert(0, (0, TIME_SIGNATURE))
+            signatures.insert(0, (0, ) + TIME_SIGNATURE)
         # return time signatures
         return np.asarray(signatures, dtype=np.float)
 
@@ -1572,54 +1639,68 @@ class MIDIFile(object):
             Array with notes (onset time, pitch, duration, velocity, channel).
 
         """
-        # list for all notes
-        notes = []
-        # dictionary for storing the last onset and velocity for each
-        # individual note (i.e. same pitch and channel)
-        sounding_notes = {}
-
-        # as key for the dict use channel * 128 (max number of pitches) + pitch
-        def note_hash(channel, pitch):
-            """Generate a note hash."""
-            return channel * 128 + pitch
-
+        # collect the note events of all tracks
+        events = []
         for track in self.tracks:
-            # get a list with note events
-            note_events = [e for e in track.events if isinstance(e, NoteEvent)]
-            # process all events
-            tick = 0
-            for e in note_events:
-                if tick > e.tick:
-                    raise AssertionError('note events must be sorted!')
-                n = note_hash(e.channel, e.pitch)
-                is_note_on = isinstance(e, NoteOnEvent)
-                is_note_off = isinstance(e, NoteOffEvent)
-                # if it's a note on event with a velocity > 0,
-                if is_note_on and e.velocity > 0:
-                    # save the onset time and velocity
-                    sounding_notes[n] = (e.tick, e.velocity)
-                # if it's a note off event or a note on with a velocity of 0,
-                elif is_note_off or (is_note_on and e.velocity == 0):
-                    if n not in sounding_notes:
-                        import warnings
-                        warnings.warn("ignoring %s" % e)
-                        continue
-                    if sounding_notes[n][0] > e.tick:
-                        raise AssertionError('note duration must be positive')
-                    if sounding_notes[n][1] <= 0:
-                        raise AssertionError('note velocity must be positive')
-                    # append the note to the list
-                    notes.append((sounding_notes[n][0], e.pitch,
-                                  e.tick - sounding_notes[n][0],
-                                  sounding_notes[n][1], e.channel))
-                    # remove hash from dict
-                    del sounding_notes[n]
-                else:
-                    raise TypeError('unexpected NoteEvent', e)
-                tick = e.tick
-
-        # sort the notes and convert to numpy array
-        notes = np.asarray(sorted(notes), dtype=np.float)
+            track_events = track._arrays()[0]
+            events.append(track_events[
+                (track_events['status'] == NoteOnEvent.status_msg) |
+                (track_events['status'] == NoteOffEvent.status_msg)])
+        track_lengths = [len(e) for e in events]
+        events = np.hstack(events) if events else \
+            np.zeros(0, dtype=EVENT_DTYPE)
+        ticks = events['tick']
+        pitch = events['data1'].astype(np.int64)
+        channel = events['channel'].astype(np.int64)
+        velocity = events['data2']
+        # note on events with a velocity of 0 are note off events
+        is_note_on = (events['status'] == NoteOnEvent.status_msg) & \
+            (velocity > 0)
+        # group the events of each individual note (i.e. same pitch and
+        # channel), keeping their order (mergesort is stable)
+        order = np.argsort(channel * 128 + pitch, kind='mergesort')
+        same_note = np.diff((channel * 128 + pitch)[order]) == 0
+        # a note off event ends a note if the previous event of the same note
+        # is a note on event, a later note on event replaces a sounding note
+        ends_note = same_note & is_note_on[order][:-1] & \
+            ~is_note_on[order][1:]
+        note_on = order[:-1][ends_note]
+        note_off = order[1:][ends_note]
+        # note off events without sounding note are ignored
+        ignored = ~is_note_on
+        ignored[note_off] = False
+        # the note events must be sorted within each track (ignored events
+        # are not considered as reference) and the note durations must be
+        # positive, report the error of the first offending event
+        unsorted = np.zeros(len(events), dtype=np.bool)
+        start = 0
+        for length in track_lengths:
+            track_ticks = ticks[start:start + length]
+            valid_ticks = np.where(ignored[start:start + length], 0,
+                                   track_ticks)
+            last_ticks = np.maximum.accumulate(np.hstack(([0],
+                                                          valid_ticks)))
+            unsorted[start:start + length] = last_ticks[:-1] > track_ticks
+            start += length
+        negative = np.zeros(len(events), dtype=np.bool)
+        negative[note_off] = ticks[note_off] < ticks[note_on]
+        if np.any(unsorted | negative):
+            if unsorted[np.argmax(unsorted | negative)]:
+                raise AssertionError('note events must be sorted!')
+            raise AssertionError('note duration must be positive')
+        if np.any(ignored):
+            import warnings
+            for i in np.nonzero(ignored)[0]:
+                event_cls = EventRegistry.events[events['status'][i]]
+                warnings.warn("ignoring %s" % event_cls(
+                    tick=ticks[i], channel=channel[i],
+                    data=[pitch[i], velocity[i]]))
+        # create the notes and sort them
+        notes = np.column_stack((ticks[note_on], pitch[note_on],
+                                 ticks[note_off] - ticks[note_on],
+                                 velocity[note_on],
+                                 channel[note_on])).astype(np.float)
+        notes = notes[np.lexsort(notes.T[::-1])]
 
         # convert onset times and durations from ticks to the requested unit
         # and return the notes
@@ -1664,17 +1745,14 @@ class MIDIFile(object):
         # compute beat position of each time signature change
         time_signatures[1:, 1] = bbtsc.cumsum()
 
-        # iterate over all notes
-        for note in notes:
-            onset, _, offset, _, _ = note
-            # get info about last time signature change
-            tsc = time_signatures[np.argmax(time_signatures[:, 0] > onset) - 1]
-            # adjust onset
-            onset_ticks_since_tsc = onset - tsc[0]
-            note[0] = tsc[1] + (onset_ticks_since_tsc / tpq) * (tsc[2] / 4.)
-            # adjust offsets
-            offset_ticks_since_tsc = offset - tsc[0]
-            note[2] = tsc[1] + (offset_ticks_since_tsc / tpq) * (tsc[2] / 4.)
+        # get info about the last time signature change of the onsets
+        tsc = time_signatures[np.searchsorted(
+            time_signatures[:, 0], notes[:, 0], side='right') - 1]
+        # adjust the onsets and offsets
+        for col in (0, 2):
+            ticks_since_tsc = notes[:, col] - tsc[:, 0]
+            notes[:, col] = tsc[:, 1] + (ticks_since_tsc / tpq) * \
+                (tsc[:, 2] / 4.)
         # return notes
         return notes
 
@@ -1695,15 +1773,13 @@ class MIDIFile(object):
         """
         # cache tempo
         tempi = self.tempi(suppress_warnings=True)
-        # iterate over all notes
-        for note in notes:
-            onset, _, offset, _, _ = note
-            # get last tempo for the onset and offset
-            t_on = tempi[np.argmax(tempi[:, 0] > onset) - 1]
-            t_off = tempi[np.argmax(tempi[:, 0] > offset) - 1]
-            # adjust the note onset and offset
-            note[0] = (onset - t_on[0]) * t_on[1] + t_on[2]
-            note[2] = (offset - t_off[0]) * t_off[1] + t_off[2]
+        # get the last tempo for the onsets and offsets
+        for col in (0, 2):
+            tempo = tempi[np.searchsorted(tempi[:, 0], notes[:, col],
+                                          side='right') - 1]
+            # adjust the onsets and offsets
+            notes[:, col] = (notes[:, col] - tempo[:, 0]) * tempo[:, 1] + \
+                tempo[:, 2]
         # return notes
         return notes
 
@@ -0,0 +1,374 @@
+# encoding: utf-8
+# cython: embedsignature=True
+"""
+This module contains fast functions for parsing and writing the data of MIDI
+tracks.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+# structured array data type of the parsed events
+EVENT_DTYPE = np.dtype([('tick', np.int64), ('status', np.uint8),
+                        ('channel', np.uint8), ('data1', np.uint8),
+                        ('data2', np.uint8), ('offset', np.int64),
+                        ('length', np.int64)])
+
+# status of MetaEvents and SysExEvents
+META_EVENT = 0xFF
+SYSEX_EVENT = 0xF0
+
+
+def parse_track(data):
+    """
+    Parse the data of a MIDI track.
+
+    Parameters
+    ----------
+    data : bytes or bytearray
+        Data of the MIDI track (without the track header).
+
+    Returns
+    -------
+    events : numpy structured array
+        Events of the track with these fields:
+
+        - 'tick': absolute time of the event [ticks],
+        - 'status': status of the event without the channel information, i.e.
+          0x80 to 0xE0 for channel events, `SYSEX_EVENT` or `META_EVENT`,
+        - 'channel': channel of the event,
+        - 'data1': first data byte of channel events (e.g. the pitch of note
+          events) or the meta command of meta events,
+        - 'data2': second data byte of channel events (e.g. the velocity of
+          note events),
+        - 'offset': position of the event data in `data`,
+        - 'length': length of the event data.
+
+    Notes
+    -----
+    Incomplete events at the end of the track are ignored.
+
+    """
+    track = np.frombuffer(bytearray(data), dtype=np.uint8)
+    cdef unsigned char [::1] track_ = track
+    cdef Py_ssize_t size = len(track)
+    # every event consumes at least 2 bytes (delta time & status or data)
+    cdef Py_ssize_t capacity = size // 2 + 1
+    ticks = np.empty(capacity, dtype=np.int64)
+    status = np.empty(capacity, dtype=np.uint8)
+    channel = np.zeros(capacity, dtype=np.uint8)
+    data1 = np.zeros(capacity, dtype=np.uint8)
+    data2 = np.zeros(capacity, dtype=np.uint8)
+    offset = np.empty(capacity, dtype=np.int64)
+    length = np.empty(capacity, dtype=np.int64)
+    cdef np.int64_t [::1] ticks_ = ticks
+    cdef np.uint8_t [::1] status_ = status
+    cdef np.uint8_t [::1] channel_ = channel
+    cdef np.uint8_t [::1] data1_ = data1
+    cdef np.uint8_t [::1] data2_ = data2
+    cdef np.int64_t [::1] offset_ = offset
+    cdef np.int64_t [::1] length_ = length
+    cdef int result
+    cdef Py_ssize_t num_events = 0
+    result = _parse_track(track_, size, ticks_, status_, channel_, data1_,
+                          data2_, offset_, length_, &num_events)
+    if result == -1:
+        raise AssertionError('Bad byte value')
+    if result == -2:
+        raise ValueError('Unsupported MIDI event')
+    # combine everything into a structured array
+    events = np.empty(num_events, dtype=EVENT_DTYPE)
+    events['tick'] = ticks[:num_events]
+    events['status'] = status[:num_events]
+    events['channel'] = channel[:num_events]
+    events['data1'] = data1[:num_events]
+    events['data2'] = data2[:num_events]
+    events['offset'] = offset[:num_events]
+    events['length'] = length[:num_events]
+    return events
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _read_variable_length(unsigned char [::1] data,
+                                             Py_ssize_t pos, Py_ssize_t size,
+                                             np.int64_t *value) nogil:
+    """
+    Read a variable length value.
+
+    Parameters
+    ----------
+    data : unsigned char memoryview
+        Track data.
+    pos : Py_ssize_t
+        Position to read from.
+    size : Py_ssize_t
+        Size of the track data.
+    value : int64 pointer
+        Value read.
+
+    Returns
+    -------
+    Py_ssize_t
+        Position after the variable length value, -1 if the data ended.
+
+    """
+    cdef unsigned char byte
+    value[0] = 0
+    while pos < size:
+        byte = data[pos]
+        pos += 1
+        value[0] = (value[0] << 7) + (byte & 0x7F)
+        # the hi-bit is set if another byte follows
+        if not byte & 0x80:
+            return pos
+    return -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _parse_track(unsigned char [::1] data, Py_ssize_t size,
+                      np.int64_t [::1] ticks, np.uint8_t [::1] status,
+                      np.uint8_t [::1] channel, np.uint8_t [::1] data1,
+                      np.uint8_t [::1] data2, np.int64_t [::1] offset,
+                      np.int64_t [::1] length, Py_ssize_t *num_events) nogil:
+    """
+    Parse the events of a MIDI track.
+
+    Parameters
+    ----------
+    data : unsigned char memoryview
+        Track data.
+    size : Py_ssize_t
+        Size of the track data.
+    ticks, status, channel, data1, data2, offset, length : memoryviews
+        Buffers for the fields of the events.
+    num_events : Py_ssize_t pointer
+        Number of parsed events.
+
+    Returns
+    -------
+    int
+        0 on success, -1 if a running status is used before any status was
+        set, -2 for unsupported events.
+
+    """
+    cdef Py_ssize_t pos = 0, start, n = 0
+    cdef np.int64_t tick = 0, value
+    cdef int running_status = -1, status_msg, meta_cmd, data_len
+    while True:
+        # first datum is variable length representing the delta-time
+        pos = _read_variable_length(data, pos, size, &value)
+        if pos < 0 or pos >= size:
+            break
+        tick += value
+        # next byte is status message
+        status_msg = data[pos]
+        pos += 1
+        if status_msg == 0xFF:
+            # meta event: command, length and data
+            if pos >= size:
+                break
+            meta_cmd = data[pos]
+            pos = _read_variable_length(data, pos + 1, size, &value)
+            if pos < 0 or pos + value > size:
+                break
+            status[n] = 0xFF
+            channel[n] = 0
+            data1[n] = meta_cmd
+            data2[n] = 0
+            offset[n] = pos
+            length[n] = value
+            pos += value
+        elif status_msg == 0xF0:
+            # SysEx event: data is terminated by 0xF7
+            start = pos
+            while pos < size and data[pos] != 0xF7:
+                pos += 1
+            if pos >= size:
+                break
+            status[n] = 0xF0
+            channel[n] = 0
+            data1[n] = 0
+            data2[n] = 0
+            offset[n] = start
+            length[n] = pos - start
+            pos += 1
+        else:
+            if status_msg & 0x80:
+                # new status
+                if status_msg > 0xF0:
+                    return -2
+                running_status = status_msg
+                start = pos
+            else:
+                # running status, the byte read is the first data byte
+                if running_status < 0:
+                    return -1
+                start = pos - 1
+            # program change and channel after touch events have 1 data byte
+            if (running_status & 0xF0) in (0xC0, 0xD0):
+                data_len = 1
+            else:
+                data_len = 2
+            if start + data_len > size:
+                break
+            status[n] = running_status & 0xF0
+            channel[n] = running_status & 0x0F
+            data1[n] = data[start]
+            data2[n] = data[start + 1] if data_len > 1 else 0
+            offset[n] = start
+            length[n] = data_len
+            pos = start + data_len
+        ticks[n] = tick
+        n += 1
+    num_events[0] = n
+    return 0
+
+
+def write_track(events, data):
+    """
+    Write the data of a MIDI track.
+
+    Parameters
+    ----------
+    events : numpy structured array
+        Events of the track (see :func:`parse_track`), sorted by their ticks.
+    data : bytes or bytearray
+        Data the `offset` and `length` fields of the events refer to.
+
+    Returns
+    -------
+    bytearray
+        Data of the MIDI track (without the track header).
+
+    Notes
+    -----
+    Channel events use running status, delta times are written with at most 4
+    bytes.
+
+    """
+    cdef Py_ssize_t num_events = len(events)
+    ticks = np.ascontiguousarray(events['tick'], dtype=np.int64)
+    status = np.ascontiguousarray(events['status'], dtype=np.uint8)
+    channel = np.ascontiguousarray(events['channel'], dtype=np.uint8)
+    data1 = np.ascontiguousarray(events['data1'], dtype=np.uint8)
+    offset = np.ascontiguousarray(events['offset'], dtype=np.int64)
+    length = np.ascontiguousarray(events['length'], dtype=np.int64)
+    if num_events and (offset.min() < 0 or
+                       np.max(offset + length) > len(data)):
+        raise ValueError('event data out of bounds')
+    buf = np.frombuffer(bytearray(data), dtype=np.uint8)
+    # delta time (4), status (1), meta command (1), length (4) and SysEx end
+    # (1) plus the data of the events
+    out = np.empty(11 * num_events + int(np.sum(length)), dtype=np.uint8)
+    cdef np.int64_t [::1] ticks_ = ticks
+    cdef np.uint8_t [::1] status_ = status
+    cdef np.uint8_t [::1] channel_ = channel
+    cdef np.uint8_t [::1] data1_ = data1
+    cdef np.int64_t [::1] offset_ = offset
+    cdef np.int64_t [::1] length_ = length
+    cdef unsigned char [::1] buf_ = buf
+    cdef unsigned char [::1] out_ = out
+    cdef Py_ssize_t size
+    size = _write_track(ticks_, status_, channel_, data1_, offset_, length_,
+                        num_events, buf_, out_)
+    return bytearray(out[:size])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _write_variable_length(unsigned char [::1] out,
+                                              Py_ssize_t pos,
+                                              np.int64_t value) nogil:
+    """
+    Write a variable length value (with at most 4 bytes).
+
+    Parameters
+    ----------
+    out : unsigned char memoryview
+        Output data.
+    pos : Py_ssize_t
+        Position to write to.
+    value : int64
+        Value to be written.
+
+    Returns
+    -------
+    Py_ssize_t
+        Position after the variable length value.
+
+    """
+    cdef int num_bytes = 1, i
+    while num_bytes < 4 and value >> (7 * num_bytes):
+        num_bytes += 1
+    for i in range(num_bytes - 1, 0, -1):
+        out[pos] = ((value >> (7 * i)) & 0x7F) | 0x80
+        pos += 1
+    out[pos] = value & 0x7F
+    return pos + 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _write_track(np.int64_t [::1] ticks, np.uint8_t [::1] status,
+                             np.uint8_t [::1] channel, np.uint8_t [::1] data1,
+                             np.int64_t [::1] offset, np.int64_t [::1] length,
+                             Py_ssize_t num_events, unsigned char [::1] data,
+                             unsigned char [::1] out) nogil:
+    """
+    Write the events of a MIDI track.
+
+    Parameters
+    ----------
+    ticks, status, channel, data1, offset, length : memoryviews
+        Fields of the events.
+    num_events : Py_ssize_t
+        Number of events.
+    data : unsigned char memoryview
+        Data of the events.
+    out : unsigned char memoryview
+        Output data.
+
+    Returns
+    -------
+    Py_ssize_t
+        Size of the written data.
+
+    """
+    cdef Py_ssize_t pos = 0, i, j
+    cdef np.int64_t tick = 0
+    cdef int running_status = -1, status_msg
+    for i in range(num_events):
+        # delta time
+        pos = _write_variable_length(out, pos, ticks[i] - tick)
+        tick = ticks[i]
+        if status[i] == 0xFF:
+            # meta event: command, length and data
+            out[pos] = 0xFF
+            out[pos + 1] = data1[i]
+            pos = _write_variable_length(out, pos + 2, length[i])
+        elif status[i] == 0xF0:
+            # SysEx event
+            out[pos] = 0xF0
+            pos += 1
+        else:
+            # only write the status if it changed (running status)
+            status_msg = status[i] | channel[i]
+            if status_msg != running_status:
+                running_status = status_msg
+                out[pos] = status_msg
+                pos += 1
+        for j in range(offset[i], offset[i] + length[i]):
+            out[pos] = data[j]
+            pos += 1
+        if status[i] == 0xF0:
+            out[pos] = 0xF7
+            pos += 1
+    return pos
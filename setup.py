@@ -17,18 +17,33 @@ import numpy as np
 # define version
 version = '0.15.dev0'
 
+# write the version to a module, since looking it up via pkg_resources at
+# runtime is slow
+with open('madmom/version.py', 'w') as f:
+    f.write("# encoding: utf-8\n"
+            "# this file is generated by setup.py, do not edit\n"
+            "version = '%s'\n" % version)
+
 # define which extensions to compile
 include_dirs = [np.get_include()]
 
 extensions = [
     Extension('madmom.audio.comb_filters', ['madmom/audio/comb_filters.pyx'],
               include_dirs=include_dirs),
+    Extension('madmom.evaluation.matching',
+              ['madmom/evaluation/matching.pyx'], include_dirs=include_dirs),
     Extension('madmom.features.beats_crf', ['madmom/features/beats_crf.pyx'],
               include_dirs=include_dirs),
+    Extension('madmom.ml.crf', ['madmom/ml/crf.pyx'],
+              include_dirs=include_dirs),
     Extension('madmom.ml.hmm', ['madmom/ml/hmm.pyx'],
               include_dirs=include_dirs),
     Extension('madmom.ml.nn.layers', ['madmom/ml/nn/layers.py'],
               include_dirs=include_dirs),
+    Extension('madmom.utils.events', ['madmom/utils/events.pyx'],
+              include_dirs=include_dirs),
+    Extension('madmom.utils.midi_parser', ['madmom/utils/midi_parser.pyx'],
+              include_dirs=include_dirs),
 ]
 
 # define scripts to be installed by the PyPI package
@@ -79,7 +94,7 @@ setup(name='madmom',
       author_email='madmom-users@googlegroups.com',
       url='https://github.com/CPJKU/madmom',
       license='BSD, CC BY-NC-SA',
-      packages=find_packages(exclude=['tests', 'docs']),
+      packages=find_packages(exclude=['tests', 'docs', 'benchmarks']),
       ext_modules=cythonize(extensions),
       package_data={'madmom': package_data},
       exclude_package_data={'': ['tests', 'docs']},
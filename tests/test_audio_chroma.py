@@ -50,21 +50,21 @@ class TestCLPChromaClass(unittest.TestCase):
         self.assertTrue(self.clp_50.fps == 50)
         # results
         self.assertTrue(self.clp_50.shape == (141, 12))
-        tar = [0.28222724, 0.2145749, 0.29143909, 0.31838085, 0.21754939,
-               0.24475572, 0.16546808, 0.32018109, 0.39918812, 0.30166908,
-               0.26142349, 0.3635601]
+        tar = [0.28220155, 0.21454596, 0.29136416, 0.31831487, 0.21755304,
+               0.24485289, 0.16531381, 0.32006153, 0.39914557, 0.30161968,
+               0.26155587, 0.3638152]
         self.assertTrue(np.allclose(self.clp_50[39, :], tar, atol=1e-4))
-        tar = [0.62827758, 0.63810707, 0.64559874, 0.63725388, 0.60231739,
-               0.56549827, 0.49675867, 0.40509999, 0.38589308, 0.39961286,
-               0.43776578]
+        tar = [0.62823531, 0.63806022, 0.64554059, 0.63718294, 0.60224173,
+               0.56543228, 0.49666568, 0.40501463, 0.38589939, 0.39970402,
+               0.43754619]
         self.assertTrue(np.allclose(self.clp_50[100:111, 8], tar, atol=1e-5))
         # test with fps=10
         self.assertTrue(self.clp_10.bin_labels[0] == 'C')
         self.assertTrue(self.clp_10.fps == 10)
         # results
         self.assertTrue(self.clp_10.shape == (29, 12))
-        tar = [[0.23144638, 0.42642003], [0.23364208, 0.49532055],
-               [0.2099782, 0.53246478], [0.2120323, 0.49525887]]
+        tar = [[0.23170935, 0.42622664], [0.23392519, 0.4950367],
+               [0.21011577, 0.53234919], [0.21199438, 0.49530732]]
         self.assertTrue(np.allclose(self.clp_10[2:6, 7:9], tar, atol=1e-4))
         # test clp from signal
         self.assertTrue(self.clp_10_from_signal.shape == (29, 12))
@@ -97,6 +97,19 @@ class TestCombFilterFunction(unittest.TestCase):
         result = comb_filter(sig_2d, function, [2, 3], [0.5, 0.5])
         self.assertTrue(np.allclose(result[:, :, 0], res_2d_bw_2))
         self.assertTrue(np.allclose(result[:, :, 1], res_2d_bw_3))
+        # multiple threads
+        result = comb_filter(sig_2d, function, [2, 3], [0.5, 0.5],
+                             num_threads=2)
+        self.assertTrue(np.allclose(result[:, :, 0], res_2d_bw_2))
+        self.assertTrue(np.allclose(result[:, :, 1], res_2d_bw_3))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            comb_filter(sig_1d, feed_backward_comb_filter, [0, 3], 0.5)
+        with self.assertRaises(ValueError):
+            comb_filter(sig_1d, feed_backward_comb_filter, [2, 3], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            comb_filter(np.zeros((2, 2, 2)), feed_backward_comb_filter, 2, 1)
 
     def test_values_forward(self):
         function = feed_forward_comb_filter
@@ -108,6 +121,36 @@ class TestCombFilterFunction(unittest.TestCase):
         self.assertTrue(np.allclose(result[:, :, 1], res_2d_fw_3))
 
 
+class TestCombFilterHistogramFunction(unittest.TestCase):
+
+    def _histogram(self, signal, tau, alpha):
+        y = comb_filter(signal, feed_backward_comb_filter, tau, alpha)
+        return np.sum(y * (y == np.max(y, axis=-1)[..., np.newaxis]), axis=0)
+
+    def test_types(self):
+        result = comb_filter_histogram(sig_1d, [2, 3], [0.5, 0.5])
+        self.assertIsInstance(result, np.ndarray)
+        self.assertTrue(result.dtype == np.float)
+        self.assertTrue(result.shape == (2, ))
+        result = comb_filter_histogram(sig_2d, [2, 3], [0.5, 0.5])
+        self.assertTrue(result.shape == (2, 2))
+
+    def test_values(self):
+        result = comb_filter_histogram(sig_1d, [2, 3], [0.5, 0.5])
+        self.assertTrue(np.allclose(result, [2.25, 4.25]))
+        result = comb_filter_histogram(sig_2d, [2, 3], [0.5, 0.5])
+        self.assertTrue(np.allclose(result, [[2.25, 4.25], [8.0625, 2.5]]))
+        # compare with the complete filter output
+        signal = np.random.RandomState(0).rand(500, 2)
+        tau = np.arange(5, 40)
+        for num_threads in [1, 3]:
+            for sig in (signal[:, 0], signal):
+                result = comb_filter_histogram(sig, tau, 0.79,
+                                               num_threads=num_threads)
+                self.assertTrue(np.allclose(
+                    result, self._histogram(sig, tau, 0.79)))
+
+
 class TestCombFilterbankClass(unittest.TestCase):
 
     def test_types(self):
@@ -1220,3 +1220,11 @@ class TestSemitoneBandpassFilterbank(unittest.TestCase):
                     np.array([1.00000, -2.93573, 7.18487, -10.28654, 12.54224,
                               -10.17129, 7.02476, -2.83814, 0.95593])]
         self.assertTrue(np.allclose(midi_108, filt.filters[87], rtol=1e-03))
+        # second order sections are equivalent to the transfer functions
+        from scipy.signal import sos2tf
+        self.assertEqual(len(filt.sos_filters), 88)
+        self.assertEqual(filt.sos_filters[0].shape, (4, 6))
+        for band in [0, 44, 87]:
+            b, a = sos2tf(filt.sos_filters[band])
+            self.assertTrue(np.allclose(b, filt.filters[band][0]))
+            self.assertTrue(np.allclose(a, filt.filters[band][1]))
@@ -361,8 +361,8 @@ class TestResampleFunction(unittest.TestCase):
         self.signal_22k = Signal(sample_file_22k)
         self.signal_float = Signal(sample_file, dtype=np.float32)
         self.stereo_signal = Signal(stereo_sample_file)
-        self.float_target = np.array([-0.07537885, -0.077897, -0.08440731,
-                                      -0.07527363, -0.06685895, -0.05827513])
+        self.float_target = np.array([-0.07602419, -0.07724188, -0.08501753,
+                                      -0.07466023, -0.0673999, -0.05776517])
 
     def test_types(self):
         # mono signal
@@ -383,7 +383,11 @@ class TestResampleFunction(unittest.TestCase):
         self.assertEqual(result.dtype, self.signal.dtype)
         self.assertEqual(result.num_channels, self.signal.num_channels)
         self.assertTrue(np.allclose(result.length, self.signal.length))
-        self.assertTrue(np.allclose(result, self.signal_22k))
+        self.assertTrue(np.allclose(result[:6], [-2491, -2531, -2786, -2446,
+                                                 -2209, -1893]))
+        # the reference file was resampled with ffmpeg, which uses a slightly
+        # different filter
+        self.assertTrue(np.allclose(result, self.signal_22k, atol=250))
 
     def test_values_mono_float(self):
         result = resample(self.signal_float, 22050)
@@ -412,7 +416,7 @@ class TestResampleFunction(unittest.TestCase):
         self.assertTrue(np.allclose(result.length, self.stereo_signal.length))
         self.assertTrue(np.allclose(result[:6],
                                     [[34, 38], [32, 33], [37, 31],
-                                     [35, 35], [32, 34], [33, 34]]))
+                                     [34, 35], [32, 34], [33, 34]]))
 
     def test_values_upmixing(self):
         result = resample(self.signal, 22050, num_channels=2)
@@ -421,8 +425,8 @@ class TestResampleFunction(unittest.TestCase):
         self.assertEqual(result.dtype, self.signal.dtype)
         self.assertEqual(result.num_channels, 2)
         self.assertTrue(np.allclose(result.length, self.signal.length))
-        stereo = np.vstack((self.signal_22k, self.signal_22k)).T / np.sqrt(2)
-        self.assertTrue(np.allclose(result, stereo, atol=np.sqrt(2)))
+        mono = resample(self.signal, 22050)
+        self.assertTrue(np.allclose(result, np.vstack((mono, mono)).T))
 
     def test_values_downmixing(self):
         result = resample(self.stereo_signal, 22050, num_channels=1)
@@ -737,13 +741,42 @@ class TestLoadWaveFileFunction(unittest.TestCase):
         self.assertTrue(sample_rate == 44100)
         self.assertTrue(signal.shape == (123481, 2))
 
+    def test_resample(self):
+        signal, sample_rate = load_wave_file(stereo_sample_file,
+                                             sample_rate=22050)
+        self.assertEqual(sample_rate, 22050)
+        self.assertEqual(signal.dtype, np.int16)
+        self.assertEqual(signal.shape, (91460, 2))
+        self.assertTrue(np.allclose(signal[:5], [[34, 38], [32, 33], [37, 31],
+                                                 [34, 35], [32, 34]]))
+        # down-mix, rescale and start/stop position
+        signal, sample_rate = load_wave_file(stereo_sample_file,
+                                             sample_rate=22050,
+                                             num_channels=1, dtype=np.float32,
+                                             start=1, stop=2)
+        self.assertEqual(signal.dtype, np.float32)
+        self.assertEqual(signal.shape, (22050, ))
+        # same as resampling the loaded signal
+        stereo = Signal(stereo_sample_file, start=1, stop=2)
+        result = resample(stereo, 22050, num_channels=1, dtype=np.float32)
+        self.assertTrue(np.allclose(signal, result))
+        # upsampling
+        signal, sample_rate = load_wave_file(sample_file_22k,
+                                             sample_rate=44100)
+        self.assertEqual(sample_rate, 44100)
+        self.assertEqual(signal.shape, (123482, ))
+
+    def test_rescale(self):
+        signal, sample_rate = load_wave_file(sample_file, dtype=np.float32)
+        self.assertEqual(sample_rate, 44100)
+        self.assertEqual(signal.dtype, np.float32)
+        self.assertTrue(np.allclose(signal[:5], np.array(
+            [-2494, -2510, -2484, -2678, -2833]) / 32768.))
+        signal, _ = load_wave_file(sample_file, dtype=np.int32)
+        self.assertTrue(np.allclose(signal[:5], np.array(
+            [-2494, -2510, -2484, -2678, -2833]) * 65536))
+
     def test_errors(self):
-        # resampling of wav not supported
-        with self.assertRaises(ValueError):
-            load_wave_file(sample_file, sample_rate=22050)
-        # resampling of wav not supported
-        with self.assertRaises(ValueError):
-            load_wave_file(sample_file, dtype=np.float)
         # file not found
         with self.assertRaises(IOError):
             load_wave_file(pj(AUDIO_PATH, 'foo_bar.wav'))
@@ -926,6 +959,145 @@ class TestLoadAudioFileFunction(unittest.TestCase):
             load_audio_file(pj(DATA_PATH, 'README'))
 
 
+class TestLoadFfmpegBlocksFunction(unittest.TestCase):
+
+    def test_values(self):
+        from madmom.audio.ffmpeg import load_ffmpeg_blocks
+        signal, _ = load_audio_file(stereo_sample_file)
+        blocks = list(load_ffmpeg_blocks(stereo_sample_file, 10000))
+        self.assertEqual(len(blocks), 19)
+        self.assertIsInstance(blocks[0], Signal)
+        self.assertEqual(blocks[0].shape, (10000, 2))
+        self.assertEqual(blocks[-1].shape, (2919, 2))
+        self.assertTrue(np.allclose(blocks[1].start, 10000 / 44100.))
+        self.assertTrue(np.allclose(np.vstack(blocks), signal))
+        # start / stop position
+        blocks = list(load_ffmpeg_blocks(stereo_sample_file, 1000,
+                                         num_channels=1, start=1, stop=1.5))
+        self.assertEqual(len(blocks), 23)
+        self.assertEqual(blocks[0].start, 1)
+        self.assertEqual(sum(len(b) for b in blocks), 22050)
+        # stop decoding
+        blocks = load_ffmpeg_blocks(stereo_sample_file, 1000)
+        self.assertEqual(len(next(blocks)), 1000)
+        blocks.close()
+
+
+class TestAudioCacheClass(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_values(self):
+        from madmom.audio.ffmpeg import AudioCache, load_ffmpeg_file
+        cache = AudioCache(self.directory)
+        signal, sample_rate = load_ffmpeg_file(stereo_sample_file,
+                                               num_channels=1, cache=False)
+        self.assertIsNone(cache.get(stereo_sample_file, num_channels=1))
+        # first call decodes the file and puts it into the cache
+        result, _ = load_ffmpeg_file(stereo_sample_file, num_channels=1,
+                                     cache=cache)
+        self.assertTrue(np.allclose(result, signal))
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        # second call returns the memory-mapped cached file
+        result, result_sample_rate = load_ffmpeg_file(
+            stereo_sample_file, num_channels=1, start=1, stop=1.5,
+            cache=self.directory)
+        self.assertIsInstance(result, np.memmap)
+        self.assertEqual(result_sample_rate, sample_rate)
+        self.assertTrue(np.allclose(result, signal[44100:66150]))
+        # other parameters are cached individually
+        self.assertIsNone(cache.get(stereo_sample_file))
+        result, _ = load_ffmpeg_file(stereo_sample_file, dtype=np.float32,
+                                     cache=cache)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_default_cache(self):
+        from madmom.audio import ffmpeg
+        default_cache = ffmpeg.AUDIO_CACHE
+        try:
+            # no default cache configured
+            ffmpeg.AUDIO_CACHE = None
+            with self.assertRaises(ValueError):
+                ffmpeg.load_ffmpeg_file(stereo_sample_file, cache=True)
+            # use the default cache
+            ffmpeg.AUDIO_CACHE = ffmpeg.AudioCache(self.directory)
+            ffmpeg.load_ffmpeg_file(stereo_sample_file, cache=True)
+            self.assertEqual(len(os.listdir(self.directory)), 1)
+        finally:
+            ffmpeg.AUDIO_CACHE = default_cache
+
+    def test_eviction(self):
+        from madmom.audio.ffmpeg import AudioCache, load_ffmpeg_file
+        cache = AudioCache(self.directory, max_size=1)
+        load_ffmpeg_file(stereo_sample_file, num_channels=1, cache=cache)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        # the stereo version exceeds the maximum size, the mono one is removed
+        load_ffmpeg_file(stereo_sample_file, cache=cache)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        self.assertIsNone(cache.get(stereo_sample_file, num_channels=1))
+        self.assertIsNotNone(cache.get(stereo_sample_file))
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestLoadFfmpegFileFunction(unittest.TestCase):
+
+    def test_no_probing(self):
+        from madmom.audio.ffmpeg import load_ffmpeg_file, load_ffmpeg_blocks
+        # sample rate and number of channels are determined without probing
+        signal, sample_rate = load_ffmpeg_file(stereo_sample_file,
+                                               cmd_probe='no_ffprobe')
+        self.assertEqual(sample_rate, 44100)
+        self.assertEqual(signal.shape, (182919, 2))
+        signal, sample_rate = load_ffmpeg_file(
+            stereo_sample_file, num_channels=1, start=1, stop=2,
+            dtype=np.float32, cache=False, cmd_probe='no_ffprobe')
+        self.assertEqual(sample_rate, 44100)
+        self.assertEqual(signal.shape, (44100, ))
+        self.assertEqual(signal.dtype, np.float32)
+        block = next(load_ffmpeg_blocks(stereo_sample_file, 1000,
+                                        cmd_probe='no_ffprobe'))
+        self.assertEqual(block.sample_rate, 44100)
+        self.assertEqual(block.shape, (1000, 2))
+
+
+class TestGetFilesInfoFunction(unittest.TestCase):
+
+    def test_values(self):
+        from madmom.audio.ffmpeg import get_files_info
+        # wave files are inspected without ffprobe
+        info = get_files_info([sample_file, stereo_sample_file],
+                              cmd='no_ffprobe')
+        self.assertEqual(info, [{'sample_rate': 44100, 'num_channels': 1},
+                                {'sample_rate': 44100, 'num_channels': 2}])
+        info = get_files_info([sample_file, stereo_sample_file] * 3,
+                              cmd='no_ffprobe', num_threads=2)
+        self.assertEqual(len(info), 6)
+        self.assertEqual(info[-1], {'sample_rate': 44100, 'num_channels': 2})
+        self.assertEqual(get_files_info([]), [])
+
+    def test_wave_header(self):
+        import io
+        import struct
+        from madmom.audio.ffmpeg import _read_wave_header
+        # wave header as written to a pipe (unknown sizes, extra chunk)
+        fmt = struct.pack('<HHIIHH', 1, 2, 22050, 88200, 4, 16)
+        data = io.BytesIO(b'RIFF\xff\xff\xff\xffWAVEfmt ' +
+                          struct.pack('<I', len(fmt)) + fmt +
+                          b'LIST\x03\x00\x00\x00abc\x00' +
+                          b'data\xff\xff\xff\xff' + b'\x01\x00')
+        self.assertEqual(_read_wave_header(data), (22050, 2, 2))
+        self.assertEqual(data.read(), b'\x01\x00')
+        with self.assertRaises(ValueError):
+            _read_wave_header(io.BytesIO(b'no wave file'))
+
+
 # signal classes
 class TestSignalClass(unittest.TestCase):
 
@@ -1586,6 +1758,168 @@ class TestFramedSignalProcessorClass(unittest.TestCase):
         self.assertTrue(self.processor.end == 'normal')
 
 
+class TestFrameBlocksFunction(unittest.TestCase):
+
+    def _frames(self, signal, block_size, **kwargs):
+        blocks = [signal[i:i + block_size]
+                  for i in range(0, len(signal), block_size)]
+        return list(frame_blocks(blocks, **kwargs))
+
+    def test_types(self):
+        result = self._frames(sig_1d, 3, frame_size=4, hop_size=2)
+        self.assertIsInstance(result[0], FramedSignal)
+        self.assertIsInstance(result[0].signal, Signal)
+        self.assertEqual(result[0].hop_size, 2)
+        # no blocks at all
+        self.assertEqual(list(frame_blocks([])), [])
+
+    def test_values(self):
+        signal = Signal(stereo_sample_file)
+        for kwargs in [dict(), dict(origin='online', end='extend'),
+                       dict(frame_size=1024, origin='stream'),
+                       dict(origin=-3000), dict(hop_size=3000, end='extend'),
+                       dict(hop_size=220.5), dict(fps=200)]:
+            framed = FramedSignal(signal, **kwargs)
+            for block_size in [1000, 4410, 44100, len(signal)]:
+                result = self._frames(signal, block_size, **kwargs)
+                self.assertEqual(sum(len(f) for f in result), len(framed))
+                self.assertTrue(np.array_equal(
+                    np.vstack([np.asarray(f) for f in result]),
+                    np.asarray(framed)))
+
+    def test_ffmpeg_blocks(self):
+        from madmom.audio.ffmpeg import load_ffmpeg_blocks, load_ffmpeg_file
+        from madmom.audio.spectrogram import Spectrogram
+        blocks = load_ffmpeg_blocks(stereo_sample_file, 10000,
+                                    num_channels=1)
+        result = np.vstack([Spectrogram(f)
+                            for f in frame_blocks(blocks, fps=100)])
+        signal, sample_rate = load_ffmpeg_file(stereo_sample_file,
+                                               num_channels=1)
+        spec = Spectrogram(FramedSignal(Signal(signal, sample_rate), fps=100))
+        self.assertTrue(np.allclose(result, spec))
+
+
+class TestStreamClass(unittest.TestCase):
+
+    def setUp(self):
+        self.signal = Signal(stereo_sample_file)
+        self.mono = np.asarray(remix(self.signal, 1))
+        self.mono.tofile(tmp_file)
+
+    def _frames(self, signal, frame_size, hop_size, num_frames):
+        # expected frames, i.e. the last `frame_size` samples up to the
+        # positions of multiples of `hop_size`, zero-padded at the beginning
+        # and rescaled to float
+        pad = np.zeros((frame_size, ) + signal.shape[1:], dtype=signal.dtype)
+        signal = rescale(np.concatenate((pad, signal)))
+        for i in range(num_frames):
+            end = int((i + 1) * hop_size) + frame_size
+            yield signal[end - frame_size:end]
+
+    def test_raw_file_source(self):
+        source = RawFileSource(tmp_file, 44100, speed=None)
+        stream = Stream(sample_rate=44100, frame_size=2048, fps=30,
+                        source=source)
+        self.assertEqual(stream.shape, (None, 2048))
+        self.assertEqual(stream.hop_size, 1470)
+        self.assertTrue(stream.is_running())
+        frames = [np.copy(frame) for frame in stream]
+        self.assertFalse(stream.is_running())
+        stream.close()
+        self.assertEqual(len(frames), 125)
+        for frame, expected in zip(frames[:-1], self._frames(
+                self.mono, 2048, 1470, len(frames) - 1)):
+            self.assertTrue(np.allclose(frame, expected))
+        self.assertTrue(np.allclose(frames[-1], rescale(self.mono[-2048:])))
+
+    def test_fractional_hop_size(self):
+        source = RawFileSource(tmp_file, 44100, speed=None)
+        stream = Stream(sample_rate=44100, frame_size=1024, fps=101,
+                        source=source)
+        self.assertTrue(np.allclose(stream.hop_size, 436.63366337))
+        frame = None
+        for i, frame in enumerate(stream):
+            if i == 100:
+                break
+        self.assertTrue(np.allclose(frame.start, 100 / 101.))
+        expected = list(self._frames(self.mono, 1024, 44100 / 101., 101))[-1]
+        self.assertTrue(np.allclose(frame, expected))
+        self.assertEqual(stream.source.file.tell(), 2 * 44100)
+
+    def test_file_descriptor_source(self):
+        r, w = os.pipe()
+        data = np.asarray(self.signal[:10000]).tobytes()
+        os.write(w, data)
+        os.close(w)
+        source = FileDescriptorSource(r, num_channels=2)
+        stream = Stream(sample_rate=44100, num_channels=2, frame_size=2048,
+                        hop_size=441, source=source)
+        self.assertEqual(stream.shape, (None, 2048, 2))
+        frames = [np.copy(frame) for frame in stream]
+        os.close(r)
+        self.assertEqual(len(frames), 23)
+        for frame, expected in zip(frames[:-1], self._frames(
+                self.signal, 2048, 441, len(frames) - 1)):
+            self.assertTrue(np.allclose(frame, expected))
+        # the last frame contains the remaining samples
+        self.assertTrue(np.allclose(frames[-1],
+                                    rescale(self.signal[7952:10000])))
+
+    def test_features(self):
+        from madmom.audio.spectrogram import Spectrogram
+        # integer samples must be rescaled like in offline processing
+        signal = Signal(sample_file)
+        np.asarray(signal).tofile(tmp_file)
+        stream = Stream(sample_rate=44100, frame_size=2048, hop_size=441,
+                        source=RawFileSource(tmp_file, 44100, speed=None))
+        frames = [np.copy(frame) for frame in stream]
+        # the frames end at multiples of the hop size
+        framed = FramedSignal(signal, frame_size=2048, hop_size=441,
+                              origin=2048 // 2 - 441)
+        self.assertEqual(len(frames), len(framed))
+        for i in range(len(frames) - 1):
+            self.assertTrue(np.allclose(frames[i], framed[i] / 32767.))
+        # magnitudes of the STFT
+        online = [Spectrogram(FramedSignal(f, frame_size=2048,
+                                           origin='stream', num_frames=1))[0]
+                  for f in frames[:-1]]
+        offline = Spectrogram(framed)
+        self.assertTrue(np.allclose(online, offline[:-1], atol=1e-4))
+
+    def test_ffmpeg_source(self):
+        from madmom.audio.ffmpeg import FFmpegSource, load_ffmpeg_file
+        from madmom.audio.spectrogram import Spectrogram
+        # the block-wise decoded stream must match offline processing
+        source = FFmpegSource(stereo_sample_file, num_channels=1)
+        stream = Stream(sample_rate=44100, frame_size=2048, hop_size=441,
+                        source=source)
+        frames = [np.copy(frame) for frame in stream]
+        signal, sample_rate = load_ffmpeg_file(stereo_sample_file,
+                                               num_channels=1)
+        framed = FramedSignal(Signal(signal, sample_rate), frame_size=2048,
+                              hop_size=441, origin=2048 // 2 - 441)
+        self.assertEqual(len(frames), len(framed))
+        online = [Spectrogram(FramedSignal(f, frame_size=2048,
+                                           origin='stream', num_frames=1))[0]
+                  for f in frames[:-1]]
+        offline = Spectrogram(framed)
+        self.assertTrue(np.allclose(online, offline[:-1], atol=1e-4))
+
+    def test_unix_socket_source(self):
+        import socket
+        sock, other = socket.socketpair()
+        other.sendall(np.asarray(self.mono[:4410]).tobytes())
+        other.close()
+        stream = Stream(sample_rate=44100, frame_size=2048, hop_size=441,
+                        source=UnixSocketSource(sock))
+        frames = [np.copy(frame) for frame in stream]
+        stream.close()
+        self.assertEqual(len(frames), 10)
+        self.assertTrue(np.allclose(frames[-1],
+                                    rescale(self.mono[4410 - 2048:4410])))
+
+
 # clean up
 def teardown():
     os.unlink(tmp_file)
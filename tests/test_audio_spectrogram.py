@@ -768,25 +768,25 @@ class TestSemitoneBandpassSpectrogramClass(unittest.TestCase):
         self.assertTrue(self.sbs_50.shape == (141, 88))
         self.assertTrue(self.sbs_50.num_bins == 88)
         self.assertTrue(np.allclose(self.sbs_50[120:122, 50:55],
-                                    [[0.00056659, 0.00274373, 0.00037994,
-                                      0.00031497, 0.0063823],
-                                     [0.00032294, 0.00285728, 0.00023723,
-                                      0.00010553, 0.0069074]]))
+                                    [[0.00056735, 0.00274288, 0.00037917,
+                                      0.00031481, 0.00638948],
+                                     [0.00032375, 0.0028548, 0.00023689,
+                                      0.0001057, 0.00691763]]))
         self.assertTrue(np.allclose(self.sbs_50[:10, 0],
-                                    [0.00108844, 0.0020613, 0.00187792,
-                                     0.00173228, 0.00163516, 0.00149813,
-                                     0.0013027, 0.0010594, 0.00079916,
-                                     0.00060871], atol=1e-04))
+                                    [0.00113682, 0.00215891, 0.00197865,
+                                     0.00183353, 0.00173874, 0.00159853,
+                                     0.0013961, 0.00114121, 0.00086833,
+                                     0.00066924], atol=1e-04))
         self.assertTrue(np.allclose(self.sbs_50[:10, 29],
-                                    [0.05326259, 0.10912816, 0.11616101,
-                                     0.11595627, 0.11979639, 0.12206492,
-                                     0.12836982, 0.12495992, 0.11759637,
-                                     0.10559082]))
+                                    [0.05416837, 0.11087978, 0.11783919,
+                                     0.11743737, 0.12101605, 0.12295415,
+                                     0.12894707, 0.12518058, 0.11753077,
+                                     0.10535375]))
         # test fps = 10
         self.assertTrue(self.sbs_10.fps == 10)
         self.assertTrue(self.sbs_10.shape == (29, 88))
-        sbs_10 = [[0.01951193, 0.01638364, 0.00384092, 0.00732366, 0.10310112],
-                  [0.14484727, 0.032042, 0.00719009, 0.02043642, 0.06407038]]
+        sbs_10 = [[0.01950044, 0.01637579, 0.0038439, 0.00732891, 0.1032049],
+                  [0.14475508, 0.03203313, 0.00719312, 0.02045694, 0.06414096]]
         self.assertTrue(np.allclose(self.sbs_10[10:12, 50:55], sbs_10))
         # test computing SemitoneBandpassSpectrogram from signal
         self.assertTrue(self.sbs_10_from_signal.shape == (29, 88))
@@ -819,4 +819,20 @@ class TestSemitoneBandpassSpectrogramClass(unittest.TestCase):
                                     [[0.01951726, 0.01638535, 0.00384128,
                                       0.00732471, 0.10306561],
                                      [0.14487972, 0.03204085, 0.00718818,
-                                      0.02043327, 0.06404668]], rtol=1e-03))
+                                      0.02043327, 0.06404668]], rtol=2e-03))
+
+
+class TestFrameEnergyFunction(unittest.TestCase):
+
+    def test_values(self):
+        from madmom.audio.spectrogram import _frame_energy
+        from madmom.audio.signal import FramedSignal, energy
+        signal = np.random.RandomState(0).randn(5000)
+        # fractional hop sizes and frames exceeding the signal
+        for frame_size, hop_size in [(35, 17.64), (176, 88.2), (882, 441)]:
+            num_frames = int(np.ceil(len(signal) / hop_size)) + 5
+            frames = FramedSignal(signal, frame_size=frame_size,
+                                  hop_size=hop_size, num_frames=num_frames)
+            self.assertTrue(np.allclose(
+                _frame_energy(signal, frame_size, hop_size, num_frames),
+                energy(frames)))
@@ -633,6 +633,50 @@ class TestOnsetDetectorProgram(unittest.TestCase):
         result = np.loadtxt(tmp_result)
         self.assertTrue(np.allclose(result, self.result, atol=1e-5))
 
+    def test_serve(self):
+        import socket
+        import subprocess
+        import time
+        from madmom.audio.signal import Signal
+        address = tempfile.mktemp(suffix='.sock')
+        server = subprocess.Popen([sys.executable, self.bin, 'serve',
+                                   address, '-j', '2'])
+        try:
+            while not os.path.exists(address):
+                time.sleep(0.1)
+
+            def request(data):
+                client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                client.connect(address)
+                client.sendall(data)
+                client.shutdown(socket.SHUT_WR)
+                response = b''
+                while True:
+                    data = client.recv(4096)
+                    if not data:
+                        break
+                    response += data
+                client.close()
+                return response.decode()
+
+            # input file name
+            result = np.loadtxt(StringIO(request(sample_file.encode() +
+                                                 b'\n')))
+            self.assertTrue(np.allclose(result, self.result, atol=1e-5))
+            # raw PCM samples
+            signal = Signal(sample_file)
+            header = 'pcm %d 1 int16\n' % signal.sample_rate
+            result = np.loadtxt(StringIO(request(header.encode() +
+                                                 signal.tobytes())))
+            self.assertTrue(np.allclose(result, self.result, atol=1e-5))
+            # errors
+            self.assertTrue(request(b'not_existing.wav\n').startswith(
+                'ERROR: '))
+        finally:
+            server.terminate()
+            server.wait()
+        self.assertFalse(os.path.exists(address))
+
 
 class TestOnsetDetectorLLProgram(unittest.TestCase):
     def setUp(self):
@@ -10,8 +10,10 @@ from __future__ import absolute_import, division, print_function
 import unittest
 import math
 from collections import OrderedDict
+from os.path import join as pj
 
 from madmom.evaluation import *
+from . import ANNOTATIONS_PATH, DETECTIONS_PATH
 
 
 DETECTIONS = np.asarray([0.99, 1.45, 2.01, 2.015, 3.1, 8.1])
@@ -455,3 +457,79 @@ class TestMeanEvaluationClass(unittest.TestCase):
         self.assertEqual(e.fmeasure, f)
         self.assertEqual(e.accuracy, (1 + (5. + 4) / (5 + 3 + 4 + 1)) / 2.)
         self.assertEqual(len(e), 2)
+
+
+class TestEvaluationSummaryClass(unittest.TestCase):
+
+    def test_types(self):
+        e = EvaluationSummary(OnsetEvaluation(DETECTIONS, ANNOTATIONS))
+        self.assertIsInstance(e, EvaluationMixin)
+        self.assertIsInstance(e.num_tp, int)
+        self.assertIsInstance(e.precision, float)
+        self.assertIsInstance(e.mean_error, float)
+        self.assertIsInstance(e.metrics, dict)
+        self.assertFalse(hasattr(e, 'tp'))
+        self.assertFalse(hasattr(e, 'errors'))
+
+    def test_results(self):
+        e = OnsetEvaluation(DETECTIONS, ANNOTATIONS, name='name')
+        s = EvaluationSummary(e)
+        self.assertEqual(s.name, 'name')
+        self.assertEqual(s.num_errors, len(e.errors))
+        for name, value in s.metrics.items():
+            self.assertEqual(value, getattr(e, name))
+        # beat evaluation
+        e = BeatEvaluation(DETECTIONS, ANNOTATIONS)
+        s = EvaluationSummary(e)
+        self.assertTrue(np.allclose(s.error_histogram, e.error_histogram))
+        self.assertEqual(s.metrics, e.metrics)
+        # sum and mean evaluations of summaries
+        evals = [OnsetEvaluation(DETECTIONS, ANNOTATIONS),
+                 OnsetEvaluation(DETECTIONS[:3], ANNOTATIONS),
+                 OnsetEvaluation([], ANNOTATIONS)]
+        summaries = [EvaluationSummary(e) for e in evals]
+        for cls in (OnsetSumEvaluation, OnsetMeanEvaluation):
+            e = cls(evals)
+            s = cls(summaries)
+            self.assertEqual(s.tostring(), e.tostring())
+        e = BeatMeanEvaluation([BeatEvaluation(DETECTIONS, ANNOTATIONS)])
+        s = BeatMeanEvaluation([EvaluationSummary(
+            BeatEvaluation(DETECTIONS, ANNOTATIONS))])
+        self.assertEqual(s.tostring(), e.tostring())
+
+
+class TestCombineErrorsFunction(unittest.TestCase):
+
+    def test_results(self):
+        self.assertTrue(np.all(np.isnan(combine_errors([]))))
+        evals = [OnsetEvaluation(DETECTIONS, ANNOTATIONS),
+                 OnsetEvaluation([], ANNOTATIONS),
+                 OnsetEvaluation(DETECTIONS[:3] + 0.01, ANNOTATIONS)]
+        errors = np.concatenate([e.errors for e in evals])
+        mean, std = combine_errors(evals)
+        self.assertAlmostEqual(mean, np.mean(errors))
+        self.assertAlmostEqual(std, np.std(errors))
+        summaries = [EvaluationSummary(e) for e in evals]
+        self.assertTrue(np.allclose(combine_errors(summaries), (mean, std)))
+
+
+class TestEvaluateFilesFunction(unittest.TestCase):
+
+    def test_results(self):
+        files = [(pj(DETECTIONS_PATH, 'sample.onset_detector.txt'),
+                  pj(ANNOTATIONS_PATH, 'sample.onsets')),
+                 (pj(DETECTIONS_PATH, 'sample.super_flux.txt'),
+                  pj(ANNOTATIONS_PATH, 'sample.onsets')),
+                 (None, pj(ANNOTATIONS_PATH, 'sample.onsets'))]
+        results = list(evaluate_files(files, OnsetEvaluation, window=0.01))
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0], OnsetEvaluation)
+        self.assertEqual(results[0].name, 'sample.onsets')
+        self.assertEqual(results[2].num_tp, 0)
+        # summaries computed in parallel
+        summaries = list(evaluate_files(files, OnsetEvaluation, num_workers=2,
+                                        summarise=True, window=0.01))
+        self.assertEqual(len(summaries), 3)
+        for e, s in zip(results, summaries):
+            self.assertIsInstance(s, EvaluationSummary)
+            self.assertEqual(s.metrics, EvaluationSummary(e).metrics)
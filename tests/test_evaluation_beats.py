@@ -12,6 +12,7 @@ import math
 from os.path import join as pj
 
 from . import ANNOTATIONS_PATH, DETECTIONS_PATH
+from madmom.evaluation import find_closest_matches, calc_absolute_errors
 from madmom.evaluation.beats import *
 # noinspection PyProtectedMember
 from madmom.evaluation.beats import (_histogram_bins, _error_histogram,
@@ -253,6 +254,61 @@ class TestCalcRelativeErrorsFunction(unittest.TestCase):
         # TODO: same tests with matches given
 
 
+class TestBeatContextClass(unittest.TestCase):
+
+    def test_types(self):
+        context = BeatContext([1, 2, 3], ANNOTATIONS)
+        self.assertIsInstance(context.detections, np.ndarray)
+        self.assertTrue(context.detections.dtype == np.float)
+        self.assertIsInstance(context.reverse, BeatContext)
+        self.assertIsInstance(context.variation(DOUBLE_ANNOTATIONS),
+                              BeatContext)
+
+    def test_errors(self):
+        with self.assertRaises(BeatIntervalError):
+            BeatContext(DETECTIONS, [1.]).relative_errors
+        with self.assertRaises(BeatIntervalError):
+            BeatContext([1.], ANNOTATIONS).detection_intervals
+
+    def test_values(self):
+        context = BeatContext(DETECTIONS, ANNOTATIONS)
+        self.assertTrue(np.allclose(
+            context.matches, find_closest_matches(DETECTIONS, ANNOTATIONS)))
+        self.assertTrue(np.allclose(
+            context.absolute_errors,
+            calc_absolute_errors(DETECTIONS, ANNOTATIONS)))
+        self.assertTrue(np.allclose(
+            context.closest_intervals,
+            find_closest_intervals(DETECTIONS, ANNOTATIONS)))
+        self.assertTrue(np.allclose(
+            context.relative_errors,
+            calc_relative_errors(DETECTIONS, ANNOTATIONS)))
+        self.assertTrue(np.allclose(context.detection_intervals,
+                                    calc_intervals(DETECTIONS)))
+        self.assertTrue(np.allclose(context.annotation_intervals,
+                                    calc_intervals(ANNOTATIONS)))
+        # values are computed only once
+        self.assertIs(context.relative_errors, context.relative_errors)
+        # reverse context
+        reverse = context.reverse
+        self.assertIs(reverse.reverse, context)
+        self.assertIs(reverse.detection_intervals,
+                      context.annotation_intervals)
+        self.assertTrue(np.allclose(
+            reverse.relative_errors,
+            calc_relative_errors(ANNOTATIONS, DETECTIONS)))
+        # variation of the annotations
+        variation = context.variation(OFFBEAT_ANNOTATIONS)
+        self.assertIs(variation.detection_intervals,
+                      context.detection_intervals)
+        self.assertTrue(np.allclose(
+            variation.absolute_errors,
+            calc_absolute_errors(DETECTIONS, OFFBEAT_ANNOTATIONS)))
+        # empty detections
+        context = BeatContext([], ANNOTATIONS)
+        self.assertTrue(np.allclose(context.relative_errors, []))
+
+
 class TestBeatConstantsClass(unittest.TestCase):
 
     def test_types(self):
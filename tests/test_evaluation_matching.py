@@ -0,0 +1,41 @@
+# encoding: utf-8
+# pylint: skip-file
+"""
+This file contains tests for the madmom.evaluation.matching module.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+from madmom.evaluation.matching import *
+
+DETECTIONS = np.asarray([0.99999999, 1.02999999, 1.45, 2.01, 2.02, 2.5,
+                         3.025000001])
+ANNOTATIONS = np.asarray([1, 1.02, 1.5, 2.0, 2.03, 2.05, 2.5, 3])
+
+
+class TestMatchEventsFunction(unittest.TestCase):
+
+    def test_types(self):
+        matches = match_events(DETECTIONS, ANNOTATIONS, 0.025)
+        self.assertIsInstance(matches, np.ndarray)
+        self.assertEqual(matches.dtype, np.intp)
+        self.assertEqual(matches.shape, (7, ))
+        self.assertEqual(match_events([], [], 0.025).shape, (0, ))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            match_events(DETECTIONS, ANNOTATIONS, 0.025, [0, 1])
+
+    def test_values(self):
+        matches = match_events(DETECTIONS, ANNOTATIONS, 0.025)
+        self.assertTrue(np.allclose(matches, [0, 1, -1, 3, 4, 6, -1]))
+        matches = match_events(DETECTIONS, ANNOTATIONS, 0.04)
+        self.assertTrue(np.allclose(matches, [0, 1, -1, 3, 4, 6, 7]))
+        self.assertTrue(np.allclose(match_events(DETECTIONS, [], 0.025), -1))
+        # groups
+        matches = match_events([1, 2, 1, 2], [1, 2, 2.01], 0.025,
+                               [0, 0, 1, 1], [0, 1, 1])
+        self.assertTrue(np.allclose(matches, [0, -1, -1, 1]))
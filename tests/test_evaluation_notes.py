@@ -151,6 +151,10 @@ class TestNoteOnsetEvaluationFunction(unittest.TestCase):
         self.assertTrue(np.allclose(errors, [[0, 72], [-0.029, 60],
                                              [0.014, 77], [-0.001, 75],
                                              [0, 43]]))
+        # unsorted detections give the same results
+        result = note_onset_evaluation(DETECTIONS[::-1], ANNOTATIONS, 0.03)
+        self.assertTrue(np.allclose(result[0], tp))
+        self.assertTrue(np.allclose(result[4], errors))
 
 
 # test evaluation class
@@ -77,6 +77,38 @@ class TestOnsetEvaluationFunction(unittest.TestCase):
                                              -0.01, 0, 0.025]))
 
 
+class TestOnsetEvaluationBatchFunction(unittest.TestCase):
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            onset_evaluation_batch([DETECTIONS], [])
+        with self.assertRaises(ValueError):
+            onset_evaluation_batch([DETECTIONS], [ANNOTATIONS], window=0)
+
+    def test_values(self):
+        self.assertEqual(onset_evaluation_batch([], []), [])
+        detections = [DETECTIONS, [], DETECTIONS[::-1], [1.5], DETECTIONS]
+        annotations = [ANNOTATIONS, [1], ANNOTATIONS, [], ANNOTATIONS + 0.01]
+        results = onset_evaluation_batch(detections, annotations)
+        self.assertEqual(len(results), 5)
+        # must be the same as evaluating the pieces individually
+        for result, det, ann in zip(results, detections, annotations):
+            for batch, single in zip(result, onset_evaluation(det, ann)):
+                self.assertEqual(batch.shape, single.shape)
+                self.assertTrue(np.allclose(batch, single))
+        tp, fp, tn, fn, errors = results[2]
+        self.assertTrue(np.allclose(tp, [0.999999, 1.029999, 2.01, 2.02, 2.5]))
+        self.assertTrue(np.allclose(fn, [1.5, 2.05, 3.0]))
+        # no annotations at all, but some detections
+        detections = [DETECTIONS, [], [1.5]]
+        annotations = [[], [], []]
+        results = onset_evaluation_batch(detections, annotations)
+        for result, det, ann in zip(results, detections, annotations):
+            for batch, single in zip(result, onset_evaluation(det, ann)):
+                self.assertEqual(batch.shape, single.shape)
+                self.assertTrue(np.allclose(batch, single))
+
+
 # test evaluation class
 class TestOnsetEvaluationClass(unittest.TestCase):
 
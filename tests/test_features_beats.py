@@ -78,6 +78,12 @@ class TestCRFBeatDetectionProcessorClass(unittest.TestCase):
         beats = self.processor(sample_beat_act)
         self.assertTrue(np.allclose(beats, [0.09, 0.79, 1.49]))
 
+    def test_process_threads(self):
+        processor = CRFBeatDetectionProcessor(fps=sample_beat_act.fps,
+                                              num_threads=3)
+        beats = processor(sample_beat_act)
+        self.assertTrue(np.allclose(beats, [0.09, 0.79, 1.49]))
+
 
 class TestDBNBeatTrackingProcessorClass(unittest.TestCase):
 
@@ -423,3 +423,41 @@ class TestRNNBeatTrackingObservationModelClass(unittest.TestCase):
                                     [[-np.inf, 0], [-1.20397281, -2.30258508],
                                      [-1.10866262, -4.60517021],
                                      [-1.09861229, -np.inf]]))
+
+
+class TestGMMPatternTrackingObservationModelClass(unittest.TestCase):
+
+    def setUp(self):
+        import pickle
+        from madmom.models import PATTERNS_BALLROOM
+        self.gmms = []
+        state_spaces = []
+        for pattern_file in PATTERNS_BALLROOM:
+            with open(pattern_file, 'rb') as f:
+                try:
+                    pattern = pickle.load(f, encoding='latin1')
+                except TypeError:
+                    pattern = pickle.load(f)
+            self.gmms.append(pattern['gmms'])
+            state_spaces.append(BarStateSpace(pattern['num_beats'], 5, 10))
+        self.om = GMMPatternTrackingObservationModel(
+            self.gmms, MultiPatternStateSpace(state_spaces))
+        self.obs = np.random.RandomState(0).rand(20, 2)
+
+    def test_types(self):
+        self.assertIsInstance(self.om.pointers, np.ndarray)
+        self.assertIsInstance(self.om.log_densities(self.obs), np.ndarray)
+        self.assertTrue(self.om.pointers.dtype == np.uint32)
+        self.assertTrue(self.om.log_densities(self.obs).dtype == np.float)
+
+    def test_values(self):
+        num_gmms = sum([len(gmms) for gmms in self.gmms])
+        log_densities = self.om.log_densities(self.obs)
+        self.assertTrue(log_densities.shape == (20, num_gmms))
+        # must be the same as scoring the GMMs individually
+        scores = np.vstack([gmm.score(self.obs) for gmms in self.gmms
+                            for gmm in gmms]).T
+        self.assertTrue(np.allclose(log_densities, scores))
+        # empty observations
+        self.assertTrue(self.om.log_densities(np.empty((0, 2))).shape ==
+                        (0, num_gmms))
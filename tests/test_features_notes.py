@@ -76,3 +76,28 @@ class TestRNNOnsetProcessorClass(unittest.TestCase):
     def test_process(self):
         act = self.processor(sample_file)
         self.assertTrue(np.allclose(act, sample_act, atol=1e-6))
+
+
+class TestNotePeakPickingProcessorClass(unittest.TestCase):
+
+    def setUp(self):
+        self.processor = NotePeakPickingProcessor(
+            threshold=0.35, pre_max=0.01, post_max=0.01, fps=sample_act.fps)
+        self.online_processor = NotePeakPickingProcessor(
+            threshold=0.35, pre_max=0.01, online=True, fps=sample_act.fps)
+        self.result = [[0.14, 72], [1.56, 41], [2.52, 77], [3.37, 75]]
+
+    def test_process(self):
+        notes = self.processor(sample_act)
+        self.assertTrue(np.allclose(notes, self.result))
+
+    def test_process_online(self):
+        # process everything at once
+        notes = self.online_processor(sample_act)
+        self.assertTrue(np.allclose(notes, self.result))
+        # process frame by frame
+        self.online_processor.reset()
+        notes = np.vstack([self.online_processor(np.atleast_2d(f),
+                                                 reset=False)
+                           for f in sample_act])
+        self.assertTrue(np.allclose(notes, self.result))
@@ -254,6 +254,64 @@ class TestPeakPickingFunction(unittest.TestCase):
         self.assertTrue(len(onsets) == 24)
 
 
+class TestStreamingPeakPickerClass(unittest.TestCase):
+
+    def _stream(self, processor, activations, chunk_size):
+        peaks = [processor(activations[i:i + chunk_size])
+                 for i in range(0, len(activations), chunk_size)]
+        if activations.ndim == 1:
+            return np.hstack(peaks)
+        return (np.hstack([p[0] for p in peaks]),
+                np.hstack([p[1] for p in peaks]))
+
+    def test_values(self):
+        for timings in [(0, 0, 1, 1), (30, 0, 2, 10), (3, 2, 0, 0),
+                        (10, 0, 5, 0)]:
+            pre_avg, post_avg, pre_max, post_max = timings
+            processor = StreamingPeakPicker(1.1, *timings)
+            self.assertEqual(processor.lookahead, post_avg + post_max)
+            # the last frames are not reported (missing future context)
+            length = len(sample_superflux_act) - processor.lookahead
+            onsets = peak_picking(sample_superflux_act, 1.1, None, *timings)
+            onsets = onsets[onsets < length]
+            for chunk_size in [1, 7, len(sample_superflux_act)]:
+                processor.reset()
+                result = self._stream(processor, sample_superflux_act,
+                                      chunk_size)
+                self.assertTrue(np.array_equal(result, onsets))
+
+    def test_values_2d(self):
+        act = np.random.RandomState(1).rand(300, 5)
+        processor = StreamingPeakPicker(0.2, pre_avg=4, pre_max=3,
+                                        post_max=0)
+        frames, bins = peak_picking(act, 0.2, pre_avg=4, pre_max=3,
+                                    post_max=0)
+        for chunk_size in [1, 11]:
+            processor.reset()
+            result = self._stream(processor, act, chunk_size)
+            self.assertTrue(np.array_equal(result[0], frames))
+            self.assertTrue(np.array_equal(result[1], bins))
+
+    def test_empty_chunks(self):
+        processor = StreamingPeakPicker(1.1, pre_avg=30, pre_max=2,
+                                        post_max=10)
+        result = self._stream(processor, sample_superflux_act, 50)
+        processor.reset()
+        peaks = []
+        for i in range(0, len(sample_superflux_act), 50):
+            peaks.append(processor(sample_superflux_act[i:i + 50]))
+            peaks.append(processor(np.zeros(0)))
+        self.assertTrue(np.array_equal(np.hstack(peaks), result))
+        # 2D activations
+        frames, bins = processor(np.zeros((0, 3)))
+        self.assertEqual(len(frames), 0)
+        self.assertEqual(len(bins), 0)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            StreamingPeakPicker(0.5)(np.zeros((2, 2, 2)))
+
+
 class TestOnsetPeakPickingProcessorClass(unittest.TestCase):
 
     def setUp(self):
@@ -291,6 +349,21 @@ class TestOnsetPeakPickingProcessorClass(unittest.TestCase):
             [self.online_processor(np.atleast_1d(f), reset=False)
              for f in sample_rnn_act])
         self.assertTrue(np.allclose(onsets_2, self.sample_rnn_result))
+        # process in chunks with a maximum filter
+        self.online_processor.pre_max = 0.03
+        onsets_3 = self.online_processor(sample_rnn_act)
+        onsets_4 = np.hstack(
+            [self.online_processor(sample_rnn_act[i:i + 10], reset=i == 0)
+             for i in range(0, len(sample_rnn_act), 10)])
+        self.assertTrue(np.allclose(onsets_3, onsets_4))
+        self.assertTrue(np.allclose(onsets_3, self.sample_rnn_result))
+        # empty chunks in between
+        onsets_5 = []
+        for i in range(0, len(sample_rnn_act), 10):
+            onsets_5.append(self.online_processor(sample_rnn_act[i:i + 10],
+                                                  reset=i == 0))
+            onsets_5.append(self.online_processor(np.zeros(0), reset=False))
+        self.assertTrue(np.allclose(np.hstack(onsets_5), onsets_3))
 
     def test_delay(self):
         self.processor.delay = 1
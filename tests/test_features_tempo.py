@@ -32,6 +32,42 @@ class TestIntervalHistogramAcfFunction(unittest.TestCase):
                                                   0.17694432, 0.24372872]))
         self.assertTrue(np.allclose(hist[1], np.arange(24, 151)))
 
+    def test_values_fft(self):
+        direct = interval_histogram_acf(act, min_tau=24, max_tau=150)
+        hist = interval_histogram_acf(act, min_tau=24, max_tau=150,
+                                      method='fft')
+        self.assertTrue(np.allclose(hist[0], direct[0]))
+        self.assertTrue(np.allclose(hist[1], direct[1]))
+        # block-wise processing
+        hist = interval_histogram_acf(act, min_tau=24, max_tau=150,
+                                      method='fft', block_size=50)
+        self.assertTrue(np.allclose(hist[0], direct[0]))
+        # all possible delays
+        direct = interval_histogram_acf(act)
+        hist = interval_histogram_acf(act, method='fft', block_size=64)
+        self.assertTrue(np.allclose(hist[0], direct[0]))
+
+    def test_values_2d(self):
+        act_2d = np.vstack((act, act[::-1])).T
+        for method in ('direct', 'fft'):
+            hist = interval_histogram_acf(act_2d, min_tau=24, max_tau=150,
+                                          method=method)
+            self.assertTrue(hist[0].shape == (2, 127))
+            self.assertTrue(np.allclose(hist[0][0, :6], [0.10034907,
+                                                         0.10061631,
+                                                         0.11078519,
+                                                         0.13461014,
+                                                         0.17694432,
+                                                         0.24372872]))
+            # reversing the activations does not change the ACF
+            self.assertTrue(np.allclose(hist[0][1], hist[0][0]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            interval_histogram_acf(act, method='xyz')
+        with self.assertRaises(NotImplementedError):
+            interval_histogram_acf(np.zeros((2, 2, 2)))
+
 
 class TestIntervalHistogramCombFunction(unittest.TestCase):
 
@@ -114,6 +150,33 @@ class TestTempoEstimationProcessorClass(unittest.TestCase):
         tempi = self.processor(act)
         self.assertTrue(np.allclose(tempi, COMB_TEMPI, atol=0.01))
 
+    def test_process_online(self):
+        for method in ('comb', 'acf'):
+            offline = TempoEstimationProcessor(method=method, act_smooth=0,
+                                               fps=fps)
+            processor = TempoEstimationProcessor(method=method, act_smooth=0,
+                                                 online=True, hist_decay=None,
+                                                 fps=fps)
+            self.assertTrue(processor.online)
+            # frame by frame processing, without forgetting, the histogram
+            # must be the same as computed offline
+            tempi = processor.process(act[:1], reset=True)
+            for a in act[1:]:
+                tempi = processor.process(a, reset=False)
+            self.assertTrue(np.allclose(
+                processor._histogram, offline.interval_histogram(act)[0]))
+            self.assertTrue(np.allclose(tempi, offline(act)))
+            # process everything at once
+            self.assertTrue(np.allclose(processor(act), tempi))
+        # online processing with default settings
+        processor = TempoEstimationProcessor(online=True, fps=fps)
+        tempi = processor(act)
+        self.assertTrue(np.allclose(tempi[:2], [[176.47, 0.487],
+                                                [117.65, 0.181]], atol=0.01))
+        # dbn method is not supported
+        with self.assertRaises(ValueError):
+            TempoEstimationProcessor(method='dbn', online=True, fps=fps)
+
 
 class TestWriteTempoFunction(unittest.TestCase):
 
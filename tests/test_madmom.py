@@ -0,0 +1,41 @@
+# encoding: utf-8
+# pylint: skip-file
+"""
+This file contains tests for the madmom package.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import subprocess
+import sys
+import unittest
+
+import madmom
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import(self):
+        # importing madmom must not import any subpackage
+        code = 'import sys, madmom; print(sorted(m for m in sys.modules if ' \
+               'm.startswith("madmom") or m in ("pkg_resources", "doctest")))'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().strip(), "['madmom']")
+
+    def test_version(self):
+        # the version is read from the module generated by setup.py
+        code = 'import sys, madmom; madmom.__version__; ' \
+               'print("pkg_resources" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().strip(), 'False')
+        from madmom.version import version
+        self.assertEqual(madmom.__version__, version)
+
+    def test_attributes(self):
+        for name in madmom.SUBPACKAGES:
+            self.assertIn(name, dir(madmom))
+            self.assertEqual(getattr(madmom, name).__name__, 'madmom.' + name)
+        self.assertIsInstance(madmom.__version__, str)
+        with self.assertRaises(AttributeError):
+            madmom.not_existing
@@ -54,3 +54,17 @@ class TestConditionalRandomFieldClass(unittest.TestCase):
 
         state_seq = self.crf.process(OBS_SEQ_2)
         self.assertTrue((state_seq == correct_state_seq2).all())
+
+        # decode multiple sequences at once
+        state_seqs = self.crf.process([OBS_SEQ_1, OBS_SEQ_2, OBS_SEQ_1[:0]])
+        self.assertIsInstance(state_seqs, list)
+        self.assertTrue(len(state_seqs) == 3)
+        self.assertTrue((state_seqs[0] == correct_state_seq1).all())
+        self.assertTrue((state_seqs[1] == correct_state_seq2).all())
+        self.assertTrue(len(state_seqs[2]) == 0)
+        state_seqs = self.crf.process(np.array([OBS_SEQ_2, OBS_SEQ_1]))
+        self.assertTrue((state_seqs[0] == correct_state_seq2).all())
+        self.assertTrue((state_seqs[1] == correct_state_seq1).all())
+        # a list of lists is a single sequence
+        state_seq = self.crf.process(OBS_SEQ_1.tolist())
+        self.assertTrue((state_seq == correct_state_seq1).all())
@@ -6,15 +6,20 @@ This file contains tests for the madmom.processors module.
 """
 
 from __future__ import absolute_import, division, print_function
+import os
 import tempfile
 import unittest
 import sys
+from os.path import join as pj
 
 from madmom.processors import *
 from madmom.models import *
 from madmom.ml.nn import NeuralNetwork
 
+from . import AUDIO_PATH
+
 tmp_file = tempfile.NamedTemporaryFile(delete=False).name
+sample_file = pj(AUDIO_PATH, 'sample.wav')
 
 
 class TestProcessor(unittest.TestCase):
@@ -26,6 +31,187 @@ class TestProcessor(unittest.TestCase):
             # save to unicode string
             rnn.dump(unicode(tmp_file))
 
+    def test_online_capabilities(self):
+        processor = Processor()
+        self.assertTrue(processor.online_capable)
+        self.assertEqual(processor.latency, 0)
+        self.assertIsNone(processor.required_frame_size)
+        # neural networks
+        self.assertTrue(NeuralNetwork.load(ONSETS_RNN[0]).online_capable)
+        self.assertFalse(NeuralNetwork.load(ONSETS_BRNN[0]).online_capable)
+        self.assertFalse(NeuralNetwork.load(ONSETS_CNN[0]).online_capable)
+
+
+class TestSequentialProcessor(unittest.TestCase):
+
+    def test_online_capabilities(self):
+        from madmom.audio.signal import FramedSignalProcessor
+        from madmom.features.onsets import OnsetPeakPickingProcessor
+        frames = ParallelProcessor([FramedSignalProcessor(frame_size=1024),
+                                    FramedSignalProcessor(frame_size=2048)])
+        peaks = OnsetPeakPickingProcessor(fps=100, post_avg=0.02,
+                                          post_max=0.03)
+        processor = SequentialProcessor([frames, np.hstack, peaks, peaks])
+        self.assertFalse(processor.online_capable)
+        self.assertTrue(np.allclose(processor.latency, 0.1))
+        self.assertEqual(processor.required_frame_size, 2048)
+        # parallel processors
+        processor = ParallelProcessor([peaks, SequentialProcessor([peaks])])
+        self.assertTrue(np.allclose(processor.latency, 0.05))
+        # online peak-picking
+        peaks = OnsetPeakPickingProcessor(fps=100, online=True)
+        processor = IOProcessor([frames, peaks], print)
+        self.assertTrue(processor.online_capable)
+        self.assertEqual(processor.latency, 0)
+        self.assertEqual(processor.required_frame_size, 2048)
+
+    def test_process_online(self):
+        from madmom.features.onsets import OnsetPeakPickingProcessor
+        processor = IOProcessor(OnsetPeakPickingProcessor(), print)
+        with self.assertRaises(ValueError):
+            process_online(processor, None, None)
+
+    def test_process_online_source(self):
+        from madmom.audio.signal import RawFileSource
+        np.arange(1000, dtype=np.int16).tofile(tmp_file)
+        frames = []
+        processor = IOProcessor(np.max, lambda data, output: output.append(
+            data))
+        process_online(processor, RawFileSource(tmp_file, 100, speed=None),
+                       frames, sample_rate=100, frame_size=20, hop_size=10)
+        # integer samples are rescaled
+        self.assertTrue(np.allclose(frames, np.arange(9, 1000, 10) / 32767.))
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        from madmom.audio.signal import SignalProcessor
+        self.processor = SequentialProcessor(
+            [SignalProcessor(), ParallelProcessor([[np.diff], [np.diff]]),
+             np.hstack])
+
+    def test_records(self):
+        with Profiler() as profiler:
+            result = self.processor(sample_file)
+        import madmom.processors
+        self.assertIsNone(madmom.processors._profiler)
+        self.assertEqual(result.shape, (246960, ))
+        paths = [r['path'] for r in profiler.records]
+        self.assertEqual(paths, [
+            'SequentialProcessor/SignalProcessor',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor/diff',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor#2/'
+            'diff',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor#2',
+            'SequentialProcessor/ParallelProcessor',
+            'SequentialProcessor/hstack', 'SequentialProcessor'])
+        self.assertEqual([r['depth'] for r in profiler.records],
+                         [1, 3, 2, 3, 2, 1, 1, 0])
+        record = profiler.records[5]
+        self.assertEqual(record['input_shape'], (123481, ))
+        self.assertEqual(record['output_shape'], [(123480, ), (123480, )])
+        self.assertTrue(record['wall'] >= 0)
+        self.assertTrue(record['cpu'] >= 0)
+        if sys.version_info >= (3, 4):
+            # parents allocate at least as much memory as their children
+            self.assertTrue(record['peak_memory'] >= 123480 * 2 * 2)
+            self.assertTrue(profiler.records[-1]['peak_memory'] >=
+                            record['peak_memory'])
+
+    def test_summary(self):
+        with Profiler(memory=False) as profiler:
+            self.processor(sample_file)
+            self.processor(sample_file)
+        summary = profiler.summary()
+        self.assertEqual([s['path'] for s in summary], [
+            'SequentialProcessor', 'SequentialProcessor/SignalProcessor',
+            'SequentialProcessor/ParallelProcessor',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor/diff',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor#2',
+            'SequentialProcessor/ParallelProcessor/SequentialProcessor#2/'
+            'diff',
+            'SequentialProcessor/hstack'])
+        self.assertEqual([s['calls'] for s in summary], [2] * 8)
+        self.assertIsNone(summary[0]['peak_memory'])
+        table = profiler.table().splitlines()
+        self.assertEqual(len(table), 9)
+        self.assertTrue(table[0].startswith('processor'))
+        self.assertTrue(table[5].startswith('      diff '))
+        self.assertTrue(table[5].endswith('(123481,) -> (123480,)'))
+
+    def test_trace(self):
+        import json
+        with Profiler(memory=False) as profiler:
+            self.processor(sample_file)
+        profiler.write_trace(tmp_file)
+        with open(tmp_file) as f:
+            trace = json.load(f)
+        events = trace['traceEvents']
+        self.assertEqual(len(events), 8)
+        self.assertEqual(events[-1]['name'], 'SequentialProcessor')
+        self.assertEqual(events[-1]['ph'], 'X')
+        self.assertTrue(events[-1]['ts'] <= events[0]['ts'])
+        self.assertTrue(events[-1]['dur'] >= events[0]['dur'])
+
+    def test_errors(self):
+        def error(data):
+            raise ValueError(data)
+        with self.assertRaises(ValueError):
+            with Profiler() as profiler:
+                SequentialProcessor([error])(0)
+        import madmom.processors
+        self.assertIsNone(madmom.processors._profiler)
+        self.assertEqual(len(profiler.records), 0)
+        with Profiler():
+            with self.assertRaises(RuntimeError):
+                Profiler().start()
+
+
+class TestProcessServer(unittest.TestCase):
+
+    def test_stdin(self):
+        from io import BytesIO
+        from madmom.audio.signal import SignalProcessor
+        processor = IOProcessor([SignalProcessor(), len],
+                                lambda data, output: output.write(
+                                    str(data).encode()))
+        infile = BytesIO(('%s\n\nnot_existing.wav\n%s\n' %
+                          (sample_file, sample_file)).encode())
+        outfile = BytesIO()
+        process_server(processor, infile=infile, outfile=outfile,
+                       num_workers=2)
+        output = outfile.getvalue().decode().split('\n')
+        self.assertEqual(output[0], '123481')
+        self.assertTrue(output[1].startswith('ERROR: '))
+        self.assertEqual(output[2:], ['', '123481', ''])
+
+    def test_address(self):
+        # existing files other than sockets must not be removed
+        with tempfile.NamedTemporaryFile() as f:
+            with self.assertRaises(IOError):
+                process_server(IOProcessor([len], print), address=f.name,
+                               num_workers=1)
+            self.assertTrue(os.path.exists(f.name))
+
+    def test_parse_request(self):
+        from madmom.processors import _parse_request
+        self.assertEqual(_parse_request(b'file.wav\n'), 'file.wav')
+        samples = np.arange(10, dtype=np.int16)
+        signal = _parse_request(b'pcm 100\n' + samples.tobytes())
+        self.assertTrue(np.allclose(signal, samples))
+        self.assertEqual(signal.sample_rate, 100)
+        self.assertEqual(signal.dtype, np.int16)
+        # stereo, float, incomplete samples are ignored
+        samples = np.arange(11, dtype=np.float32)
+        signal = _parse_request(b'pcm 100 2 float32\n' + samples.tobytes())
+        self.assertTrue(np.allclose(signal, [0.5, 2.5, 4.5, 6.5, 8.5]))
+        signal = _parse_request(b'pcm 100 2 float32\n' + samples.tobytes(),
+                                num_channels=2)
+        self.assertEqual(signal.shape, (5, 2))
+
 
 class TestBufferProcessor(unittest.TestCase):
 
@@ -71,6 +257,24 @@ class TestBufferProcessor(unittest.TestCase):
         self.assertTrue(result.shape == (5, 2))
         self.assertTrue(np.allclose(result.ravel(), np.arange(4, 14)))
 
+    def test_ring_buffer(self):
+        buffer = BufferProcessor(5)
+        # the returned buffer is a contiguous view of the backing array
+        for i in range(12):
+            result = buffer(np.arange(i, i + 2))
+            self.assertTrue(result.flags['C_CONTIGUOUS'])
+            self.assertTrue(result.base is not None)
+            self.assertTrue(np.allclose(result[-2:], [i, i + 1]))
+        self.assertTrue(np.allclose(result, [10, 10, 11, 11, 12]))
+        # more data than the buffer can hold
+        result = buffer(np.arange(7))
+        self.assertTrue(np.allclose(result, [2, 3, 4, 5, 6]))
+        # reset the buffer
+        buffer.reset()
+        self.assertTrue(np.allclose(buffer.buffer, 0))
+        buffer.reset(init=np.arange(5))
+        self.assertTrue(np.allclose(buffer(10), [1, 2, 3, 4, 10]))
+
 
 # clean up
 def teardown():
@@ -8,7 +8,7 @@ This file contains test functions for the madmom.utils module.
 from __future__ import absolute_import, division, print_function
 
 import unittest
-from os.path import join as pj
+from os.path import join as pj, basename
 
 from madmom.utils import *
 from . import (DATA_PATH, AUDIO_PATH, ANNOTATIONS_PATH, ACTIVATIONS_PATH,
@@ -225,6 +225,30 @@ class TestMatchFileFunction(unittest.TestCase):
         self.assertEqual(result, match_list)
 
 
+class TestIndexFilesFunction(unittest.TestCase):
+
+    def test_index(self):
+        files = ['file.txt', '/path/file.txt', '/path/file.txt.other']
+        result = index_files(files)
+        self.assertEqual(result, {'file.txt': ['file.txt', '/path/file.txt'],
+                                  'file.txt.other': ['/path/file.txt.other']})
+        result = index_files(files, '.txt')
+        self.assertEqual(result, {'file': ['file.txt', '/path/file.txt']})
+        result = index_files(files, '.other')
+        self.assertEqual(result, {'file.txt': ['/path/file.txt.other']})
+        result = index_files(files, 'other')
+        self.assertEqual(result, {'file.txt.': ['/path/file.txt.other']})
+
+    def test_same_as_match_file(self):
+        files = AUDIO_FILES + ANNOTATION_FILES + DETECTION_FILES
+        for suffix in (None, '*', '.txt', '.onsets', '.beat_tracker.txt'):
+            index = index_files(files, suffix)
+            for f in files:
+                name = basename(strip_suffix(f, '.wav'))
+                self.assertEqual(index.get(name, []),
+                                 match_file(f, files, '.wav', suffix))
+
+
 class TestLoadEventsFunction(unittest.TestCase):
 
     def test_read_events_from_file(self):
@@ -332,6 +356,22 @@ class TestCombineEventsFunction(unittest.TestCase):
         correct = np.asarray([1.02, 1.5, 2.05, 2.5, 3])
         self.assertTrue(np.allclose(comb, correct))
 
+    def test_combine_2d(self):
+        notes = np.asarray([[1, 60], [1.01, 61], [1.02, 60], [1.04, 61],
+                            [1.5, 60], [1.51, 60]])
+        comb = combine_events(notes, 0.03, 'left')
+        self.assertTrue(np.allclose(comb, [[1, 60], [1.01, 61], [1.5, 60]]))
+        comb = combine_events(notes, 0.03, 'right')
+        self.assertTrue(np.allclose(comb, [[1.02, 60], [1.04, 61],
+                                           [1.51, 60]]))
+        comb = combine_events(notes, 0.02, 'mean')
+        self.assertTrue(np.allclose(comb, [[1.01, 60], [1.01, 61],
+                                           [1.04, 61], [1.505, 60]]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            combine_events(EVENTS, 0.03, 'median')
+
 
 class TestQuantizeEventsFunction(unittest.TestCase):
 
@@ -380,6 +420,22 @@ class TestQuantizeEventsFunction(unittest.TestCase):
         correct = [20, 25, 30]
         self.assertTrue(np.allclose(idx, correct))
 
+    def test_2d(self):
+        notes = np.asarray([[1, 2], [1.02, 0], [1.5, 2], [3, 1]])
+        quantized = quantize_events(notes, 10)
+        self.assertEqual(quantized.shape, (31, 3))
+        self.assertTrue(np.allclose(np.nonzero(quantized),
+                                    [[10, 10, 15, 30], [0, 2, 2, 1]]))
+        quantized = quantize_events(notes, 10, length=20)
+        self.assertEqual(quantized.shape, (20, 3))
+        self.assertTrue(np.allclose(np.nonzero(quantized),
+                                    [[10, 10, 15], [0, 2, 2]]))
+
+    def test_input_unchanged(self):
+        events = np.asarray(EVENTS, dtype=np.float)
+        quantize_events(events, 10, shift=1)
+        self.assertTrue(np.allclose(events, EVENTS))
+
 
 class TestSegmentAxisFunction(unittest.TestCase):
 
@@ -0,0 +1,49 @@
+# encoding: utf-8
+# pylint: skip-file
+"""
+This file contains test functions for the madmom.utils.events module.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import numpy as np
+
+from madmom.utils.events import *
+
+
+class TestCombineTimesFunction(unittest.TestCase):
+
+    def test_types(self):
+        idx, times = combine_times(np.zeros(0), 0.1)
+        self.assertEqual(idx.dtype, np.intp)
+        self.assertEqual(times.dtype, np.float)
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(len(times), 0)
+
+    def test_values(self):
+        times = [1, 1.02, 1.5, 2.0, 2.03, 2.05, 2.5, 3]
+        idx, comb = combine_times(times, 0.035, 'left')
+        self.assertTrue(np.allclose(idx, [0, 2, 3, 5, 6, 7]))
+        self.assertTrue(np.allclose(comb, [1, 1.5, 2, 2.05, 2.5, 3]))
+        idx, comb = combine_times(times, 0.035, 'right')
+        self.assertTrue(np.allclose(idx, [1, 2, 5, 6, 7]))
+        self.assertTrue(np.allclose(comb, [1.02, 1.5, 2.05, 2.5, 3]))
+        idx, comb = combine_times(times, 0.0351, 'mean')
+        self.assertTrue(np.allclose(idx, [0, 2, 3, 6, 7]))
+        self.assertTrue(np.allclose(comb, [1.01, 1.5, 2.0325, 2.5, 3]))
+
+    def test_groups(self):
+        times = [1, 1.01, 1.02, 1.5]
+        idx, comb = combine_times(times, 0.025, 'left', groups=[5, 3, 5, 3])
+        self.assertTrue(np.allclose(idx, [0, 1, 3]))
+        self.assertTrue(np.allclose(comb, [1, 1.01, 1.5]))
+        idx, comb = combine_times(times, 0.03, 'right', groups=[5, 3, 5, 3])
+        self.assertTrue(np.allclose(idx, [2, 1, 3]))
+        self.assertTrue(np.allclose(comb, [1.02, 1.01, 1.5]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            combine_times([1, 2], 0.1, 'median')
@@ -58,6 +58,41 @@ class TestEventsClass(unittest.TestCase):
         self.assertTrue(events == [self.e1, self.e3, self.e4, self.e2])
 
 
+class TestMIDITrackClass(unittest.TestCase):
+
+    def setUp(self):
+        self.track = MIDIFile.from_file(
+            pj(ANNOTATIONS_PATH, 'stereo_sample.mid')).tracks[0]
+
+    def test_event_array(self):
+        events = self.track.event_array
+        self.assertEqual(len(events), 18)
+        self.assertEqual(events.dtype, EVENT_DTYPE)
+        self.assertEqual(np.sum(events['status'] == 0x90), 8)
+        # event objects are created from the array
+        self.assertEqual(len(self.track.events), 18)
+        self.assertIsInstance(self.track.events[2], NoteOnEvent)
+        self.assertEqual(self.track.events[2].pitch, events[2]['data1'])
+        self.assertEqual(self.track.events[2].velocity, events[2]['data2'])
+        # and the array is created from the event objects
+        events_ = self.track.event_array
+        data = self.track.event_data
+        self.assertTrue(np.array_equal(events['tick'], events_['tick']))
+        self.assertTrue(np.array_equal(events['data1'], events_['data1']))
+        for e, o, l in zip(self.track.events, events_['offset'],
+                           events_['length']):
+            self.assertEqual(list(data[o:o + l]), e.data)
+
+    def test_altered_events(self):
+        self.track.events = [NoteOnEvent(tick=10, pitch=50, velocity=60),
+                             NoteOffEvent(tick=20, pitch=50)]
+        events = self.track.event_array
+        self.assertEqual(events['tick'].tolist(), [10, 20])
+        self.assertEqual(events['status'].tolist(), [0x90, 0x80])
+        self.assertTrue(np.allclose(MIDIFile(self.track).notes('t'),
+                                    [[10, 50, 10, 60, 0]]))
+
+
 class TestMIDIFileClass(unittest.TestCase):
 
     def test_notes(self):
@@ -103,6 +138,47 @@ class TestMIDIFileClass(unittest.TestCase):
                                      [0.2272725, 67, 0.22632553, 90, 2],
                                      [0.45359803, 64, 0.22821947, 90, 2]]))
 
+    def test_unmatched_note_events(self):
+        track = MIDITrack([NoteOnEvent(tick=0, pitch=60, velocity=50),
+                           NoteOffEvent(tick=10, pitch=62),
+                           NoteOnEvent(tick=10, pitch=60, velocity=70),
+                           NoteOnEvent(tick=20, pitch=60, velocity=0),
+                           NoteOffEvent(tick=30, pitch=60)])
+        import warnings
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            notes = MIDIFile(track).notes(unit='t')
+        self.assertTrue(np.allclose(notes, [[10, 60, 10, 70, 0]]))
+        self.assertEqual(len(w), 2)
+        # unsorted note events
+        track.events[2].tick = 40
+        with self.assertRaises(AssertionError):
+            MIDIFile(track).notes()
+
+    def test_tempo_changes(self):
+        notes = np.loadtxt(pj(ANNOTATIONS_PATH, 'stereo_sample.notes'))
+        midi = MIDIFile.from_notes(notes, tempo=60)
+        tempo = SetTempoEvent(tick=480)
+        tempo.microseconds_per_quarter_note = 500000
+        midi.tracks[0].events.append(tempo)
+        self.assertTrue(np.allclose(midi.tempi(suppress_warnings=True),
+                                    [[0, 1. / 480, 0],
+                                     [480, 0.5 / 480, 1]]))
+        # onsets before the tempo change are not affected
+        notes_ = midi.notes()
+        self.assertTrue(np.allclose(notes_[notes[:, 0] < 1, 0],
+                                    notes[notes[:, 0] < 1, 0], atol=1e-2))
+        self.assertTrue(np.allclose(notes_[notes[:, 0] >= 1, 0],
+                                    0.5 + notes[notes[:, 0] >= 1, 0] / 2,
+                                    atol=1e-2))
+
+    def test_write_read(self):
+        midi = MIDIFile.from_file(pj(ANNOTATIONS_PATH, 'multitrack.mid'))
+        midi.write(tmp_file)
+        midi_ = MIDIFile.from_file(tmp_file)
+        self.assertEqual(midi.data_stream, midi_.data_stream)
+        self.assertTrue(np.allclose(midi.notes(), midi_.notes()))
+
 
 # clean up
 def teardown():
@@ -0,0 +1,104 @@
+# encoding: utf-8
+# pylint: skip-file
+"""
+This file contains test functions for the madmom.utils.midi_parser module.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import numpy as np
+
+from madmom.utils.midi_parser import *
+
+
+class TestParseTrackFunction(unittest.TestCase):
+
+    def test_types(self):
+        events = parse_track(b'')
+        self.assertIsInstance(events, np.ndarray)
+        self.assertEqual(events.dtype, EVENT_DTYPE)
+        self.assertEqual(len(events), 0)
+
+    def test_values(self):
+        data = bytearray([
+            0x00, 0xFF, 0x51, 0x03, 0x07, 0xA1, 0x20,  # tempo
+            0x00, 0x91, 0x3C, 0x40,  # note on, channel 1
+            0x81, 0x00, 0x3E, 0x50,  # running status, delta 128
+            0x10, 0xC2, 0x05,  # program change, channel 2
+            0x00, 0xF0, 0x01, 0x02, 0xF7,  # SysEx
+            0x20, 0x81, 0x3C, 0x00,  # note off, channel 1
+            0x00, 0xFF, 0x2F, 0x00,  # end of track
+        ])
+        events = parse_track(data)
+        self.assertEqual(events['tick'].tolist(),
+                         [0, 0, 128, 144, 144, 176, 176])
+        self.assertEqual(events['status'].tolist(),
+                         [META_EVENT, 0x90, 0x90, 0xC0, SYSEX_EVENT, 0x80,
+                          META_EVENT])
+        self.assertEqual(events['channel'].tolist(), [0, 1, 1, 2, 0, 1, 0])
+        self.assertEqual(events['data1'].tolist(),
+                         [0x51, 0x3C, 0x3E, 0x05, 0, 0x3C, 0x2F])
+        self.assertEqual(events['data2'].tolist(), [0, 0x40, 0x50, 0, 0, 0, 0])
+        self.assertEqual(events['length'].tolist(), [3, 2, 2, 1, 2, 2, 0])
+        # the offsets point to the data of the events
+        self.assertEqual([list(data[o:o + l]) for o, l in
+                          zip(events['offset'], events['length'])],
+                         [[0x07, 0xA1, 0x20], [0x3C, 0x40], [0x3E, 0x50],
+                          [0x05], [0x01, 0x02], [0x3C, 0x00], []])
+
+    def test_incomplete_events(self):
+        events = parse_track(bytearray([0x00, 0x90, 0x3C, 0x40, 0x00, 0x90,
+                                        0x3C]))
+        self.assertEqual(len(events), 1)
+        events = parse_track(bytearray([0x00, 0xFF, 0x51, 0x03, 0x07]))
+        self.assertEqual(len(events), 0)
+
+    def test_errors(self):
+        # running status without any status set
+        with self.assertRaises(AssertionError):
+            parse_track(bytearray([0x00, 0x3C, 0x40]))
+        # unsupported events
+        with self.assertRaises(ValueError):
+            parse_track(bytearray([0x00, 0xF8]))
+
+
+class TestWriteTrackFunction(unittest.TestCase):
+
+    def test_types(self):
+        data = write_track(np.zeros(0, dtype=EVENT_DTYPE), b'')
+        self.assertIsInstance(data, bytearray)
+        self.assertEqual(len(data), 0)
+
+    def test_values(self):
+        data = bytearray([
+            0x00, 0xFF, 0x51, 0x03, 0x07, 0xA1, 0x20,
+            0x00, 0x91, 0x3C, 0x40,
+            0x81, 0x00, 0x3E, 0x50,
+            0x10, 0xC2, 0x05,
+            0x00, 0xF0, 0x01, 0x02, 0xF7,
+            0x20, 0x81, 0x3C, 0x00,
+            0x00, 0xFF, 0x2F, 0x00,
+        ])
+        # writing the parsed events results in the same data
+        self.assertEqual(write_track(parse_track(data), data), data)
+
+    def test_running_status(self):
+        events = np.zeros(3, dtype=EVENT_DTYPE)
+        events['tick'] = [0, 0, 200]
+        events['status'] = 0x90
+        events['channel'] = [0, 0, 1]
+        events['length'] = 2
+        data = write_track(events, b'\x3C\x40')
+        self.assertEqual(data, bytearray([0x00, 0x90, 0x3C, 0x40,
+                                          0x00, 0x3C, 0x40,
+                                          0x81, 0x48, 0x91, 0x3C, 0x40]))
+
+    def test_errors(self):
+        events = np.zeros(1, dtype=EVENT_DTYPE)
+        events['status'] = 0x90
+        events['length'] = 2
+        with self.assertRaises(ValueError):
+            write_track(events, b'\x3C')